@@ -1,16 +1,27 @@
 from dotenv import load_dotenv
 load_dotenv()
 
+import os
 import streamlit as st
 
-from utils.session_state import init_session_state
-from utils.validation import check_message_relevance, detect_update_request, validate_and_save_field, extract_field_value
-from utils.prompts import generate_conclusion, generate_confirmation_prompt, generate_field_prompt, generate_greeting, generate_irrelevant_response, generate_technical_question
+from utils.session_state import get_session, init_session_state
+from utils.checkpoint import save_checkpoint
+from utils.identity import find_previous_application
+from utils.interview_session import ASSISTANT, USER
+from utils.validation import check_message_relevance, validate_and_save_field
+from utils.turn_pipeline import understand_confirmation_reply, understand_field_answer
+from utils.prompts import generate_conclusion, generate_confirmation_prompt, generate_field_prompt, generate_greeting, generate_irrelevant_response, stream_technical_question
 from utils.progress import render_progress_bar
 from utils.sidebar import render_sidebar
 from utils.export import export_candidate_data
+from utils.tracing import turn
+from utils.prompt_registry import interview_scope
+from utils.question_plan import build_question_plan, prefetch_question_plan
+from utils.warmup import start_warmup
+from utils.retention import start_retention_purge
 
-FIELD_ORDER = ["name", "email", "phone", "years_experience", "desired_position", "location", "tech_stack"]
+start_warmup()
+start_retention_purge()
 
 FIELD_PROMPTS = {
     "name": "What's your full name?",
@@ -26,65 +37,102 @@ def get_next_field():
     """
         Get the next field that needs to be collected
     """
-    for field in FIELD_ORDER:
-        if st.session_state.candidate_data[field] is None:
-            return field
-    return None
+    return get_session().candidate.next_missing()
+
+def get_planned_question(question_number):
+    """
+        Serve a question from the session's question plan; returns None if it isn't planned
+    """
+    session = get_session()
+    session.merge_question_plan()
+
+    plan = session.question_plan or {}
+    return plan.get(question_number)
+
+def write_technical_question(header, question_number):
+    """
+        Write a question into the current chat message, streaming it from the LLM when it isn't planned
+    """
+    session = get_session()
+    question = get_planned_question(question_number)
+
+    if question is not None:
+        st.markdown(f"{header}\n\n{question}")
+    else:
+        st.markdown(header)
+        question = st.write_stream(
+            stream_technical_question(session.candidate.tech_stack, question_number)
+        ).strip()
+
+    session.current_question = question
+    session.waiting_for_answer = True
+
+    return f"{header}\n\n{question}"
+
+def handle_previous_application(field):
+    """
+        Close the interview if the email or phone just accepted matches a recent completed interview.
+
+        Returns the reply to show the candidate, or None when there is no
+        earlier interview and collection should carry on.
+    """
+    session = get_session()
+    previous = find_previous_application(field, session.candidate.get(field), exclude=session.interview_id)
+    if previous is None:
+        return None
+
+    # Say nothing about the earlier interview: the email or phone alone doesn't prove who is typing
+    session.stage = 3
+    session.duplicate_of = previous["interview_id"]
+    session.confirmation_pending = False
+    return (
+        "It looks like you've already completed a screening with us recently. "
+        "Our team is reviewing that interview and will reach out to you with next steps, "
+        "so there's no need to go through it again. Thank you for your interest in TalentScout!"
+    )
 
 def transition_to_stage_2():
     """
         Transition from info gathering to technical interview
     """
-    st.session_state.stage = 2
-    st.session_state.question_count = 1
-    st.session_state.confirmation_pending = False
+    session = get_session()
+    session.stage = 2
+    session.question_count = 1
+    session.confirmation_pending = False
     
-    tech_stack = st.session_state.candidate_data["tech_stack"]
-    question = generate_technical_question(tech_stack, 1)
-    
-    st.session_state.current_question = question
-    st.session_state.waiting_for_answer = True
-    
-    intro = f"""Perfect! Let's begin the technical assessment.
-
-**Question 1/5:**
-
-{question}"""
+    tech_stack = session.candidate.tech_stack
+    if os.getenv("QUESTION_STREAMING", "true").lower() == "true":
+        # Stream question 1 now and plan the rest while the candidate reads it
+        session.question_plan = {}
+        session.question_plan_future = prefetch_question_plan(tech_stack, range(2, 6))
+        # Checkpoint the plan as soon as it lands, so a resumed session does not generate it again
+        session.question_plan_future.add_done_callback(lambda _: save_checkpoint(session))
+    else:
+        session.question_plan = build_question_plan(tech_stack)
     
-    return intro
+    return write_technical_question("Perfect! Let's begin the technical assessment.\n\n**Question 1/5:**", 1)
 
 def handle_technical_answer(user_message):
     """
         Handle technical answer and move to next question or conclusion
     """
-
-    current_msg_id = len(st.session_state.messages)
+    session = get_session()
+    session.add_answer(session.question_count, session.current_question, user_message)
     
-    st.session_state.technical_qa.append({
-        "question_number": st.session_state.question_count,
-        "question": st.session_state.current_question,
-        "answer": user_message
-    })
+    if session.question_count >= 5:
+        session.stage = 3
+        session.current_question = None
+        session.waiting_for_answer = False
+        conclusion = generate_conclusion()
+        st.markdown(conclusion)
+        return conclusion
     
-    st.session_state.last_answer_message_id = current_msg_id
+    session.question_count += 1
     
-    if st.session_state.question_count >= 5:
-        st.session_state.stage = 3
-        st.session_state.current_question = None
-        st.session_state.waiting_for_answer = False
-        return generate_conclusion()
-    
-    st.session_state.question_count += 1
-    
-    question = generate_technical_question(
-        st.session_state.candidate_data["tech_stack"],
-        st.session_state.question_count
+    return write_technical_question(
+        f"Thank you for your answer!\n\n**Question {session.question_count}/5:**",
+        session.question_count
     )
-    
-    st.session_state.current_question = question
-    st.session_state.waiting_for_answer = True  
-
-    return f"Thank you for your answer!\n\n**Question {st.session_state.question_count}/5:**\n\n{question}"
 
 
 if "show_privacy_notice" not in st.session_state:
@@ -117,7 +165,7 @@ if st.sidebar.button("View Candidate Information"):
     st.session_state.show_candidate_info = not st.session_state.show_candidate_info
 
 if st.session_state.show_candidate_info:
-    data = st.session_state.candidate_data
+    data = get_session().candidate.to_dict()
     info_collected = any(v is not None for v in data.values())
 
     if info_collected:
@@ -141,6 +189,135 @@ if st.session_state.show_candidate_info:
 
 init_session_state()
 
+def render_messages(messages):
+    """
+        Render transcript entries as chat messages
+    """
+    for role, content in messages:
+        with st.chat_message(role):
+            st.markdown(content)
+
+def handle_user_input(user_input):
+    """
+        Echo the candidate's message, answer it and record both in the transcript
+    """
+    session = get_session()
+    with st.chat_message("user"):
+        st.markdown(user_input)
+
+    session.add_message(USER, user_input)
+
+    with st.chat_message("assistant"):
+        with st.spinner("Thinking..."), turn(stage=session.stage), interview_scope(session.interview_id):
+            context = f"Stage {session.stage}"
+            if session.stage == 1 and not session.confirmation_pending:
+                context += f" - collecting {session.current_field}"
+            elif session.confirmation_pending:
+                context += " - waiting for confirmation or updates"
+
+            field_value = None
+            update_request = None
+            if session.stage == 1 and not session.confirmation_pending:
+                is_relevant, field_value = understand_field_answer(
+                    user_input, session.current_field, context
+                )
+            elif session.stage == 1:
+                is_relevant, update_request = understand_confirmation_reply(user_input, context)
+            else:
+                # Technical answers are free-form; only the LLM may call them off-topic
+                is_relevant = check_message_relevance(user_input, context, local_irrelevant=False)
+
+            if not is_relevant:
+                response = generate_irrelevant_response()
+                st.markdown(response)
+                session.add_message(ASSISTANT, response)
+
+            elif session.stage == 1:
+
+                if session.confirmation_pending:
+                    if update_request["wants_update"] and update_request["field"]:
+                        field = update_request["field"]
+                        new_value = update_request["new_value"]
+
+                        if validate_and_save_field(field, new_value):
+                            response = handle_previous_application(field)
+                            if response is None:
+                                field_name = field.replace("_", " ").title()
+                                response = f"Updated {field_name} to: {new_value}\n\n"
+                                response += "Would you like to update anything else, or shall we continue to the technical interview?"
+                        else:
+                            response = f"Invalid value for {field}. Please provide a valid value or say 'no' to continue."
+
+                        st.markdown(response)
+                        session.add_message(ASSISTANT, response)
+                    else:
+                        response = transition_to_stage_2()
+                        session.add_message(ASSISTANT, response)
+                else:
+                    current_field = session.current_field
+
+                    if validate_and_save_field(current_field, field_value):
+                        next_field = get_next_field()
+                        repeat_response = handle_previous_application(current_field)
+
+                        if repeat_response is not None:
+                            response = repeat_response
+                        elif next_field:
+                            session.current_field = next_field
+                            response = generate_field_prompt(next_field)
+                        else:
+                            session.confirmation_pending = True
+                            response = generate_confirmation_prompt()
+                    else:
+                        field_name = current_field.replace("_", " ")
+                        response = f"I couldn't quite get that. Could you please provide your {field_name}?"
+
+                        if current_field == "email":
+                            response = "Please provide a valid email address (e.g., name@example.com)."
+                        elif current_field == "phone":
+                            response = "Please provide a valid 10-digit phone number (e.g., 9876543210)."
+                        elif current_field == "years_experience":
+                            response = "Please provide the number of years of experience (e.g., 5, or 0 for fresh graduates)."
+
+                    st.markdown(response)
+                    session.add_message(ASSISTANT, response)
+
+            elif session.stage == 2:
+                response = handle_technical_answer(user_input)
+                session.add_message(ASSISTANT, response)
+
+    save_checkpoint(session)
+
+@st.fragment
+def render_live_turns(history_length, progress_slot):
+    """
+        Render the exchanges after the first history_length transcript entries and handle new input.
+
+        A chat turn reruns only this fragment, so the history drawn above it by
+        the last full run stays on screen without being rendered again.
+    """
+    session = get_session()
+    live = st.container()
+    with live:
+        render_messages(session.transcript[history_length:])
+
+    if session.stage < 3:
+        if user_input := st.chat_input("Type your response here..."):
+            stage = session.stage
+            with live:
+                handle_user_input(user_input)
+            with progress_slot:
+                render_progress_bar()
+
+            # A full run folds the live exchanges into the history and refreshes the sidebar
+            live_window = int(os.getenv("RENDER_LIVE_WINDOW", "12"))
+            if (
+                session.stage != stage
+                or len(session.transcript) - history_length > live_window
+                or st.session_state.get("show_candidate_info")
+            ):
+                st.rerun()
+
 def main():
     st.set_page_config(
         page_title="TalentScout - Recruitment Bot",
@@ -152,125 +329,44 @@ def main():
 
     st.title("TalentScout Recruitment Screening")
 
-    render_progress_bar()
+    progress_slot = st.empty()
+    with progress_slot:
+        render_progress_bar()
 
     st.markdown("---")
 
-    if not st.session_state.initialized:
-        greeting = generate_greeting()
-        st.session_state.messages.append({
-            "role": "assistant",
-            "content": greeting
-        })
-        st.session_state.initialized = True
-
-    for message in st.session_state.messages:
-        with st.chat_message(message["role"]):
-            st.markdown(message["content"])
-
-    if st.session_state.stage < 3:
-        if user_input := st.chat_input("Type your response here..."):
-            with st.chat_message("user"):
-                st.markdown(user_input)
-
-            st.session_state.messages.append({
-                "role": "user",
-                "content": user_input
-            })
-
-            with st.chat_message("assistant"):
-                with st.spinner("Thinking..."):
-                    context = f"Stage {st.session_state.stage}"
-                    if st.session_state.stage == 1 and not st.session_state.confirmation_pending:
-                        context += f" - collecting {st.session_state.current_field}"
-                    elif st.session_state.confirmation_pending:
-                        context += " - waiting for confirmation or updates"
-
-                    is_relevant = check_message_relevance(user_input, context)
-
-                    if not is_relevant:
-                        response = generate_irrelevant_response()
-                        st.markdown(response)
-                        st.session_state.messages.append({
-                            "role": "assistant",
-                            "content": response
-                        })
-
-                    elif st.session_state.stage == 1:
-                        
-                        if st.session_state.confirmation_pending:
-                            update_request = detect_update_request(user_input)
-                            
-                            if update_request["wants_update"] and update_request["field"]:
-                                field = update_request["field"]
-                                new_value = update_request["new_value"]
-                                
-                                if validate_and_save_field(field, new_value):
-                                    field_name = field.replace("_", " ").title()
-                                    response = f"Updated {field_name} to: {new_value}\n\n"
-                                    response += "Would you like to update anything else, or shall we continue to the technical interview?"
-                                else:
-                                    response = f"Invalid value for {field}. Please provide a valid value or say 'no' to continue."
-                                
-                                st.markdown(response)
-                                st.session_state.messages.append({
-                                    "role": "assistant",
-                                    "content": response
-                                })
-                            else:
-                                response = transition_to_stage_2()
-                                st.markdown(response)
-                                st.session_state.messages.append({
-                                    "role": "assistant",
-                                    "content": response
-                                })
-                        else:
-                            current_field = st.session_state.current_field
-                            
-                            field_value = extract_field_value(user_input, current_field)
-                            
-                            if validate_and_save_field(current_field, field_value):
-                                next_field = get_next_field()
-                                
-                                if next_field:
-                                    st.session_state.current_field = next_field
-                                    response = generate_field_prompt(next_field)
-                                else:
-                                    st.session_state.confirmation_pending = True
-                                    response = generate_confirmation_prompt()
-                            else:
-                                field_name = current_field.replace("_", " ")
-                                response = f"I couldn't quite get that. Could you please provide your {field_name}?"
-                                
-                                if current_field == "email":
-                                    response = "Please provide a valid email address (e.g., name@example.com)."
-                                elif current_field == "phone":
-                                    response = "Please provide a valid 10-digit phone number (e.g., 9876543210)."
-                                elif current_field == "years_experience":
-                                    response = "Please provide the number of years of experience (e.g., 5, or 0 for fresh graduates)."
-                            
-                            st.markdown(response)
-                            st.session_state.messages.append({
-                                "role": "assistant",
-                                "content": response
-                            })
-                    
-                    elif st.session_state.stage == 2:
-                        response = handle_technical_answer(user_input)
-                        st.markdown(response)
-                        st.session_state.messages.append({
-                            "role": "assistant",
-                            "content": response
-                        })
-            
-            st.rerun()
-    
-    elif st.session_state.stage == 3:
+    session = get_session()
+    if not session.transcript:
+        session.add_message(ASSISTANT, generate_greeting())
+
+    if os.getenv("RENDER_MODE", "incremental").lower() == "incremental":
+        history_length = len(session.transcript)
+        # One container for the history keeps the fragment's live tail and chat
+        # input at the same element position however long the history gets, so
+        # the input survives the full rerun at a stage change
+        with st.container():
+            render_messages(session.transcript)
+        render_live_turns(history_length, progress_slot)
+    else:
+        render_messages(session.transcript)
+        if session.stage < 3:
+            if user_input := st.chat_input("Type your response here..."):
+                stage = session.stage
+                handle_user_input(user_input)
+                with progress_slot:
+                    render_progress_bar()
+                if session.stage != stage:
+                    st.rerun()
+
+    if session.stage == 3 and session.duplicate_of is not None:
+        st.info("This application was closed because we already have a recent completed interview from you.")
+    elif session.stage == 3:
         st.success("Interview completed! Check the sidebar to download your interview data.")
         
         try:
             export_candidate_data()
-            st.info("Interview data has been automatically saved to MongoDB.")
+            if session.persisted:
+                st.info("Interview data has been automatically saved to MongoDB.")
         except Exception as e:
             pass
 
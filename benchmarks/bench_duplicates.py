@@ -0,0 +1,84 @@
+"""
+Latency of the repeat-applicant lookup in utils.identity.
+
+Runs DuplicateIndex.lookup against a collection that answers find_one after
+a simulated MongoDB round trip, first cold (every email is a miss and is
+queried) and then warm (every email is served from the local cache), and
+reports p50/p99 per lookup. The cache-hit path must stay under a millisecond.
+
+    python benchmarks/bench_duplicates.py [--candidates 10000] [--db-latency 0.002]
+"""
+from datetime import datetime, timedelta
+import argparse
+import os
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.identity import DuplicateIndex, identity_hash
+
+
+class SlowCollection:
+    """
+    find_one over {identity hash: record} with a fixed round-trip delay.
+    """
+
+    def __init__(self, records, latency):
+        self.records = records
+        self.latency = latency
+        self.queries = 0
+
+    def find_one(self, filter, projection=None, sort=None):
+        self.queries += 1
+        time.sleep(self.latency)
+        record = self.records.get(filter["identity_hashes"])
+        return dict(record) if record else None
+
+
+def measure(index, emails):
+    samples = []
+    for email in emails:
+        started = time.perf_counter()
+        index.lookup("email", email)
+        samples.append((time.perf_counter() - started) * 1000)
+    samples.sort()
+    return statistics.median(samples), samples[int(len(samples) * 0.99) - 1]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--candidates", type=int, default=10000, help="distinct applicant emails looked up")
+    parser.add_argument("--db-latency", type=float, default=0.002, help="simulated seconds per MongoDB query")
+    parser.add_argument("--repeat-share", type=float, default=0.2, help="share of applicants with a recent interview")
+    args = parser.parse_args()
+
+    # Identities are only hashed under a secret; any value will do here
+    os.environ.setdefault("IDENTITY_HASH_SECRET", "bench-duplicates")
+    recent = (datetime.now() - timedelta(days=3)).isoformat()
+    emails = [f"Candidate{i}+jobs@Example.com" for i in range(args.candidates)]
+    records = {
+        identity_hash("email", email): {"interview_id": f"earlier-{i}", "timestamp": recent}
+        for i, email in enumerate(emails)
+        if i < args.candidates * args.repeat_share
+    }
+    collection = SlowCollection(records, args.db_latency)
+    index = DuplicateIndex(lambda: collection, negative_ttl_seconds=3600)
+
+    cold = measure(index, emails)
+    queries = collection.queries
+    warm = measure(index, emails)
+
+    print(f"{'pass':<6} {'p50 ms':>8} {'p99 ms':>8} {'queries':>8}")
+    print(f"{'cold':<6} {cold[0]:>8.3f} {cold[1]:>8.3f} {queries:>8}")
+    print(f"{'warm':<6} {warm[0]:>8.3f} {warm[1]:>8.3f} {collection.queries - queries:>8}")
+    found = sum(1 for email in emails if index.lookup("email", email))
+    print(f"\n{found:,} of {len(emails):,} applicants matched a recent interview")
+    if warm[1] >= 1.0:
+        print("FAIL: cache hits took 1 ms or more at p99")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
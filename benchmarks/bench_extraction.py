@@ -0,0 +1,135 @@
+"""
+Micro-benchmark for the deterministic field extractor.
+
+Compares utils.extraction.extract_field_value_locally with the previous
+implementation (rebuilt regexes and one str.replace per filler word) on a
+corpus of realistic candidate replies, and reports any output differences.
+
+    python benchmarks/bench_extraction.py [--repeat 2000]
+"""
+import argparse
+import os
+import re
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.extraction import extract_field_value_locally
+
+CORPUS = [
+    ("name", "John Doe"),
+    ("name", "my name is Priya Sharma"),
+    ("name", "I'm Alex"),
+    ("email", "you can reach me at john.doe@example.com"),
+    ("email", "priya_sharma92@gmail.com"),
+    ("phone", "9876543210"),
+    ("phone", "+91 98765 43210"),
+    ("phone", "my number is (987) 654-3210"),
+    ("years_experience", "5"),
+    ("years_experience", "I have around 3 years of experience"),
+    ("years_experience", "I'm a fresher, just graduated"),
+    ("desired_position", "Backend Developer"),
+    ("desired_position", "I am applying for a senior data scientist role"),
+    ("desired_position", "looking for a full stack engineer position"),
+    ("location", "Bangalore"),
+    ("location", "I'm based in San Francisco"),
+    ("location", "from Pune city"),
+    ("tech_stack", "Python, Django, PostgreSQL, Docker"),
+    ("tech_stack", "I know python and django"),
+    ("tech_stack", "I'm proficient in react typescript node"),
+    ("tech_stack", "familiar with java spring and mysql"),
+]
+
+
+def legacy_extract(user_message, field_name):
+    if field_name == "name":
+        words = user_message.strip().split()
+        if len(words) <= 4 and len(user_message) < 50:
+            irrelevant = ["the", "is", "i'm", "my", "name", "is", "called", "i", "am"]
+            relevant_words = [w for w in words if w.lower() not in irrelevant]
+            if relevant_words:
+                return " ".join(relevant_words)
+
+    if field_name == "email":
+        email_pattern = r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}'
+        match = re.search(email_pattern, user_message)
+        if match:
+            return match.group(0)
+
+    if field_name == "phone":
+        phone_pattern = r'\d{10}'
+        match = re.search(phone_pattern, user_message)
+        if match:
+            return match.group(0)
+        phone_with_separators = re.sub(r'[^\d]', '', user_message)
+        if len(phone_with_separators) >= 10:
+            return phone_with_separators[:10]
+
+    if field_name == "years_experience":
+        if any(keyword in user_message.lower() for keyword in ["fresher", "fresh graduate", "no experience", "0 years", "just graduated", "beginner"]):
+            return 0
+        numbers = re.findall(r'\d+', user_message)
+        if numbers:
+            return int(numbers[0])
+
+    if field_name == "desired_position":
+        if len(user_message) < 100:
+            filler_words = ["i'm", "i am", "applying for", "looking for", "want", "interested in", "position", "role", "job", "as", "a", "an"]
+            cleaned = user_message.lower()
+            for word in filler_words:
+                cleaned = re.sub(r'\b' + re.escape(word) + r'\b', '', cleaned).strip()
+            if cleaned and len(cleaned) > 2:
+                return cleaned.title()
+
+    if field_name == "location":
+        if len(user_message) < 50:
+            filler_words = ["i'm", "i am", "located in", "from", "based in", "live in", "city", "state", "country"]
+            cleaned = user_message.lower()
+            for word in filler_words:
+                cleaned = re.sub(r'\b' + re.escape(word) + r'\b', '', cleaned).strip()
+            if cleaned and len(cleaned) > 1:
+                return cleaned.title()
+
+    if field_name == "tech_stack":
+        if "," in user_message:
+            return user_message.strip()
+        tech_keywords = ["python", "java", "javascript", "typescript", "react", "django", "node", "sql", "postgres", "mongodb", "docker", "kubernetes", "aws", "git", "html", "css", "c++", "c#", ".net", "php", "ruby", "golang", "rust", "kotlin", "swift", "flutter", "vue", "angular", "spring", "fastapi", "express", "flask"]
+        if any(keyword in user_message.lower() for keyword in tech_keywords):
+            filler_words = ["i know", "i'm proficient in", "i have", "experience with", "skilled in", "expertise in", "familiar with", "and", ","]
+            cleaned = user_message.lower()
+            for word in filler_words:
+                cleaned = cleaned.replace(word, "").strip()
+            if cleaned and len(cleaned) > 2:
+                return cleaned.strip()
+            return user_message.strip()
+
+    return None
+
+
+def run_corpus(extract):
+    for field_name, message in CORPUS:
+        extract(message, field_name)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeat", type=int, default=2000, help="passes over the corpus per timing run")
+    args = parser.parse_args()
+
+    for field_name, message in CORPUS:
+        old, new = legacy_extract(message, field_name), extract_field_value_locally(message, field_name)
+        if old != new:
+            print(f"differs  {field_name:<17} {message!r}: {old!r} -> {new!r}")
+
+    legacy = min(timeit.repeat(lambda: run_corpus(legacy_extract), number=args.repeat, repeat=5))
+    current = min(timeit.repeat(lambda: run_corpus(extract_field_value_locally), number=args.repeat, repeat=5))
+    per_call = 1e6 / (args.repeat * len(CORPUS))
+
+    print(f"legacy   {legacy * per_call:8.2f} us/message")
+    print(f"current  {current * per_call:8.2f} us/message")
+    print(f"speedup  {legacy / current:8.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+"""
+Import-time regression check for the modules app.py loads.
+
+Runs a fresh interpreter with python -X importtime importing every utils
+module app.py imports, then reports the total time, the slowest top-level
+imports and whether any dependency that should load lazily (LLM client,
+HTTP client, MongoDB driver, OpenTelemetry) was pulled in at import time.
+Exits non-zero if one was, or if the total exceeds --max-ms.
+
+    python benchmarks/bench_import_time.py [--repeat 3] [--max-ms 0] [--top 10]
+"""
+import argparse
+import os
+import re
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+LAZY_PACKAGES = ("langchain_groq", "langchain_core", "groq", "httpx", "pymongo", "bson", "opentelemetry")
+
+_APP_IMPORT = re.compile(r"^(?:from (utils\.\w+) import|import (utils\.\w+))", re.MULTILINE)
+_IMPORTTIME_LINE = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)$")
+
+
+def app_modules():
+    with open(os.path.join(ROOT, "app.py"), encoding="utf-8") as f:
+        source = f.read()
+    return sorted({a or b for a, b in _APP_IMPORT.findall(source)})
+
+
+def measure(modules):
+    """
+        Return ({top-level module: cumulative us}, {every imported module}) for one cold import
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import " + ", ".join(modules)],
+        cwd=ROOT, capture_output=True, text=True
+    )
+    if result.returncode != 0:
+        raise RuntimeError(result.stderr.strip().splitlines()[-1])
+
+    top_level, imported = {}, set()
+    for line in result.stderr.splitlines():
+        match = _IMPORTTIME_LINE.match(line)
+        if not match:
+            continue
+        _, cumulative, indent, name = match.groups()
+        imported.add(name)
+        if len(indent) == 1:
+            top_level[name] = int(cumulative)
+    return top_level, imported
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeat", type=int, default=3, help="cold imports to run; the fastest is reported")
+    parser.add_argument("--max-ms", type=float, default=0, help="fail if the total exceeds this (0 = no limit)")
+    parser.add_argument("--top", type=int, default=10, help="slowest top-level imports to list")
+    args = parser.parse_args()
+
+    modules = app_modules()
+    runs = [measure(modules) for _ in range(args.repeat)]
+    top_level, imported = min(runs, key=lambda run: sum(run[0].values()))
+    total_ms = sum(top_level.values()) / 1000
+
+    print(f"modules  {', '.join(modules)}")
+    print(f"total    {total_ms:8.1f} ms")
+    for name, cumulative in sorted(top_level.items(), key=lambda item: -item[1])[:args.top]:
+        print(f"  {cumulative / 1000:8.1f} ms  {name}")
+
+    eager = sorted({name.split(".")[0] for name in imported} & set(LAZY_PACKAGES))
+    failed = False
+    if eager:
+        print(f"imported eagerly: {', '.join(eager)}")
+        failed = True
+    if args.max_ms and total_ms > args.max_ms:
+        print(f"over budget: {total_ms:.1f} ms > {args.max_ms:.1f} ms")
+        failed = True
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
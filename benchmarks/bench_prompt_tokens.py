@@ -0,0 +1,201 @@
+"""
+Token-count regression benchmark for the LLM prompt templates.
+
+Renders every template in utils.prompt_registry for a set of sample inputs
+and compares its estimated token count with the f-string prompt it
+replaced. "cacheable" is the static prefix shared by every call, which
+provider-side prompt caching can reuse; "variable" is what changes per call.
+Exits non-zero if any template got larger than its legacy prompt.
+
+    python benchmarks/bench_prompt_tokens.py
+"""
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.prompt_registry import PROMPTS, count_tokens
+
+CONTEXT = "Stage 1 - collecting tech_stack"
+MESSAGE = "I mostly work with python, django and postgres"
+TECH_STACK = "Python, Django, PostgreSQL, Docker"
+FIELD_DESCRIPTION = "programming languages, frameworks, and tools they know (as a comma-separated string)"
+
+
+def legacy_relevance(user_message, current_context):
+    return f"""
+        You are a recruitment chatbot filter. Determine if the user's message is relevant to a job recruitment screening process.
+
+        User message: "{user_message}"
+        Context: {current_context}
+
+        A message is RELEVANT if it:
+        - Provides personal information (name, email, phone, experience, position, location, skills)
+        - Answers the current question being asked
+        - Asks clarifying questions about the job or interview process
+        - Expresses willingness to continue or provides acknowledgments
+        - Requests to update previously provided information
+
+        A message is IRRELEVANT if it:
+        - Asks general knowledge questions (capitals, math problems, trivia, science facts)
+        - Requests unrelated tasks (writing stories, translating text, jokes)
+        - Contains off-topic conversation
+        - Asks about unrelated topics (weather, sports, entertainment)
+
+        Respond with ONLY one word: RELEVANT or IRRELEVANT
+    """
+
+
+def legacy_update_detection(user_message):
+    return f"""
+        Analyze if the user wants to UPDATE previously provided information.
+
+       User message: "{user_message}"
+        Available fields: name, email, phone, years_experience, desired_position, location, tech_stack
+
+        Determine:
+        1. Does the user want to update something? (yes/no)
+        2. If yes, which field? (use exact field names above)
+        3. If yes, what's the new value?
+
+        Return ONLY a JSON object:
+        {{"wants_update": true/false, "field": "field_name or null", "new_value": "value or null"}}
+
+        Examples:
+        - "update email to john@example.com" -> {{"wants_update": true, "field": "email", "new_value": "john@example.com"}}
+        - "change my phone number to 1234567890" -> {{"wants_update": true, "field": "phone", "new_value": "1234567890"}}
+        - "no" or "looks good" -> {{"wants_update": false, "field": null, "new_value": null}}
+        """
+
+
+def legacy_extraction(user_message, field_description):
+    return f"""
+        Extract {field_description} from the user's message.
+
+        User message: "{user_message}"
+
+        Rules:
+            - If the information is clearly present, extract it
+            - For years_experience: if they say "fresher", "fresh graduate", "no experience", or "0", return 0
+            - For tech_stack: provide as comma-separated values
+            - If the information is NOT present or unclear, return null
+
+        Return ONLY a JSON object with this format: {{"value": <extracted_value>}}
+
+        Examples:
+            - For name: {{"value": "John Doe"}}
+            - For email: {{"value": "john@example.com"}}
+            - For years_experience: {{"value": 3}} or {{"value": 0}}
+            - For tech_stack: {{"value": "Python, Django, React, PostgreSQL"}}
+            - If not found: {{"value": null}}
+    """
+
+
+def legacy_turn_understanding(user_message, context, expected):
+    return f"""
+        You are the input parser for a recruitment screening chatbot.
+
+        Context: {context}
+        {expected}
+        User message: "{user_message}"
+        Fields: name, email, phone, years_experience, desired_position, location, tech_stack
+
+        Determine:
+        1. relevant: is the message relevant to the screening (answers, acknowledgements, updates, questions about the job)? Trivia, jokes, weather, unrelated tasks are NOT relevant.
+        2. intent: "answer" (provides the requested field), "update" (changes a previously given field) or "confirm" (accepts the details / wants to continue)
+        3. field: the field being answered or updated, or null
+        4. value: the extracted value for that field, or null. Use 0 for fresh graduates; give tech_stack as comma-separated values.
+
+        Return ONLY a JSON object:
+        {{"relevant": true/false, "intent": "answer|update|confirm", "field": "field_name or null", "value": "value or null"}}
+    """
+
+
+def legacy_technical_question(tech_stack, question_number):
+    return f"""You are a technical interviewer. Generate a single, clear technical interview question for a candidate.
+
+Candidate's Tech Stack: {tech_stack}
+Question Number: {question_number} of 5
+
+Generate a question that:
+- Tests practical knowledge of their stated technologies
+- Is appropriate for their tech stack
+- Varies in difficulty (mix of fundamental and advanced topics)
+- Is specific and clear
+
+Return ONLY the question, no additional text or numbering."""
+
+
+def legacy_technical_questions(tech_stack, count):
+    return f"""You are a technical interviewer. Generate {count} distinct, clear technical interview questions for a candidate.
+
+Candidate's Tech Stack: {tech_stack}
+
+The questions should:
+- Test practical knowledge of their stated technologies
+- Cover different topics, with no two questions on the same concept
+- Progress from fundamental to advanced
+- Be specific and clear
+
+Return ONLY a JSON array of {count} strings, one question per element, with no numbering."""
+
+
+EXPECTED = "The candidate was asked for their tech_stack."
+
+CASES = {
+    "relevance": (
+        legacy_relevance(MESSAGE, CONTEXT),
+        {"user_message": MESSAGE, "context": CONTEXT}
+    ),
+    "update_detection": (
+        legacy_update_detection(MESSAGE),
+        {"user_message": MESSAGE}
+    ),
+    "extraction": (
+        legacy_extraction(MESSAGE, FIELD_DESCRIPTION),
+        {"field_description": FIELD_DESCRIPTION, "user_message": MESSAGE}
+    ),
+    "turn_understanding": (
+        legacy_turn_understanding(MESSAGE, CONTEXT, EXPECTED),
+        {"context": CONTEXT, "expected": EXPECTED, "user_message": MESSAGE}
+    ),
+    "technical_question": (
+        legacy_technical_question(TECH_STACK, 3),
+        {"tech_stack": TECH_STACK, "question_number": 3}
+    ),
+    "technical_questions": (
+        legacy_technical_questions(TECH_STACK, 5),
+        {"tech_stack": TECH_STACK, "count": 5}
+    ),
+}
+
+
+def main():
+    print(f"{'template':<22}{'legacy':>8}{'current':>9}{'cacheable':>11}{'variable':>10}{'saved':>8}")
+    regressions = []
+    for name, (legacy_prompt, variables) in CASES.items():
+        template = PROMPTS[name]
+        legacy = count_tokens(legacy_prompt)
+        variable = count_tokens(template.render_suffix(**variables))
+        current = template.prefix_tokens + variable
+        print(
+            f"{name:<22}{legacy:>8}{current:>9}{template.prefix_tokens:>11}{variable:>10}"
+            f"{(legacy - current) / legacy:>8.0%}"
+        )
+        if current > legacy:
+            regressions.append(name)
+
+    legacy_chars = sum(len(legacy_prompt) for legacy_prompt, _ in CASES.values())
+    current_chars = sum(
+        len(PROMPTS[name].prefix) + len(PROMPTS[name].render_suffix(**variables))
+        for name, (_, variables) in CASES.items()
+    )
+    print(f"characters sent: {legacy_chars} -> {current_chars}")
+
+    if regressions:
+        print(f"token regression in: {', '.join(regressions)}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,161 @@
+"""
+Benchmark for the reviewer queries in utils.reviews.
+
+Seeds a local MongoDB with N synthetic interviews (1,000,000 by default;
+an existing seed of the same size is reused) and times the typical reviewer
+queries twice: with no secondary indexes, then after ensure_interview_indexes.
+Each query reports the median latency and the documents MongoDB examined,
+taken from explain(), which is what separates a collection scan from an
+index range scan.
+
+    python benchmarks/bench_reviews.py [--uri mongodb://localhost:27017/talentscout_bench] [--interviews 1000000]
+
+Needs pymongo and a mongod the URI points at (e.g. docker run -p 27017:27017 mongo);
+the target database is dropped when --reseed is given or the seed size differs.
+"""
+from datetime import datetime, timedelta
+import argparse
+import os
+import random
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.database import add_search_fields, ensure_interview_indexes
+from utils.reviews import build_filter, list_interviews, projection, SORT
+
+POSITIONS = (
+    "Backend Developer", "Frontend Developer", "Data Scientist", "DevOps Engineer",
+    "Full Stack Developer", "ML Engineer", "Mobile Developer", "QA Engineer"
+)
+TECHNOLOGIES = (
+    "Python", "Django", "Flask", "FastAPI", "JavaScript", "TypeScript", "React", "Node.js",
+    "Java", "Spring", "Go", "Rust", "PostgreSQL", "MongoDB", "Redis", "Docker", "Kubernetes",
+    "AWS", "TensorFlow", "PyTorch", "Pandas", "Swift", "Kotlin", "Selenium"
+)
+START = datetime(2025, 1, 1)
+
+
+def synthetic_interview(i, rng, answer_chars):
+    timestamp = START + timedelta(seconds=rng.randrange(365 * 24 * 3600))
+    tech_stack = ", ".join(rng.sample(TECHNOLOGIES, rng.randint(2, 6)))
+    return add_search_fields({
+        "_id": f"bench-{i:08d}",
+        "interview_id": f"bench-{i:08d}",
+        "timestamp": timestamp.isoformat(),
+        "candidate_info": {
+            "name": f"Candidate {i}",
+            "email": f"candidate{i}@example.com",
+            "phone": f"98{i:08d}",
+            "years_experience": rng.randint(0, 15),
+            "desired_position": rng.choice(POSITIONS),
+            "location": rng.choice(("Bengaluru", "Pune", "Remote", "Berlin", "London")),
+            "tech_stack": tech_stack
+        },
+        "technical_interview": [
+            {"question_number": n, "question": f"Question {n} about {tech_stack}?", "answer": "x" * answer_chars}
+            for n in range(1, 6)
+        ],
+        "interview_stage_completed": 3
+    })
+
+
+def seed(collection, interviews, answer_chars, reseed, batch_size=10000):
+    if not reseed and collection.estimated_document_count() == interviews:
+        print(f"Reusing {interviews:,} seeded interviews")
+        return
+    collection.drop()
+    rng = random.Random(42)
+    started = time.perf_counter()
+    for start in range(0, interviews, batch_size):
+        collection.insert_many(
+            [synthetic_interview(i, rng, answer_chars) for i in range(start, min(start + batch_size, interviews))],
+            ordered=False
+        )
+    print(f"Seeded {interviews:,} interviews in {time.perf_counter() - started:.1f}s")
+
+
+def docs_examined(collection, query, limit, include_answers=False):
+    plan = collection.find(query, projection(include_answers)).sort(SORT).limit(limit).explain()
+    return plan.get("executionStats", {}).get("totalDocsExamined")
+
+
+def paginate(collection, filters, pages, limit):
+    cursor = None
+    for _ in range(pages):
+        _, cursor = list_interviews(filters, limit=limit, after=cursor, collection=collection)
+        if cursor is None:
+            break
+
+
+def skip_paginate(collection, filters, pages, limit):
+    for page in range(pages):
+        list(collection.find(filters, projection()).sort(SORT).skip(page * limit).limit(limit))
+
+
+def queries(interviews):
+    email = f"candidate{interviews // 2}@example.com"
+    month = (datetime(2025, 6, 1), datetime(2025, 7, 1))
+    return [
+        ("newest page", build_filter()),
+        ("email lookup", build_filter(email=email)),
+        ("position + month", build_filter(position="Data Scientist", since=month[0], until=month[1])),
+        ("technologies", build_filter(technologies="python, django")),
+    ]
+
+
+def timed(fn, repeat):
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - started) * 1000)
+    return statistics.median(samples)
+
+
+def run(collection, interviews, limit, pages, repeat):
+    rows = []
+    for label, filters in queries(interviews):
+        ms = timed(lambda: list_interviews(filters, limit=limit, collection=collection), repeat)
+        rows.append((label, ms, docs_examined(collection, filters, limit + 1)))
+
+    filters = build_filter(technologies="python")
+    rows.append((f"{pages} pages, cursor", timed(lambda: paginate(collection, filters, pages, limit), repeat), None))
+    rows.append((f"{pages} pages, skip()", timed(lambda: skip_paginate(collection, filters, pages, limit), repeat), None))
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--uri", default="mongodb://localhost:27017/talentscout_bench", help="MongoDB to seed and query")
+    parser.add_argument("--interviews", type=int, default=1_000_000, help="synthetic interviews to seed")
+    parser.add_argument("--answer-chars", type=int, default=200, help="characters per synthetic answer")
+    parser.add_argument("--limit", type=int, default=50, help="page size")
+    parser.add_argument("--pages", type=int, default=20, help="pages walked in the pagination runs")
+    parser.add_argument("--repeat", type=int, default=3, help="runs per query; the median is reported")
+    parser.add_argument("--reseed", action="store_true", help="drop and reseed even if the seed size matches")
+    args = parser.parse_args()
+
+    from pymongo import MongoClient
+    client = MongoClient(args.uri)
+    collection = client[args.uri.split("/")[-1].split("?")[0] or "talentscout_bench"]["interviews"]
+    seed(collection, args.interviews, args.answer_chars, args.reseed)
+
+    collection.drop_indexes()
+    results = {"no indexes": run(collection, args.interviews, args.limit, args.pages, args.repeat)}
+    started = time.perf_counter()
+    ensure_interview_indexes(collection)
+    print(f"Built indexes in {time.perf_counter() - started:.1f}s")
+    results["indexed"] = run(collection, args.interviews, args.limit, args.pages, args.repeat)
+
+    print(f"\n{'query':<22} {'setup':<11} {'median ms':>10} {'docs examined':>14}")
+    for setup, rows in results.items():
+        for label, ms, examined in rows:
+            print(f"{label:<22} {setup:<11} {ms:>10.1f} {'' if examined is None else f'{examined:,}':>14}")
+    client.close()
+
+
+if __name__ == "__main__":
+    main()
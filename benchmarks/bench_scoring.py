@@ -0,0 +1,70 @@
+"""
+Throughput benchmark for background answer scoring.
+
+Scores N completed interviews through utils.scoring with the fake LLM and
+an in-memory collection, once per batch size, and reports LLM calls and
+wall time. Batching several answers per rubric call is what keeps the LLM
+call count at ceil(5 / batch size) per interview.
+
+    python benchmarks/bench_scoring.py [--interviews 50] [--latency 0.3]
+"""
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.fakes import FakeCollection, FakeLLM
+from utils import scoring
+
+TECH_STACK = "Python, Django, PostgreSQL"
+
+
+def technical_qa(i):
+    return [
+        {
+            "question_number": n,
+            "question": f"Question {n}: how does Django's ORM avoid N+1 queries?",
+            "answer": f"Candidate {i} answer {n}: use select_related and prefetch_related."
+        }
+        for n in range(1, 6)
+    ]
+
+
+def run(interviews, batch_size, latency):
+    os.environ["SCORING_BATCH_SIZE"] = str(batch_size)
+    llm = FakeLLM(latency=latency, jitter=0, seed=1)
+    collection = FakeCollection()
+    for i in range(interviews):
+        collection.insert_one({"_id": f"interview-{i}"})
+
+    started = time.perf_counter()
+    futures = [
+        scoring.submit_scoring(f"interview-{i}", TECH_STACK, technical_qa(i), llm=llm, collection=collection)
+        for i in range(interviews)
+    ]
+    for future in futures:
+        future.result()
+    elapsed = time.perf_counter() - started
+
+    scored = sum(1 for d in collection.documents.values() if d.get("evaluation", {}).get("status") == "scored")
+    return llm.calls, elapsed, scored
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--interviews", type=int, default=50, help="completed interviews to score")
+    parser.add_argument("--latency", type=float, default=0.3, help="fake LLM seconds per call")
+    args = parser.parse_args()
+
+    # Keep answers out of the response cache so every batch size pays for its calls
+    os.environ["LLM_CACHE_ENABLED"] = "false"
+    print(f"{'batch size':<12}{'LLM calls':>10}{'seconds':>10}{'scored':>8}")
+    for batch_size in (1, 5):
+        calls, elapsed, scored = run(args.interviews, batch_size, args.latency)
+        print(f"{batch_size:<12}{calls:>10}{elapsed:>10.2f}{scored:>8}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,122 @@
+"""
+Per-session memory benchmark for the interview state.
+
+Builds N completed interviews both as the previous loose st.session_state
+keys (dict messages, dict candidate data, dict QA entries) and as
+InterviewSession objects, and reports the heap each representation holds
+per session as measured by tracemalloc, plus the size of to_dict as JSON.
+
+    python benchmarks/bench_session_memory.py [--sessions 5000]
+"""
+import argparse
+import json
+import os
+import sys
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.interview_session import ASSISTANT, CANDIDATE_FIELDS, USER, InterviewSession
+
+
+def sample_interview(i):
+    """
+        Return (candidate, qa, transcript) for a completed interview with strings unique to session i
+    """
+    candidate = {
+        "name": f"Candidate {i}",
+        "email": f"candidate{i}@example.com",
+        "phone": f"98765{i:05d}"[:10],
+        "years_experience": i % 12,
+        "desired_position": "Backend Developer",
+        "location": f"City {i % 50}",
+        "tech_stack": "Python, Django, PostgreSQL, Docker",
+    }
+    qa = [
+        (n, f"Question {n} for session {i}: explain how Django's ORM builds and caches querysets?",
+         f"Answer {n} from session {i}: querysets are lazy and evaluated on iteration " * 3)
+        for n in range(1, 6)
+    ]
+    transcript = [(ASSISTANT, f"Welcome to TalentScout! session {i}")]
+    for field in CANDIDATE_FIELDS:
+        transcript.append((ASSISTANT, f"What's your {field}? ({i})"))
+        transcript.append((USER, str(candidate[field])))
+    for n, question, answer in qa:
+        transcript.append((ASSISTANT, question))
+        transcript.append((USER, answer))
+    return candidate, qa, transcript
+
+
+def build_legacy(i):
+    candidate, qa, transcript = sample_interview(i)
+    return {
+        "messages": [{"role": role, "content": content} for role, content in transcript],
+        "stage": 3,
+        "candidate_data": dict(candidate),
+        "current_field": "tech_stack",
+        "confirmation_pending": False,
+        "question_count": 5,
+        "technical_qa": [{"question_number": n, "question": q, "answer": a} for n, q, a in qa],
+        "question_plan": None,
+        "question_plan_future": None,
+        "current_question": None,
+        "waiting_for_answer": False,
+        "last_answer_message_id": len(transcript) - 1,
+        "initialized": True,
+        "interview_id": f"{i:032x}",
+        "interview_export": None,
+        "interview_persisted": True,
+    }
+
+
+def build_session(i):
+    candidate, qa, transcript = sample_interview(i)
+    session = InterviewSession(f"{i:032x}")
+    session.stage = 3
+    session.current_field = "tech_stack"
+    session.question_count = 5
+    session.persisted = True
+    for field, value in candidate.items():
+        session.candidate.set(field, value)
+    for entry in qa:
+        session.add_answer(*entry)
+    for entry in transcript:
+        session.add_message(*entry)
+    return session
+
+
+def measure(build, count):
+    """
+        Return the heap bytes held per session, text included, by count sessions made with build
+    """
+    tracemalloc.start()
+    baseline, _ = tracemalloc.get_traced_memory()
+    sessions = [build(i) for i in range(count)]
+    held, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del sessions
+    return (held - baseline) / count
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sessions", type=int, default=5000, help="sessions to hold in memory at once")
+    args = parser.parse_args()
+
+    legacy = measure(build_legacy, args.sessions)
+    current = measure(build_session, args.sessions)
+
+    session = build_session(0)
+    restored = InterviewSession.from_dict(json.loads(json.dumps(session.to_dict())))
+    assert restored.to_dict() == session.to_dict(), "to_dict/from_dict round trip changed the session"
+
+    print(f"sessions      {args.sessions}")
+    print(f"legacy keys   {legacy / 1024:8.1f} KiB/session")
+    print(f"session       {current / 1024:8.1f} KiB/session")
+    print(f"saving        {1 - current / legacy:8.0%}")
+    print(f"to_dict JSON  {len(json.dumps(session.to_dict())) / 1024:8.1f} KiB/session")
+    print(f"at {args.sessions} sessions: {legacy * args.sessions / 2 ** 20:.1f} MiB -> {current * args.sessions / 2 ** 20:.1f} MiB")
+
+
+if __name__ == "__main__":
+    main()
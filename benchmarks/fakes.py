@@ -0,0 +1,241 @@
+"""
+In-process stand-ins for Groq and MongoDB used by the benchmark scripts.
+
+FakeLLM answers the app's prompts with canned responses after a configurable
+latency, and FakeMongoClient keeps collections in memory. Both count calls so
+benchmarks can report LLM calls and DB writes per interview.
+"""
+import copy
+import itertools
+import json
+import random
+import re
+import threading
+import time
+from types import SimpleNamespace
+
+
+class FakeLLM:
+    """
+    Mimics the subset of ChatGroq the app uses: invoke, stream and model_name.
+    """
+
+    model_name = "fake-llm"
+
+    def __init__(self, latency=0.3, jitter=0.1, seed=None):
+        self.latency = latency
+        self.jitter = jitter
+        self.calls = 0
+        self._lock = threading.Lock()
+        self._random = random.Random(seed)
+        self._question_ids = itertools.count(1)
+
+    def _sleep(self):
+        with self._lock:
+            self.calls += 1
+            delay = self.latency + self._random.uniform(0, self.jitter)
+        time.sleep(delay)
+
+    def _respond(self, prompt):
+        if "input parser for a recruitment" in prompt:
+            intent = "confirm" if "whether to update anything" in prompt else "answer"
+            return json.dumps({"relevant": True, "intent": intent, "field": None, "value": None})
+        if "grading a candidate's written answers" in prompt:
+            numbers = re.findall(r'"question_number": (\d+)', prompt.split("Answers:", 1)[-1])
+            return json.dumps([
+                {"question_number": int(n), "correctness": 7, "depth": 6, "clarity": 8, "feedback": "Solid answer."}
+                for n in numbers
+            ])
+        if "RELEVANT or IRRELEVANT" in prompt:
+            return "RELEVANT"
+        if "UPDATE previously provided information" in prompt:
+            return '{"wants_update": false, "field": null, "new_value": null}'
+        if "Return ONLY a JSON object with this format" in prompt:
+            return '{"value": null}'
+        if "JSON array" in prompt:
+            return json.dumps([f"Explain concept #{next(self._question_ids)} in your stack." for _ in range(5)])
+        return f"Explain concept #{next(self._question_ids)} in your stack and when you would use it."
+
+    def invoke(self, messages, *args, **kwargs):
+        self._sleep()
+        prompt = "\n".join(m.content for m in messages)
+        content = self._respond(prompt)
+        return SimpleNamespace(
+            content=content,
+            usage_metadata={"input_tokens": len(prompt) // 4, "output_tokens": len(content) // 4}
+        )
+
+    def stream(self, messages, *args, **kwargs):
+        content = self.invoke(messages).content
+        for word in content.split(" "):
+            yield SimpleNamespace(content=word + " ")
+
+
+_MISSING = object()
+
+
+def _lookup(document, path):
+    value = document
+    for key in path.split("."):
+        if not isinstance(value, dict) or key not in value:
+            return _MISSING
+        value = value[key]
+    return value
+
+
+def _compare(value, operator, operand):
+    if operator == "$in":
+        return value in operand
+    if operator == "$ne":
+        return value != operand
+    if operator == "$all":
+        return isinstance(value, list) and all(v in value for v in operand)
+    if value is _MISSING or value is None:
+        return False
+    try:
+        return {
+            "$gt": value > operand, "$gte": value >= operand,
+            "$lt": value < operand, "$lte": value <= operand,
+        }[operator]
+    except TypeError:
+        # MongoDB never matches range operators across types
+        return False
+
+
+def matches(document, query):
+    """
+    Evaluate the subset of MongoDB query syntax the app uses against a plain dict.
+    """
+    for key, condition in (query or {}).items():
+        if key == "$and":
+            if not all(matches(document, q) for q in condition):
+                return False
+            continue
+        if key == "$or":
+            if not any(matches(document, q) for q in condition):
+                return False
+            continue
+        value = _lookup(document, key)
+        if isinstance(condition, dict) and condition and all(k.startswith("$") for k in condition):
+            if not all(_compare(value, op, operand) for op, operand in condition.items()):
+                return False
+        elif condition is None:
+            if value not in (None, _MISSING):
+                return False
+        elif value is _MISSING or not (value == condition or (isinstance(value, list) and condition in value)):
+            return False
+    return True
+
+
+class FakeCollection:
+    def __init__(self):
+        self.documents = {}
+        self.writes = 0
+        self._lock = threading.Lock()
+
+    def _count_write(self, n=1):
+        self.writes += n
+
+    def insert_one(self, document):
+        with self._lock:
+            self._count_write()
+            document.setdefault("_id", len(self.documents) + 1)
+            self.documents[document["_id"]] = copy.deepcopy(document)
+            return SimpleNamespace(inserted_id=document["_id"])
+
+    def insert_many(self, documents, ordered=True):
+        with self._lock:
+            self._count_write()
+            for document in documents:
+                document.setdefault("_id", len(self.documents) + 1)
+                self.documents[document["_id"]] = copy.deepcopy(document)
+            return SimpleNamespace(inserted_ids=[d["_id"] for d in documents])
+
+    def replace_one(self, filter, document, upsert=False):
+        with self._lock:
+            self._count_write()
+            if filter["_id"] in self.documents or upsert:
+                self.documents[filter["_id"]] = dict(copy.deepcopy(document), _id=filter["_id"])
+
+    def _update(self, filter, update, upsert):
+        document = self.documents.get(filter.get("_id"))
+        if document is not None and not matches(document, filter):
+            document = None
+            upsert = False
+        if document is None:
+            if not upsert:
+                return SimpleNamespace(matched_count=0)
+            document = self.documents[filter["_id"]] = {"_id": filter["_id"]}
+            for key, value in update.get("$setOnInsert", {}).items():
+                document[key] = copy.deepcopy(value)
+        for key, value in update.get("$set", {}).items():
+            document[key] = copy.deepcopy(value)
+        for key in update.get("$unset", {}):
+            document.pop(key, None)
+        for key, value in update.get("$push", {}).items():
+            entries = value["$each"] if isinstance(value, dict) and "$each" in value else [value]
+            document.setdefault(key, []).extend(copy.deepcopy(entries))
+        return SimpleNamespace(matched_count=1)
+
+    def update_one(self, filter, update, upsert=False):
+        with self._lock:
+            self._count_write()
+            return self._update(filter, update, upsert)
+
+    def bulk_write(self, requests, ordered=True):
+        with self._lock:
+            self._count_write()
+            for request in requests:
+                # pymongo's UpdateOne keeps its arguments in private attributes
+                self._update(request._filter, request._doc, request._upsert)
+
+    def find(self, filter=None, projection=None, sort=None, limit=0, **kwargs):
+        with self._lock:
+            documents = [copy.deepcopy(d) for d in self.documents.values() if matches(d, filter)]
+        for key, direction in reversed(sort or []):
+            documents.sort(key=lambda d: d.get(key), reverse=direction < 0)
+        return documents[:limit] if limit else documents
+
+    def find_one(self, filter=None, projection=None, sort=None):
+        with self._lock:
+            if filter and not isinstance(filter.get("_id", {}), dict):
+                document = self.documents.get(filter["_id"])
+                return copy.deepcopy(document) if document and matches(document, filter) else None
+        documents = self.find(filter, sort=sort, limit=1)
+        return documents[0] if documents else None
+
+    def delete_many(self, filter):
+        with self._lock:
+            self._count_write()
+            ids = [_id for _id, d in self.documents.items() if matches(d, filter)]
+            for _id in ids:
+                del self.documents[_id]
+            return SimpleNamespace(deleted_count=len(ids))
+
+    def find_one_and_update(self, filter, update, **kwargs):
+        document = self.find_one(filter)
+        if document is not None:
+            self.update_one(filter, update)
+        return document
+
+    def create_index(self, *args, **kwargs):
+        return "index"
+
+
+class FakeDatabase(dict):
+    def __missing__(self, name):
+        collection = self[name] = FakeCollection()
+        return collection
+
+
+class FakeMongoClient(dict):
+    def __missing__(self, name):
+        database = self[name] = FakeDatabase()
+        return database
+
+    def close(self):
+        pass
+
+    @property
+    def writes(self):
+        return sum(c.writes for db in self.values() for c in db.values())
@@ -0,0 +1,168 @@
+"""
+Headless load test for the interview state machine.
+
+Replays scripted candidate transcripts through app.py with Streamlit's
+AppTest at N concurrent sessions, against FakeLLM and FakeMongoClient, and
+reports turn latency percentiles, LLM calls per interview and DB writes per
+interview. Nothing leaves the machine.
+
+AppTest keeps one script runtime per process and cannot drive two apps from
+parallel threads, so each concurrent session runs in its own worker process
+(workers run their sessions one after another and keep their caches warm).
+The run fails with exit status 1 unless every interview reaches stage 3.
+
+    python benchmarks/load_test.py --sessions 20 --concurrency 5 --latency 0.3 --jitter 0.2
+    python benchmarks/load_test.py --cold   # disable the response cache and question bank
+"""
+import argparse
+import os
+import random
+import statistics
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+import multiprocessing
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from benchmarks.fakes import FakeLLM, FakeMongoClient
+
+FAKE_MONGO_URI = "mongodb://fake-host/talentscout"
+
+TRANSCRIPTS = [
+    [
+        "John Doe", "john.doe@example.com", "9876543210", "5", "Backend Developer",
+        "Bangalore", "Python, Django, PostgreSQL", "no",
+        "I would add an index on the foreign key and use select_related.",
+        "Django middleware wraps the request/response cycle.",
+        "I profile with cProfile and fix the slowest queries first.",
+        "Feature branches with pull requests and code review.",
+        "Unit tests with pytest plus integration tests in CI.",
+    ],
+    [
+        "Priya Sharma", "priya@example.org", "+91 98765 43210", "I'm a fresher", "Data Scientist",
+        "Pune", "Python, Pandas, scikit-learn", "looks good",
+        "I would use cross-validation to estimate generalization error.",
+        "Pandas groupby splits, applies and combines.",
+        "I check for leakage and distribution shift first.",
+        "Git with small commits and notebooks stripped of outputs.",
+        "Property-based tests for transforms and golden files for models.",
+    ],
+]
+
+
+def percentile(values, q):
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, int(round(q / 100 * (len(ordered) - 1)))))
+    return ordered[index]
+
+
+_FAKES = {}
+
+
+def init_worker(latency, jitter, seed, cold):
+    """
+    Point a worker process at its own FakeLLM and FakeMongoClient.
+    """
+    os.environ["GROQ_API_KEY"] = "fake-key"
+    os.environ["MONGO_URI"] = FAKE_MONGO_URI
+    os.environ["MONGO_BACKGROUND_WRITES"] = "false"
+    # Keep per-turn checkpoints out of the fake MongoDB, whose writes count interview saves
+    os.environ["CHECKPOINT_BACKEND"] = "none"
+    # Every session replays one of the same few transcripts, so they share emails
+    # and phones; with duplicate detection on, later sessions would be closed as repeats.
+    os.environ["DUPLICATE_APPLICANT_ACTION"] = "off"
+    # The purge thread would only compete with the sessions being measured
+    os.environ["RETENTION_PURGE_INTERVAL_SECONDS"] = "0"
+    if cold:
+        os.environ["LLM_CACHE_ENABLED"] = "false"
+        os.environ["QUESTION_BANK_BACKEND"] = "none"
+
+    import utils.database
+    import utils.llm
+
+    _FAKES["llm"] = fake_llm = FakeLLM(latency=latency, jitter=jitter, seed=seed + os.getpid())
+    _FAKES["mongo"] = fake_mongo = FakeMongoClient()
+    utils.llm.clear_llm_pool()
+    utils.llm._build_llm = lambda model, temperature, api_key: fake_llm
+    utils.database.register_client(FAKE_MONGO_URI, fake_mongo)
+
+
+def run_session(transcript, timeout):
+    """
+    Replay one transcript; returns {"latencies", "stage", "llm_calls", "db_writes", "error"}.
+    """
+    from streamlit.testing.v1 import AppTest
+
+    llm_calls, db_writes = _FAKES["llm"].calls, _FAKES["mongo"].writes
+    result = {"latencies": [], "stage": None, "error": None}
+    try:
+        at = AppTest.from_file(os.path.join(ROOT, "app.py"), default_timeout=timeout)
+        at.run()
+        for message in transcript:
+            started = time.perf_counter()
+            at.chat_input[0].set_value(message).run()
+            result["latencies"].append(time.perf_counter() - started)
+            if at.exception:
+                raise RuntimeError(at.exception[0].message)
+        result["stage"] = at.session_state["interview"].stage
+    except Exception as e:
+        result["error"] = f"{type(e).__name__}: {e}"
+    result["llm_calls"] = _FAKES["llm"].calls - llm_calls
+    result["db_writes"] = _FAKES["mongo"].writes - db_writes
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sessions", type=int, default=10, help="interviews to replay")
+    parser.add_argument("--concurrency", type=int, default=4, help="sessions running at once")
+    parser.add_argument("--latency", type=float, default=0.3, help="fake LLM base latency in seconds")
+    parser.add_argument("--jitter", type=float, default=0.1, help="uniform extra latency in seconds")
+    parser.add_argument("--timeout", type=float, default=60, help="per-turn AppTest timeout in seconds")
+    parser.add_argument("--cold", action="store_true", help="disable the LLM response cache and question bank")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    transcripts = [rng.choice(TRANSCRIPTS) for _ in range(args.sessions)]
+
+    # AppTest replaces the worker's __main__ module, so hand the pool functions
+    # from the importable module rather than from this script
+    from benchmarks import load_test
+
+    started = time.perf_counter()
+    with ProcessPoolExecutor(
+        max_workers=args.concurrency,
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=load_test.init_worker,
+        initargs=(args.latency, args.jitter, args.seed, args.cold)
+    ) as executor:
+        results = list(executor.map(load_test.run_session, transcripts, [args.timeout] * len(transcripts)))
+    elapsed = time.perf_counter() - started
+
+    latencies = [latency for result in results for latency in result["latencies"]]
+    completed = sum(1 for result in results if result["stage"] == 3)
+
+    print(f"sessions            {args.sessions} ({completed} completed) at concurrency {args.concurrency}")
+    print(f"wall time           {elapsed:.2f}s")
+    print(f"turns               {len(latencies)}")
+    if latencies:
+        print(f"turn latency p50    {percentile(latencies, 50) * 1000:.1f} ms")
+        print(f"turn latency p95    {percentile(latencies, 95) * 1000:.1f} ms")
+        print(f"turn latency p99    {percentile(latencies, 99) * 1000:.1f} ms")
+        print(f"turn latency mean   {statistics.mean(latencies) * 1000:.1f} ms")
+    print(f"LLM calls/interview {sum(r['llm_calls'] for r in results) / args.sessions:.2f}")
+    print(f"DB writes/interview {sum(r['db_writes'] for r in results) / args.sessions:.2f}")
+
+    failed = [(i, result) for i, result in enumerate(results) if result["stage"] != 3]
+    for i, result in failed:
+        reason = result["error"] or f"stopped at stage {result['stage']}"
+        print(f"FAIL: session {i} did not finish the interview ({reason})", file=sys.stderr)
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
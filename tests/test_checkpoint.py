@@ -0,0 +1,58 @@
+from concurrent.futures import Future
+
+import pytest
+
+from utils import checkpoint
+from utils.checkpoint import checkpoint_backend, load_checkpoint, save_checkpoint
+from utils.interview_session import InterviewSession
+
+
+@pytest.fixture
+def sqlite_store(monkeypatch, tmp_path):
+    monkeypatch.setenv("CHECKPOINT_BACKEND", "sqlite")
+    monkeypatch.setenv("CHECKPOINT_PATH", str(tmp_path / "checkpoints.sqlite3"))
+    monkeypatch.setattr(checkpoint, "_STORE", None)
+
+
+@pytest.mark.parametrize("mongo_uri, setting, expected", [
+    ("mongodb://db/talentscout", None, "mongo"),
+    (None, None, "sqlite"),
+    ("mongodb://db/talentscout", "sqlite", "sqlite"),
+    ("mongodb://db/talentscout", "none", "none"),
+])
+def test_checkpoint_backend(monkeypatch, mongo_uri, setting, expected):
+    for name, value in (("MONGO_URI", mongo_uri), ("CHECKPOINT_BACKEND", setting)):
+        if value is None:
+            monkeypatch.delenv(name, raising=False)
+        else:
+            monkeypatch.setenv(name, value)
+    assert checkpoint_backend() == expected
+
+
+def test_question_plan_is_checkpointed_once_it_lands(sqlite_store):
+    session = InterviewSession()
+    session.stage = 2
+    session.question_plan = {}
+    session.question_plan_future = Future()
+    save_checkpoint(session)
+    assert load_checkpoint(session.interview_id).question_plan is None
+
+    plan = {n: f"Question {n}" for n in range(2, 6)}
+    session.question_plan_future.add_done_callback(lambda _: save_checkpoint(session))
+    session.question_plan_future.set_result(plan)
+
+    assert session.question_plan_future is None
+    assert load_checkpoint(session.interview_id).question_plan == plan
+
+
+def test_deltas_resume_from_the_saved_snapshot(sqlite_store):
+    session = InterviewSession()
+    session.add_message("assistant", "Hello")
+    save_checkpoint(session)
+    session.add_message("user", "Jane Doe")
+    session.candidate.set("name", "Jane Doe")
+    save_checkpoint(session)
+    save_checkpoint(session)
+
+    resumed = load_checkpoint(session.interview_id)
+    assert resumed.to_dict() == session.to_dict()
@@ -0,0 +1,20 @@
+import json
+
+from utils.database import write_dead_letters
+
+
+def test_dead_letter_file_is_rotated_at_its_size_cap(tmp_path):
+    path = str(tmp_path / "failed_interviews.jsonl")
+    entry = {"failed_at": "2026-01-01T00:00:00", "document": {"_id": "x", "answer": "a" * 100}}
+    line_size = len(json.dumps(entry)) + 1
+
+    for _ in range(5):
+        write_dead_letters(path, [entry], max_bytes=line_size * 3)
+
+    with open(path, encoding="utf-8") as f:
+        current = f.readlines()
+    with open(f"{path}.1", encoding="utf-8") as f:
+        rotated = f.readlines()
+    assert len(current) == 2
+    assert len(rotated) == 3
+    assert json.loads(current[0]) == entry
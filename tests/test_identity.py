@@ -0,0 +1,40 @@
+import hashlib
+
+import pytest
+
+from utils.identity import duplicate_check_action, identity_hash, identity_hashes
+
+
+@pytest.fixture
+def secret(monkeypatch):
+    monkeypatch.setenv("IDENTITY_HASH_SECRET", "test-secret")
+    monkeypatch.delenv("DUPLICATE_APPLICANT_ACTION", raising=False)
+
+
+def test_hash_is_keyed(secret, monkeypatch):
+    hashed = identity_hash("phone", "+91 98765 43210")
+
+    assert hashed == identity_hash("phone", "9876543210")
+    assert hashed != hashlib.sha256(b"phone\0" + b"9876543210").hexdigest()
+    assert hashed != hashlib.sha256(b"\0phone\0" + b"9876543210").hexdigest()
+    monkeypatch.setenv("IDENTITY_HASH_SECRET", "another-secret")
+    assert identity_hash("phone", "9876543210") != hashed
+
+
+def test_email_is_normalized_before_hashing(secret):
+    assert identity_hash("email", "Jane.Doe+jobs@Example.com") == identity_hash("email", "jane.doe@example.com")
+
+
+def test_without_a_secret_nothing_is_hashed_and_detection_is_off(monkeypatch):
+    monkeypatch.delenv("IDENTITY_HASH_SECRET", raising=False)
+    monkeypatch.delenv("DUPLICATE_APPLICANT_ACTION", raising=False)
+
+    assert identity_hash("phone", "9876543210") is None
+    assert identity_hashes({"email": "jane@example.com", "phone": "9876543210"}) == []
+    assert duplicate_check_action() == "off"
+
+
+def test_detection_follows_the_setting_when_a_secret_is_set(secret, monkeypatch):
+    assert duplicate_check_action() == "block"
+    monkeypatch.setenv("DUPLICATE_APPLICANT_ACTION", "off")
+    assert duplicate_check_action() == "off"
@@ -0,0 +1,86 @@
+from datetime import datetime, timedelta, timezone
+import json
+
+import pytest
+
+from benchmarks.fakes import FakeCollection
+from utils.retention import purge
+
+
+@pytest.fixture
+def collection(monkeypatch, tmp_path):
+    monkeypatch.setenv("RETENTION_DAYS", "90")
+    monkeypatch.setenv("MONGO_DEAD_LETTER_PATH", str(tmp_path / "failed_interviews.jsonl"))
+    return FakeCollection()
+
+
+def _save(collection, _id, age_days, **fields):
+    timestamp = datetime.now() - timedelta(days=age_days)
+    document = {"_id": _id, "timestamp": timestamp.isoformat(), **fields}
+    collection.insert_one(document)
+
+
+def _hold(days_from_now):
+    now = datetime.now(timezone.utc)
+    return {"reason": "selected", "since": now - timedelta(days=30), "until": now + timedelta(days=days_from_now)}
+
+
+def test_hold_ending_inside_retention_window_keeps_the_interview(collection):
+    _save(collection, "recent", age_days=0, retention_hold=_hold(-1))
+
+    stats = purge(collection, max_deletes_per_second=0)
+
+    document = collection.find_one({"_id": "recent"})
+    assert stats["total"] == 0
+    assert stats["holds_ended"] == 1
+    assert "retention_hold" not in document
+    assert document["expires_at"] > datetime.now(timezone.utc) + timedelta(days=89)
+
+
+def test_hold_ending_after_retention_window_expires_the_interview(collection):
+    _save(collection, "old", age_days=200, retention_hold=_hold(-1))
+
+    stats = purge(collection, max_deletes_per_second=0)
+
+    assert stats["holds_ended"] == 1
+    assert stats["purged"]["expired"] == 1
+    assert collection.find_one({"_id": "old"}) is None
+
+
+def test_active_and_indefinite_holds_are_kept(collection):
+    _save(collection, "active", age_days=200, retention_hold=_hold(10))
+    _save(collection, "indefinite", age_days=200, retention_hold=dict(_hold(0), until=None))
+
+    stats = purge(collection, max_deletes_per_second=0)
+
+    assert stats["holds_ended"] == 0
+    assert stats["total"] == 0
+    assert collection.find_one({"_id": "active"})["retention_hold"]["until"] is not None
+
+
+def test_legacy_and_expired_documents_are_purged(collection):
+    _save(collection, "legacy", age_days=100)
+    _save(collection, "expired", age_days=1, expires_at=datetime.now(timezone.utc) - timedelta(hours=1))
+    _save(collection, "fresh", age_days=1, expires_at=datetime.now(timezone.utc) + timedelta(days=89))
+
+    stats = purge(collection, max_deletes_per_second=0)
+
+    assert stats["purged"] == {"expired": 1, "legacy": 1}
+    assert [d["_id"] for d in collection.find()] == ["fresh"]
+
+
+def test_old_dead_letters_are_purged(collection, tmp_path):
+    path = tmp_path / "failed_interviews.jsonl"
+    old = (datetime.now() - timedelta(days=91)).isoformat()
+    recent = (datetime.now() - timedelta(days=1)).isoformat()
+    path.write_text("".join(
+        json.dumps({"failed_at": failed_at, "document": {"_id": _id}}) + "\n"
+        for failed_at, _id in ((old, "old"), (recent, "recent"))
+    ) + "{truncated\n")
+    (tmp_path / "failed_interviews.jsonl.1").write_text(json.dumps({"failed_at": old, "document": {}}) + "\n")
+
+    stats = purge(collection, max_deletes_per_second=0)
+
+    assert stats["dead_letters"] == 3
+    assert [json.loads(line)["document"]["_id"] for line in path.read_text().splitlines()] == ["recent"]
+    assert not (tmp_path / "failed_interviews.jsonl.1").exists()
@@ -0,0 +1,28 @@
+import pytest
+
+from utils.tech_stack import canonical_technology, normalize_tech_stack
+
+
+@pytest.mark.parametrize("tech_stack, expected", [
+    ("AWS S3, EC2, Python 3.11", ("aws", "ec2", "python", "s3")),
+    ("S3", ("s3",)),
+    ("EC2", ("ec2",)),
+    ("Web3", ("web3",)),
+    ("python3.11", ("python",)),
+    ("Node 18, java-v17", ("java", "node.js")),
+    ("C++17", ("c++",)),
+    ("HTML5/CSS3", ("css", "html")),
+    ("I know python and django", ("django", "python")),
+    ("Python Django PostgreSQL", ("django", "postgresql", "python")),
+    ("React.js, Node.js v20", ("node.js", "react")),
+    ("", ()),
+])
+def test_normalize_tech_stack(tech_stack, expected):
+    assert normalize_tech_stack(tech_stack) == expected
+
+
+@pytest.mark.parametrize("name, expected", [
+    ("S3", "s3"), ("ec2", "ec2"), ("web3", "web3"), ("Python 3", "python"), ("k8s", "kubernetes"),
+])
+def test_canonical_technology_keeps_digits_that_belong_to_the_name(name, expected):
+    assert canonical_technology(name) == expected
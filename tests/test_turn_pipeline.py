@@ -0,0 +1,50 @@
+import pytest
+
+from utils import turn_pipeline
+from utils.turn_pipeline import understand_confirmation_reply
+
+
+@pytest.fixture
+def understanding(monkeypatch):
+    monkeypatch.setenv("TURN_UNDERSTANDING", "single")
+    # Leave the decision to the (stubbed) structured call
+    monkeypatch.setattr(turn_pipeline, "detect_update_request_locally", lambda message: None)
+
+    def stub(result):
+        monkeypatch.setattr(turn_pipeline, "understand_turn", lambda *args, **kwargs: dict(result))
+    return stub
+
+
+def test_answer_with_a_validated_value_is_an_update(understanding):
+    understanding({"relevant": True, "intent": "answer", "field": "email", "value": "x@y.com"})
+
+    is_relevant, update_request = understand_confirmation_reply("my email is x@y.com", "Stage 1")
+
+    assert is_relevant
+    assert update_request == {"wants_update": True, "field": "email", "new_value": "x@y.com"}
+
+
+def test_update_intent_without_a_value_still_asks_for_the_update(understanding):
+    understanding({"relevant": True, "intent": "update", "field": "location", "value": None})
+
+    _, update_request = understand_confirmation_reply("I need to change my location", "Stage 1")
+
+    assert update_request == {"wants_update": True, "field": "location", "new_value": None}
+
+
+def test_confirmation_is_not_an_update(understanding):
+    understanding({"relevant": True, "intent": "confirm", "field": None, "value": None})
+
+    is_relevant, update_request = understand_confirmation_reply("sounds right, carry on", "Stage 1")
+
+    assert is_relevant
+    assert update_request["wants_update"] is False
+
+
+def test_irrelevant_reply(understanding):
+    understanding({"relevant": False, "intent": "answer", "field": "email", "value": "x@y.com"})
+
+    is_relevant, update_request = understand_confirmation_reply("what's the weather like", "Stage 1")
+
+    assert not is_relevant
+    assert update_request["wants_update"] is False
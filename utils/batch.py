@@ -0,0 +1,266 @@
+"""
+Headless batch screening of recorded candidate transcripts.
+
+Each input line is a JSON object holding one application:
+
+    {"id": "optional-stable-id", "messages": ["Jane Doe", "jane@example.com", ...]}
+
+"messages" (or "transcript") lists the candidate's replies in the order the
+chatbot asks for them; entries may also be {"role", "content"} objects, of
+which only the user's are used. A plain "text" dump is split into one reply
+per non-empty line. Replies go through the same extraction, validation and
+update-detection pipeline as the interactive app, and one result per
+application is written as JSONL in input order and, unless --no-mongo is
+given, stored in the interviews collection with batched insert_many calls.
+
+    python -m utils.batch applications.jsonl -o results.jsonl [--workers 8] [--llm-concurrency 4]
+"""
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+import argparse
+import json
+import os
+import sys
+import time
+
+from utils.database import add_search_fields
+from utils.interview_session import CANDIDATE_FIELDS, USER, InterviewSession
+from utils.prompt_registry import interview_scope
+from utils.resilience import set_llm_concurrency
+from utils.retention import apply_retention
+from utils.turn_pipeline import understand_confirmation_reply, understand_field_answer
+from utils.validation import clean_field_value
+
+
+def read_applications(stream):
+    """
+    Yield (line_number, record) for each non-blank JSONL line; unparsable lines yield an error record.
+    """
+    for line_number, line in enumerate(stream, 1):
+        if not line.strip():
+            continue
+        try:
+            record = json.loads(line)
+        except ValueError as e:
+            record = {"_error": f"invalid JSON: {e}"}
+        yield line_number, record
+
+
+def user_messages(record):
+    """
+    Return the candidate's replies from an application record.
+    """
+    messages = record.get("messages") or record.get("transcript")
+    if messages is None:
+        return [line.strip() for line in str(record.get("text", "")).splitlines() if line.strip()]
+
+    replies = []
+    for message in messages:
+        if isinstance(message, dict):
+            if message.get("role", USER) != USER:
+                continue
+            message = message.get("content")
+        if message is not None and str(message).strip():
+            replies.append(str(message).strip())
+    return replies
+
+
+def screen_application(record):
+    """
+    Run one application's replies through the info-gathering pipeline and return its result document.
+    """
+    if "_error" in record:
+        raise ValueError(record["_error"])
+
+    session = InterviewSession(str(record["id"]) if record.get("id") is not None else None)
+    counts = {"messages": 0, "irrelevant": 0, "invalid": 0, "updates": 0}
+    confirmed = False
+
+    with interview_scope(session.interview_id):
+        for message in user_messages(record):
+            counts["messages"] += 1
+            session.add_message(USER, message)
+
+            if not session.confirmation_pending:
+                field = session.current_field
+                is_relevant, value = understand_field_answer(message, field, f"Stage 1 - collecting {field}")
+                if not is_relevant:
+                    counts["irrelevant"] += 1
+                    continue
+                is_valid, value = clean_field_value(field, value)
+                if not is_valid:
+                    counts["invalid"] += 1
+                    continue
+                session.candidate.set(field, value)
+                next_field = session.candidate.next_missing()
+                if next_field:
+                    session.current_field = next_field
+                else:
+                    session.confirmation_pending = True
+                continue
+
+            is_relevant, update_request = understand_confirmation_reply(
+                message, "Stage 1 - waiting for confirmation or updates"
+            )
+            if not is_relevant:
+                counts["irrelevant"] += 1
+                continue
+            field = update_request["field"]
+            if not (update_request["wants_update"] and field in CANDIDATE_FIELDS):
+                confirmed = True
+                break
+            is_valid, value = clean_field_value(field, update_request["new_value"])
+            if is_valid:
+                session.candidate.set(field, value)
+                counts["updates"] += 1
+            else:
+                counts["invalid"] += 1
+
+    candidate_info = session.candidate.to_dict()
+    return {
+        "interview_id": session.interview_id,
+        "timestamp": datetime.now().isoformat(),
+        "source": "batch",
+        "candidate_info": candidate_info,
+        "technical_interview": [],
+        "interview_stage_completed": 1,
+        "missing_fields": [field for field in CANDIDATE_FIELDS if candidate_info[field] is None],
+        "screening": dict(counts, confirmed=confirmed)
+    }
+
+
+class _MongoSink:
+    """
+    Buffer result documents and store them with unordered insert_many calls.
+    """
+
+    def __init__(self, collection, batch_size, stats):
+        self.collection = collection
+        self.batch_size = batch_size
+        self.stats = stats
+        self._buffer = []
+
+    def add(self, document):
+        self._buffer.append(apply_retention(add_search_fields(dict(document, _id=document["interview_id"]))))
+        if len(self._buffer) >= self.batch_size:
+            self.flush()
+
+    def flush(self):
+        if not self._buffer:
+            return
+        documents, self._buffer = self._buffer, []
+        try:
+            self.collection.insert_many(documents, ordered=False)
+            self.stats["stored"] += len(documents)
+        except Exception as e:
+            # BulkWriteError: the rest of the batch was still inserted
+            details = getattr(e, "details", None) or {}
+            errors = details.get("writeErrors", [])
+            duplicates = sum(1 for error in errors if error.get("code") == 11000)
+            self.stats["stored"] += details.get("nInserted", 0)
+            self.stats["duplicates"] += duplicates
+            self.stats["db_errors"] += (len(errors) - duplicates) if errors else len(documents)
+            if not errors or duplicates < len(errors):
+                print(f"Error storing batch results: {e}", file=sys.stderr)
+
+
+def run_batch(records, write_result, workers=8, collection=None, batch_size=500, progress_every=5.0):
+    """
+    Screen (line_number, record) pairs on a worker pool and pass each result to write_result in input order.
+
+    At most 4 * workers applications are in flight, so memory stays flat
+    however large the input is. Results without an error are also stored in
+    collection when one is given. Returns the run's counters.
+    """
+    stats = {"screened": 0, "errors": 0, "stored": 0, "duplicates": 0, "db_errors": 0}
+    sink = _MongoSink(collection, batch_size, stats) if collection is not None else None
+    started = last_report = time.monotonic()
+    pending = deque()
+
+    def finish(line_number, future):
+        try:
+            result = future.result()
+        except Exception as e:
+            stats["errors"] += 1
+            result = {"line": line_number, "error": f"{type(e).__name__}: {e}"}
+        else:
+            stats["screened"] += 1
+            if sink is not None:
+                sink.add(result)
+        write_result(result)
+
+    def report(final=False):
+        elapsed = time.monotonic() - started
+        done = stats["screened"] + stats["errors"]
+        print(
+            f"{'done' if final else 'progress'}: {done} applications · {done / elapsed if elapsed else 0:.1f}/s · "
+            f"{stats['errors']} errors · {stats['stored']} stored",
+            file=sys.stderr
+        )
+
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="batch-screening") as executor:
+        for line_number, record in records:
+            pending.append((line_number, executor.submit(screen_application, record)))
+            while len(pending) >= 4 * workers or (pending and pending[0][1].done()):
+                finish(*pending.popleft())
+
+            if progress_every and time.monotonic() - last_report >= progress_every:
+                last_report = time.monotonic()
+                report()
+
+        while pending:
+            finish(*pending.popleft())
+
+    if sink is not None:
+        sink.flush()
+    report(final=True)
+    return stats
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("input", help="applications JSONL file, or - for stdin")
+    parser.add_argument("-o", "--output", default="-", help="results JSONL file, or - for stdout (default)")
+    parser.add_argument("--workers", type=int, default=8, help="applications screened at once")
+    parser.add_argument("--llm-concurrency", type=int, default=4, help="LLM requests in flight at once (0 = unbounded)")
+    parser.add_argument("--batch-size", type=int, default=500, help="documents per insert_many call")
+    parser.add_argument("--no-mongo", action="store_true", help="only write the JSONL output")
+    parser.add_argument("--progress-every", type=float, default=5.0, help="seconds between progress lines")
+    args = parser.parse_args(argv)
+
+    from dotenv import load_dotenv
+    load_dotenv()
+    if not os.getenv("GROQ_API_KEY"):
+        parser.error("GROQ_API_KEY is not set.")
+
+    set_llm_concurrency(args.llm_concurrency)
+
+    collection = None
+    if not args.no_mongo:
+        from utils.database import ensure_interview_indexes, get_interviews_collection
+        collection = get_interviews_collection()
+        ensure_interview_indexes(collection)
+
+    source = sys.stdin if args.input == "-" else open(args.input, encoding="utf-8")
+    sink = sys.stdout if args.output == "-" else open(args.output, "w", encoding="utf-8")
+    try:
+        stats = run_batch(
+            read_applications(source),
+            lambda result: sink.write(json.dumps(result) + "\n"),
+            workers=args.workers,
+            collection=collection,
+            batch_size=args.batch_size,
+            progress_every=args.progress_every
+        )
+    finally:
+        if source is not sys.stdin:
+            source.close()
+        if sink is not sys.stdout:
+            sink.close()
+
+    return 1 if stats["errors"] or stats["db_errors"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
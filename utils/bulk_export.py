@@ -0,0 +1,271 @@
+"""
+Streaming bulk export of stored interviews for analytics.
+
+Interviews are read from MongoDB with a batched cursor in (timestamp, _id)
+order and written as two tables: one row per interview with candidate_info
+flattened into candidate_* columns, and one row per technical answer keyed
+by interview_id. Rows are written in chunks, so memory stays flat however
+many interviews are exported.
+
+    python -m utils.bulk_export -o exports/ --format parquet [--since 2025-06-01] [--until 2025-07-01]
+    python -m utils.bulk_export -o exports/ --format ndjson.gz --incremental
+
+--incremental resumes after the last interview the previous incremental run
+exported (kept in <output>/.watermark.json) and writes files named after the
+run, so each run adds new files instead of rewriting old ones.
+"""
+from datetime import datetime, timedelta
+import argparse
+import csv
+import gzip
+import json
+import os
+import sys
+
+from utils.interview_session import CANDIDATE_FIELDS
+from utils.reviews import build_filter, decode_cursor, encode_cursor
+
+FORMATS = ("parquet", "ndjson.gz", "csv")
+
+INTERVIEW_COLUMNS = (
+    "interview_id", "timestamp", "source", "interview_stage_completed",
+    *(f"candidate_{field}" for field in CANDIDATE_FIELDS),
+    "technologies", "answer_count", "evaluation_status", "evaluation_overall",
+)
+ANSWER_COLUMNS = (
+    "interview_id", "question_number", "question", "answer",
+    "status", "score", "correctness", "depth", "clarity", "feedback",
+)
+_NUMERIC_COLUMNS = {
+    "interview_stage_completed": "int64", "candidate_years_experience": "int64", "answer_count": "int64",
+    "evaluation_overall": "float64", "question_number": "int64", "score": "float64",
+    "correctness": "int64", "depth": "int64", "clarity": "int64",
+}
+
+
+def interview_row(document):
+    """
+    Flatten an interview document into an INTERVIEW_COLUMNS row.
+    """
+    candidate_info = document.get("candidate_info") or {}
+    evaluation = document.get("evaluation") or {}
+    row = {
+        "interview_id": str(document.get("interview_id") or document["_id"]),
+        "timestamp": document.get("timestamp"),
+        "source": document.get("source", "app"),
+        "interview_stage_completed": document.get("interview_stage_completed"),
+        "technologies": ", ".join(document.get("technologies") or []),
+        "answer_count": len(document.get("technical_interview") or []),
+        "evaluation_status": evaluation.get("status"),
+        "evaluation_overall": evaluation.get("overall"),
+    }
+    for field in CANDIDATE_FIELDS:
+        row[f"candidate_{field}"] = candidate_info.get(field)
+    return row
+
+
+def answer_rows(document):
+    """
+    Return the ANSWER_COLUMNS rows for an interview's technical answers, joined with their scores.
+    """
+    interview_id = str(document.get("interview_id") or document["_id"])
+    scores = {
+        evaluation["question_number"]: evaluation
+        for evaluation in (document.get("evaluation") or {}).get("answers", [])
+    }
+    rows = []
+    for qa in document.get("technical_interview") or []:
+        evaluation = scores.get(qa.get("question_number"), {})
+        rows.append({
+            "interview_id": interview_id,
+            "question_number": qa.get("question_number"),
+            "question": qa.get("question"),
+            "answer": qa.get("answer"),
+            "status": evaluation.get("status"),
+            **{key: evaluation.get(key) for key in ("score", "correctness", "depth", "clarity", "feedback")}
+        })
+    return rows
+
+
+class _NDJSONGzipWriter:
+    def __init__(self, path, columns):
+        self._file = gzip.open(path, "wt", encoding="utf-8")
+
+    def write(self, rows):
+        for row in rows:
+            self._file.write(json.dumps(row, ensure_ascii=False, default=str) + "\n")
+
+    def close(self):
+        self._file.close()
+
+
+class _CSVWriter:
+    def __init__(self, path, columns):
+        self._file = open(path, "w", encoding="utf-8", newline="")
+        self._writer = csv.DictWriter(self._file, fieldnames=columns)
+        self._writer.writeheader()
+
+    def write(self, rows):
+        self._writer.writerows(rows)
+
+    def close(self):
+        self._file.close()
+
+
+class _ParquetWriter:
+    """
+    Writes each chunk as a row group under a fixed schema, so a column that
+    is empty in one chunk keeps its type.
+    """
+
+    def __init__(self, path, columns):
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+        self._pa = pa
+        self._schema = pa.schema([
+            (column, getattr(pa, _NUMERIC_COLUMNS.get(column, "string"))())
+            for column in columns
+        ])
+        self._writer = pq.ParquetWriter(path, self._schema, compression="zstd")
+
+    def write(self, rows):
+        if not rows:
+            return
+        columns = {name: [row.get(name) for row in rows] for name in self._schema.names}
+        self._writer.write_table(self._pa.Table.from_pydict(columns, schema=self._schema))
+
+    def close(self):
+        self._writer.close()
+
+
+_WRITERS = {"parquet": _ParquetWriter, "ndjson.gz": _NDJSONGzipWriter, "csv": _CSVWriter}
+
+
+def read_watermark(path):
+    """
+    Return the cursor saved by the last incremental export, or None.
+    """
+    try:
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)["cursor"]
+    except FileNotFoundError:
+        return None
+
+
+def write_watermark(path, cursor, exported):
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump({"cursor": cursor, "exported": exported, "written_at": datetime.now().isoformat()}, f)
+    os.replace(tmp_path, path)
+
+
+def export_query(since=None, until=None, after=None):
+    """
+    Build the query for interviews in [since, until) after the watermark cursor, if any.
+    """
+    query = build_filter(since=since, until=until)
+    if after:
+        timestamp, _id = decode_cursor(after)
+        after_filter = {"$or": [
+            {"timestamp": {"$gt": timestamp}},
+            {"timestamp": timestamp, "_id": {"$gt": _id}}
+        ]}
+        query = {"$and": [query, after_filter]} if query else after_filter
+    return query
+
+
+def export_interviews(collection, output_dir, fmt="parquet", since=None, until=None, after=None,
+                      batch_size=1000, chunk_rows=5000, suffix=""):
+    """
+    Stream matching interviews into interviews<suffix>.<fmt> and answers<suffix>.<fmt> in output_dir.
+
+    Returns {"interviews", "answers", "cursor", "files"}, where cursor points
+    after the last exported interview (the previous cursor when none matched).
+    """
+    writer_class = _WRITERS[fmt]
+    os.makedirs(output_dir, exist_ok=True)
+    paths = {
+        "interviews": os.path.join(output_dir, f"interviews{suffix}.{fmt}"),
+        "answers": os.path.join(output_dir, f"answers{suffix}.{fmt}"),
+    }
+    writers = {
+        "interviews": writer_class(paths["interviews"], INTERVIEW_COLUMNS),
+        "answers": writer_class(paths["answers"], ANSWER_COLUMNS),
+    }
+    buffers = {"interviews": [], "answers": []}
+    counts = {"interviews": 0, "answers": 0}
+    last = None
+
+    def flush(table):
+        writers[table].write(buffers[table])
+        counts[table] += len(buffers[table])
+        buffers[table] = []
+
+    try:
+        cursor = collection.find(
+            export_query(since, until, after), sort=[("timestamp", 1), ("_id", 1)], batch_size=batch_size
+        )
+        for document in cursor:
+            buffers["interviews"].append(interview_row(document))
+            buffers["answers"].extend(answer_rows(document))
+            last = document
+            for table, rows in buffers.items():
+                if len(rows) >= chunk_rows:
+                    flush(table)
+        for table in buffers:
+            flush(table)
+    finally:
+        for writer in writers.values():
+            writer.close()
+
+    return dict(
+        counts,
+        cursor=encode_cursor(last) if last is not None else after,
+        files=list(paths.values())
+    )
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("-o", "--output", required=True, help="directory the tables are written to")
+    parser.add_argument("--format", choices=FORMATS, default="parquet")
+    parser.add_argument("--since", help="only interviews at or after this ISO date/time")
+    parser.add_argument("--until", help="only interviews before this ISO date/time")
+    parser.add_argument("--incremental", action="store_true", help="export only interviews newer than the last incremental run")
+    parser.add_argument(
+        "--settle-seconds", type=int, default=300,
+        help="with --incremental, leave out interviews newer than this, which background writes may still be saving"
+    )
+    parser.add_argument("--batch-size", type=int, default=1000, help="documents per MongoDB cursor batch")
+    parser.add_argument("--chunk-rows", type=int, default=5000, help="rows buffered per write (Parquet row group size)")
+    args = parser.parse_args(argv)
+
+    from dotenv import load_dotenv
+    load_dotenv()
+    from utils.database import get_interviews_collection
+
+    watermark_path = os.path.join(args.output, ".watermark.json")
+    after, until, suffix = None, args.until, ""
+    if args.incremental:
+        after = read_watermark(watermark_path)
+        settled = (datetime.now() - timedelta(seconds=args.settle_seconds)).isoformat()
+        until = min(until, settled) if until else settled
+        suffix = f"-{datetime.now().strftime('%Y%m%dT%H%M%S')}"
+
+    result = export_interviews(
+        get_interviews_collection(), args.output, fmt=args.format, since=args.since, until=until,
+        after=after, batch_size=args.batch_size, chunk_rows=args.chunk_rows, suffix=suffix
+    )
+    if args.incremental and result["cursor"]:
+        write_watermark(watermark_path, result["cursor"], result["interviews"])
+
+    print(
+        f"Exported {result['interviews']} interviews and {result['answers']} answers to "
+        + ", ".join(result["files"]),
+        file=sys.stderr
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
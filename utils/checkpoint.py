@@ -0,0 +1,237 @@
+from datetime import datetime, timezone
+import json
+import os
+import sqlite3
+import threading
+import time
+
+from utils.interview_session import InterviewSession
+
+# Lists that only ever grow; deltas carry just their new entries
+_APPEND_ONLY = ("transcript", "qa")
+
+
+def take_delta(session, data=None):
+    """
+    Return what changed in the session (or in data, its to_dict snapshot)
+    since its last checkpoint, or None.
+
+    A delta is {"set": {field: value}, "append": {list: [new entries]}};
+    the first delta of a session carries every field.
+    """
+    data = dict(data or session.to_dict())
+    appended = {key: data.pop(key) for key in _APPEND_ONLY}
+    if session.checkpoint_base is None:
+        return {"set": data, "append": appended}
+
+    scalars, *lengths = session.checkpoint_base
+    changed = {key: value for key, value in data.items() if scalars.get(key) != value}
+    appends = {
+        key: entries[length:]
+        for (key, entries), length in zip(appended.items(), lengths)
+        if len(entries) > length
+    }
+    if not changed and not appends:
+        return None
+    return {"set": changed, "append": appends}
+
+
+def mark_checkpointed(session, data=None):
+    """
+    Record the session's current state (or data, the snapshot that was saved)
+    as saved, so the next delta starts from here.
+    """
+    data = data or session.to_dict()
+    session.checkpoint_base = (
+        {key: value for key, value in data.items() if key not in _APPEND_ONLY},
+        len(data["transcript"]),
+        len(data["qa"])
+    )
+
+
+def apply_delta(snapshot, delta):
+    """
+    Apply a delta from take_delta to a to_dict snapshot in place.
+    """
+    snapshot.update(delta["set"])
+    for key, entries in delta["append"].items():
+        snapshot.setdefault(key, []).extend(entries)
+    return snapshot
+
+
+class SQLiteCheckpointStore:
+    """
+    Session checkpoints as an append-only log of deltas in a local SQLite file.
+
+    Loading replays the log; once an interview has more than compact_after
+    deltas they are folded into a single full snapshot.
+    """
+
+    def __init__(self, path, ttl_seconds=7 * 24 * 3600, compact_after=50):
+        self.ttl_seconds = ttl_seconds
+        self.compact_after = compact_after
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        with self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS checkpoints ("
+                "interview_id TEXT, seq INTEGER, delta TEXT, created_at REAL, "
+                "PRIMARY KEY (interview_id, seq))"
+            )
+            self._conn.execute(
+                "DELETE FROM checkpoints WHERE interview_id IN ("
+                "SELECT interview_id FROM checkpoints GROUP BY interview_id HAVING MAX(created_at) <= ?)",
+                (time.time() - ttl_seconds,)
+            )
+
+    def save(self, interview_id, delta):
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT INTO checkpoints (interview_id, seq, delta, created_at) VALUES ("
+                "?, (SELECT COALESCE(MAX(seq), -1) + 1 FROM checkpoints WHERE interview_id = ?), ?, ?)",
+                (interview_id, interview_id, json.dumps(delta), time.time())
+            )
+
+    def load(self, interview_id):
+        with self._lock, self._conn:
+            rows = self._conn.execute(
+                "SELECT seq, delta, created_at FROM checkpoints WHERE interview_id = ? ORDER BY seq",
+                (interview_id,)
+            ).fetchall()
+            if not rows or rows[-1][2] <= time.time() - self.ttl_seconds:
+                return None
+
+            snapshot = {}
+            for _, delta, _ in rows:
+                apply_delta(snapshot, json.loads(delta))
+
+            if len(rows) > self.compact_after:
+                last_seq = rows[-1][0]
+                self._conn.execute(
+                    "DELETE FROM checkpoints WHERE interview_id = ? AND seq < ?", (interview_id, last_seq)
+                )
+                self._conn.execute(
+                    "UPDATE checkpoints SET delta = ? WHERE interview_id = ? AND seq = ?",
+                    (json.dumps({"set": snapshot, "append": {}}), interview_id, last_seq)
+                )
+            return snapshot
+
+
+class MongoCheckpointStore:
+    """
+    Session checkpoints as one MongoDB document per interview.
+
+    Each delta is a single update: $set for changed fields and $push/$each
+    for new transcript and QA entries, so writes stay small as the
+    interview grows. Idle checkpoints are removed by a TTL index on updated_at.
+    """
+
+    def __init__(self, get_collection, ttl_seconds=7 * 24 * 3600):
+        self._get_collection = get_collection
+        self.ttl_seconds = ttl_seconds
+        self._indexed = False
+
+    def _collection(self):
+        collection = self._get_collection()
+        if not self._indexed:
+            collection.create_index("updated_at", expireAfterSeconds=self.ttl_seconds)
+            self._indexed = True
+        return collection
+
+    def save(self, interview_id, delta):
+        update = {"$set": dict(delta["set"], updated_at=datetime.now(timezone.utc))}
+        if delta["append"]:
+            update["$push"] = {key: {"$each": entries} for key, entries in delta["append"].items()}
+        self._collection().update_one({"_id": interview_id}, update, upsert=True)
+
+    def load(self, interview_id):
+        document = self._collection().find_one({"_id": interview_id})
+        if not document:
+            return None
+        document.pop("_id", None)
+        document.pop("updated_at", None)
+        return document
+
+
+_STORE = None
+_STORE_LOCK = threading.Lock()
+
+
+def _build_store(backend):
+    ttl_seconds = int(os.getenv("CHECKPOINT_TTL_SECONDS", str(7 * 24 * 3600)))
+
+    if backend == "mongo":
+        from utils.database import get_database
+        return MongoCheckpointStore(lambda: get_database()["checkpoints"], ttl_seconds=ttl_seconds)
+    return SQLiteCheckpointStore(os.getenv("CHECKPOINT_PATH", "checkpoints.sqlite3"), ttl_seconds=ttl_seconds)
+
+
+def checkpoint_backend():
+    """
+    Return CHECKPOINT_BACKEND: "mongo", "sqlite" or "none".
+
+    Defaults to "mongo" when MONGO_URI is set, so checkpoints outlive the
+    container and reach every replica, and to a local SQLite file otherwise.
+    """
+    default = "mongo" if os.getenv("MONGO_URI") else "sqlite"
+    return os.getenv("CHECKPOINT_BACKEND", default).lower()
+
+
+def get_checkpoint_store():
+    """
+    Return the process-wide checkpoint store, or None when the backend is "none".
+    """
+    global _STORE
+    backend = checkpoint_backend()
+    if backend == "none":
+        return None
+
+    with _STORE_LOCK:
+        if _STORE is None:
+            _STORE = _build_store(backend)
+        return _STORE
+
+
+def save_checkpoint(session):
+    """
+    Write the session's changes since its last checkpoint; failures are logged, not raised.
+
+    A question plan that has landed is folded in first. Safe to call from the
+    plan's thread while the session keeps changing: the snapshot that was
+    saved is what the next delta starts from.
+    """
+    store = get_checkpoint_store()
+    if store is None:
+        return
+    with session.checkpoint_lock:
+        session.merge_question_plan(wait=False)
+        data = session.to_dict()
+        delta = take_delta(session, data)
+        if delta is None:
+            return
+        try:
+            store.save(session.interview_id, delta)
+        except Exception as e:
+            print(f"Error saving checkpoint: {e}")
+            return
+        mark_checkpointed(session, data)
+
+
+def load_checkpoint(interview_id):
+    """
+    Rebuild an InterviewSession from its checkpoint, or return None if there is none.
+    """
+    store = get_checkpoint_store()
+    if store is None or not interview_id:
+        return None
+    try:
+        snapshot = store.load(interview_id)
+        session = InterviewSession.from_dict(snapshot) if snapshot else None
+    except Exception as e:
+        print(f"Error loading checkpoint: {e}")
+        return None
+    if session is None:
+        return None
+
+    mark_checkpointed(session)
+    return session
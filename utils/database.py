@@ -1,23 +1,451 @@
-from pymongo import MongoClient
+from datetime import datetime
+import atexit
+import json
 import os
+import queue
+import threading
+import time
+
+from utils.identity import identity_hashes
+from utils.retention import apply_retention
+from utils.tech_stack import normalize_tech_stack
+from utils.tracing import span
+
+# pymongo and bson are imported on first use to keep them off the app's
+# import path.
+
+# One MongoClient per URI for the whole process; MongoClient is thread-safe
+# and owns its own connection pool.
+_CLIENTS = {}
+_CLIENTS_LOCK = threading.Lock()
+
+_WRITER = None
+_WRITER_LOCK = threading.Lock()
+
+# (keys, options) for every index on the interviews collection. Reviewer
+# queries in utils.reviews page by (timestamp, _id) descending, so each
+# filter index ends with that sort.
+INTERVIEW_INDEXES = (
+    ([("candidate_info.email", 1), ("timestamp", -1), ("_id", -1)], {"name": "email_timestamp_id"}),
+    ([("timestamp", -1), ("_id", -1)], {"name": "timestamp_id"}),
+    ([("candidate_info.desired_position", 1), ("timestamp", -1), ("_id", -1)], {"name": "position_timestamp_id"}),
+    ([("technologies", 1), ("timestamp", -1), ("_id", -1)], {"name": "technologies_timestamp_id"}),
+    ([("identity_hashes", 1), ("timestamp", -1)], {"name": "identity_timestamp"}),
+    # MongoDB deletes each interview once its expires_at passes (see utils.retention)
+    ([("expires_at", 1)], {"name": "expires_at_ttl", "expireAfterSeconds": 0}),
+    ([("retention_hold.until", 1)], {"name": "retention_hold_until", "sparse": True}),
+)
+_INDEXES_READY = False
+
+# Written only when an interview is first saved. A re-save leaves these, and
+# fields added later (evaluation, retention_hold), as they are.
+_INSERT_ONLY_FIELDS = ("timestamp", "expires_at")
+
+
+def _get_mongo_uri():
+    mongo_uri = os.getenv("MONGO_URI")
+    if not mongo_uri:
+        raise ValueError("MONGO_URI is not set in the environment variables.")
+    return mongo_uri
+
+
+def get_client(mongo_uri=None):
+    """
+    Return the cached MongoClient for the URI, creating it on first use.
+
+    Pool limits are read from MONGO_MAX_POOL_SIZE, MONGO_MIN_POOL_SIZE and
+    MONGO_MAX_IDLE_TIME_MS.
+    """
+    mongo_uri = mongo_uri or _get_mongo_uri()
+
+    with _CLIENTS_LOCK:
+        client = _CLIENTS.get(mongo_uri)
+        if client is None:
+            from pymongo import MongoClient
+            client = MongoClient(
+                mongo_uri,
+                maxPoolSize=int(os.getenv("MONGO_MAX_POOL_SIZE", "20")),
+                minPoolSize=int(os.getenv("MONGO_MIN_POOL_SIZE", "0")),
+                maxIdleTimeMS=int(os.getenv("MONGO_MAX_IDLE_TIME_MS", "60000"))
+            )
+            _CLIENTS[mongo_uri] = client
+        return client
+
+
+def register_client(mongo_uri, client):
+    """
+    Use the given client (e.g. a mongomock.MongoClient) for the URI.
+    """
+    with _CLIENTS_LOCK:
+        _CLIENTS[mongo_uri] = client
+
+
+def close_clients():
+    """
+    Close every cached MongoClient.
+    """
+    with _CLIENTS_LOCK:
+        for client in _CLIENTS.values():
+            client.close()
+        _CLIENTS.clear()
+
 
 def get_database():
     """
     Connect to MongoDB and return the database instance.
     """
-    mongo_uri = os.getenv("MONGO_URI")
-    if not mongo_uri:
-        raise ValueError("MONGO_URI is not set in the environment variables.")
-    
-    client = MongoClient(mongo_uri)
+    mongo_uri = _get_mongo_uri()
+    client = get_client(mongo_uri)
     db_name = mongo_uri.split("/")[-1].split("?")[0]  # Extract database name from URI
     return client[db_name]
 
-def save_interview_data(data):
+
+# pymongo error class names worth retrying, matched by name like utils.resilience
+_TRANSIENT_WRITE_ERRORS = {
+    "AutoReconnect", "ConnectionFailure", "NetworkTimeout", "NotPrimaryError",
+    "ServerSelectionTimeoutError", "ExecutionTimeout", "WTimeoutError",
+}
+
+
+def _is_transient_write_error(error):
+    if type(error).__name__ in _TRANSIENT_WRITE_ERRORS:
+        return True
+    has_error_label = getattr(error, "has_error_label", None)
+    return bool(has_error_label and has_error_label("RetryableWriteError"))
+
+
+def _failed_documents(batch, error):
+    # A BulkWriteError lists the operations that failed; anything else failed the whole batch
+    details = getattr(error, "details", None) or {}
+    if details.get("writeErrors"):
+        failed = {write_error["index"] for write_error in details["writeErrors"]}
+        return [document for i, document in enumerate(batch) if i in failed]
+    return batch
+
+
+_DEAD_LETTER_LOCK = threading.Lock()
+
+
+def dead_letter_path():
+    """
+    Return MONGO_DEAD_LETTER_PATH, the JSONL file of interviews the background
+    writer could not save (default failed_interviews.jsonl, "" disables it).
+    """
+    return os.getenv("MONGO_DEAD_LETTER_PATH", "failed_interviews.jsonl")
+
+
+def write_dead_letters(path, entries, max_bytes=50 * 1024 * 1024):
+    """
+    Append entries to the dead-letter file as JSON lines.
+
+    Once the file would grow past max_bytes it is rotated to <path>.1,
+    replacing the previous rotation, so at most about 2 * max_bytes of
+    candidate data is kept on disk.
+    """
+    lines = "".join(json.dumps(entry, default=str) + "\n" for entry in entries)
+    with _DEAD_LETTER_LOCK:
+        try:
+            if max_bytes and os.path.getsize(path) + len(lines.encode("utf-8")) > max_bytes:
+                os.replace(path, f"{path}.1")
+        except FileNotFoundError:
+            pass
+        with open(path, "a", encoding="utf-8") as f:
+            f.write(lines)
+
+
+def purge_dead_letters(path, before, dry_run=False):
+    """
+    Remove dead-letter entries that failed before the given ISO timestamp
+    from the file and its rotation. Returns how many were (or would be) removed.
+
+    Lines that cannot be parsed cannot be replayed either and are removed too.
+    """
+    removed = 0
+    with _DEAD_LETTER_LOCK:
+        for file_path in (path, f"{path}.1"):
+            try:
+                with open(file_path, encoding="utf-8") as f:
+                    lines = f.readlines()
+            except FileNotFoundError:
+                continue
+
+            kept = []
+            for line in lines:
+                try:
+                    failed_at = json.loads(line)["failed_at"]
+                except (ValueError, KeyError, TypeError):
+                    failed_at = None
+                if isinstance(failed_at, str) and failed_at >= before:
+                    kept.append(line)
+            removed += len(lines) - len(kept)
+            if dry_run or len(kept) == len(lines):
+                continue
+            if not kept:
+                os.remove(file_path)
+                continue
+            tmp_path = f"{file_path}.tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                f.writelines(kept)
+            os.replace(tmp_path, file_path)
+    return removed
+
+
+class BackgroundWriter:
+    """
+    Batch interview upserts into bulk_write calls on a daemon thread.
+
+    Documents are buffered in a bounded queue; put() blocks when the queue is
+    full so memory stays bounded if MongoDB falls behind. flush() waits until
+    everything queued so far has been written.
+
+    Transient errors are retried with exponential backoff, resending only
+    the operations that failed. Documents that still cannot be written are
+    appended to dead_letter_path as JSON lines so they can be replayed (see
+    write_dead_letters for the size cap), and counted in stats().
+    """
+
+    def __init__(self, get_collection, max_queue_size=1000, batch_size=50, flush_interval=1.0,
+                 max_retries=3, retry_delay=0.5, dead_letter_path="failed_interviews.jsonl",
+                 dead_letter_max_bytes=50 * 1024 * 1024):
+        self._get_collection = get_collection
+        self._queue = queue.Queue(maxsize=max_queue_size)
+        self._batch_size = batch_size
+        self._flush_interval = flush_interval
+        self._max_retries = max_retries
+        self._retry_delay = retry_delay
+        self._dead_letter_path = dead_letter_path
+        self._dead_letter_max_bytes = dead_letter_max_bytes
+        self._stats = {"written": 0, "retries": 0, "failed": 0}
+        self._stats_lock = threading.Lock()
+        self._stopped = False
+        self._thread = threading.Thread(target=self._run, name="mongo-writer", daemon=True)
+        self._thread.start()
+
+    def put(self, document):
+        if self._stopped:
+            raise RuntimeError("BackgroundWriter is stopped.")
+        self._queue.put(document)
+
+    def flush(self):
+        self._queue.join()
+
+    def stats(self):
+        with self._stats_lock:
+            return dict(self._stats, queued=self._queue.qsize())
+
+    def _count(self, key, n=1):
+        with self._stats_lock:
+            self._stats[key] += n
+
+    def stop(self):
+        if self._stopped:
+            return
+        self._stopped = True
+        self._queue.put(None)
+        self._thread.join()
+
+    def _run(self):
+        while True:
+            batch = []
+            stop = False
+            try:
+                item = self._queue.get(timeout=self._flush_interval)
+            except queue.Empty:
+                continue
+            if item is None:
+                stop = True
+            else:
+                batch.append(item)
+
+            while not stop and len(batch) < self._batch_size:
+                try:
+                    item = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if item is None:
+                    stop = True
+                else:
+                    batch.append(item)
+
+            if batch:
+                self._write(batch)
+            for _ in range(len(batch) + (1 if stop else 0)):
+                self._queue.task_done()
+            if stop:
+                return
+
+    def _write(self, batch):
+        from pymongo import UpdateOne
+        pending = batch
+        for attempt in range(self._max_retries + 1):
+            try:
+                self._get_collection().bulk_write(
+                    [UpdateOne({"_id": d["_id"]}, interview_upsert(d), upsert=True) for d in pending],
+                    ordered=False
+                )
+                self._count("written", len(pending))
+                return
+            except Exception as e:
+                error = e
+                failed = _failed_documents(pending, e)
+                self._count("written", len(pending) - len(failed))
+                pending = failed
+                if not _is_transient_write_error(e) or attempt == self._max_retries:
+                    break
+                self._count("retries")
+                time.sleep(self._retry_delay * (2 ** attempt))
+
+        self._dead_letter(pending, error)
+
+    def _dead_letter(self, documents, error):
+        self._count("failed", len(documents))
+        print(
+            f"Giving up on writing {len(documents)} interview(s) to MongoDB "
+            f"({type(error).__name__}: {error}); saving them to {self._dead_letter_path}"
+        )
+        if not self._dead_letter_path:
+            return
+        failed_at = datetime.now().isoformat()
+        entries = [
+            {"failed_at": failed_at, "error": f"{type(error).__name__}: {error}", "document": document}
+            for document in documents
+        ]
+        try:
+            write_dead_letters(self._dead_letter_path, entries, self._dead_letter_max_bytes)
+        except OSError as e:
+            print(f"Error writing to {self._dead_letter_path}: {e}")
+
+
+def get_interviews_collection():
+    """
+    Return the interviews collection.
+    """
+    return get_database()["interviews"]
+
+
+def ensure_interview_indexes(collection=None):
+    """
+    Create the INTERVIEW_INDEXES on the interviews collection.
+
+    Without a collection argument this runs once per process; create_index
+    is a no-op for indexes that already exist.
+    """
+    global _INDEXES_READY
+    if collection is None:
+        if _INDEXES_READY:
+            return
+        collection = get_interviews_collection()
+        _INDEXES_READY = True
+    for keys, options in INTERVIEW_INDEXES:
+        collection.create_index(keys, **options)
+
+
+def add_search_fields(document):
+    """
+    Add the derived fields queries filter on: "technologies", the candidate's
+    normalized tech stack as a list of canonical names, and "identity_hashes",
+    the hashed email and phone used to recognize repeat applicants.
+    """
+    candidate_info = document.get("candidate_info") or {}
+    document["technologies"] = list(normalize_tech_stack(candidate_info.get("tech_stack") or ""))
+    document["identity_hashes"] = identity_hashes(candidate_info)
+    return document
+
+
+def interview_upsert(document):
+    """
+    Return the update that upserts an interview document without overwriting
+    the _INSERT_ONLY_FIELDS or fields written after its first save.
+    """
+    fields = {key: value for key, value in document.items() if key != "_id"}
+    insert_only = {key: fields.pop(key) for key in _INSERT_ONLY_FIELDS if key in fields}
+    update = {"$set": fields}
+    if insert_only:
+        update["$setOnInsert"] = insert_only
+    return update
+
+
+def get_background_writer():
+    """
+    Return the process-wide background writer, starting it on first use.
+    """
+    global _WRITER
+    with _WRITER_LOCK:
+        if _WRITER is None:
+            _WRITER = BackgroundWriter(
+                get_interviews_collection,
+                max_queue_size=int(os.getenv("MONGO_WRITE_QUEUE_SIZE", "1000")),
+                batch_size=int(os.getenv("MONGO_WRITE_BATCH_SIZE", "50")),
+                flush_interval=float(os.getenv("MONGO_WRITE_FLUSH_INTERVAL", "1.0")),
+                max_retries=int(os.getenv("MONGO_WRITE_RETRIES", "3")),
+                dead_letter_path=dead_letter_path(),
+                dead_letter_max_bytes=int(os.getenv("MONGO_DEAD_LETTER_MAX_BYTES", str(50 * 1024 * 1024)))
+            )
+        return _WRITER
+
+
+def get_writer_stats():
+    """
+    Return the background writer's counters, or {} when it has not started.
+    """
+    writer = _WRITER
+    return writer.stats() if writer is not None else {}
+
+
+def shutdown_background_writer():
+    """
+    Flush pending writes and stop the background writer.
+    """
+    global _WRITER
+    with _WRITER_LOCK:
+        writer, _WRITER = _WRITER, None
+    if writer is not None:
+        writer.stop()
+
+
+atexit.register(shutdown_background_writer)
+
+
+def save_interview_data(data, interview_id=None):
     """
     Save interview data to the MongoDB database.
+
+    The document is upserted under interview_id (a fresh ObjectId when not
+    given), so saving the same interview twice never creates a duplicate,
+    and expires RETENTION_DAYS after its timestamp. A re-save keeps the
+    original timestamp and expiry and any fields written since, such as
+    the evaluation or a retention hold.
+    With MONGO_BACKGROUND_WRITES=true the upsert is queued for the
+    background writer and the id is returned immediately.
+    """
+    document = apply_retention(add_search_fields(dict(data)))
+    if interview_id is None:
+        from bson import ObjectId
+        interview_id = ObjectId()
+    document["_id"] = interview_id
+    ensure_interview_indexes()
+
+    if os.getenv("MONGO_BACKGROUND_WRITES", "false").lower() == "true":
+        with span("db.save", mode="background"):
+            get_background_writer().put(document)
+        return document["_id"]
+
+    with span("db.save", mode="sync"):
+        collection = get_interviews_collection()
+        collection.update_one({"_id": document["_id"]}, interview_upsert(document), upsert=True)
+    return document["_id"]
+
+
+def update_interview(interview_id, update, collection=None):
+    """
+    Apply an update document (e.g. {"$set": ...}) to a saved interview.
+
+    Queued background writes are flushed first so the update cannot run
+    before a pending upsert has created the interview.
     """
-    db = get_database()
-    collection = db["interviews"]  # Collection name
-    result = collection.insert_one(data)
-    return result.inserted_id
\ No newline at end of file
+    writer = _WRITER
+    if writer is not None:
+        writer.flush()
+    if collection is None:
+        collection = get_interviews_collection()
+    return collection.update_one({"_id": interview_id}, update)
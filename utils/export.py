@@ -1,23 +1,49 @@
 from datetime import datetime
 import json
 import streamlit as st
+from utils.checkpoint import save_checkpoint
 from utils.database import save_interview_data
+from utils.identity import remember_interview
+from utils.scoring import submit_scoring
+from utils.session_state import get_session
+
+def build_export_data():
+    """
+    Build the export payload once per session and reuse it afterwards.
+    """
+    session = get_session()
+    if session.export is None:
+        session.export = {
+            "interview_id": session.interview_id,
+            "timestamp": datetime.now().isoformat(),
+            "candidate_info": session.candidate.to_dict(),
+            "technical_interview": session.technical_qa_dicts(),
+            "interview_stage_completed": session.stage
+        }
+    return session.export
 
 def export_candidate_data():
     """
     Export candidate data to JSON format and save it to MongoDB.
+
+    The interview is upserted under the session's interview_id the first time
+    this is called, which also queues its answers for background scoring;
+    later reruns and downloads only serialize locally.
     """
-    export_data = {
-        "timestamp": datetime.now().isoformat(),
-        "candidate_info": st.session_state.candidate_data,
-        "technical_interview": st.session_state.technical_qa,
-        "interview_stage_completed": st.session_state.stage
-    }
-    
-    try:
-        inserted_id = save_interview_data(export_data)
-        st.success(f"Data saved to MongoDB with ID: {inserted_id}")
-    except Exception as e:
-        st.error(f"Failed to save data to MongoDB: {e}")
-    
+    session = get_session()
+    export_data = build_export_data()
+
+    if not session.persisted:
+        try:
+            inserted_id = save_interview_data(export_data, session.interview_id)
+            session.persisted = True
+            # Checkpoint the flag so a refresh after the interview doesn't save and score it again
+            save_checkpoint(session)
+            remember_interview(export_data)
+            st.success(f"Data saved to MongoDB with ID: {inserted_id}")
+            # Grading runs in the background; the candidate never waits for it
+            submit_scoring(session.interview_id, session.candidate.tech_stack, export_data["technical_interview"])
+        except Exception as e:
+            st.error(f"Failed to save data to MongoDB: {e}")
+
     return json.dumps(export_data, indent=2)
\ No newline at end of file
@@ -0,0 +1,85 @@
+import re
+
+from utils.tech_stack import find_technologies
+
+# Every pattern is compiled once at import; each field's filler words are a
+# single alternation so a message is scanned once per field, not once per word.
+_NAME_FILLER_WORDS = frozenset(["the", "is", "i'm", "my", "name", "called", "i", "am"])
+
+_EMAIL_PATTERN = re.compile(r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}')
+_PHONE_PATTERN = re.compile(r'\d{10}')
+_NON_DIGIT_PATTERN = re.compile(r'[^\d]')
+_NUMBER_PATTERN = re.compile(r'\d+')
+_FRESHER_PATTERN = re.compile(r'fresher|fresh graduate|no experience|0 years|just graduated|beginner')
+
+
+def _filler_pattern(words):
+    alternation = "|".join(re.escape(word) for word in sorted(words, key=len, reverse=True))
+    return re.compile(r'\b(?:' + alternation + r')\b')
+
+
+_POSITION_FILLER_PATTERN = _filler_pattern([
+    "i'm", "i am", "applying for", "looking for", "want", "interested in",
+    "position", "role", "job", "as", "a", "an"
+])
+_LOCATION_FILLER_PATTERN = _filler_pattern([
+    "i'm", "i am", "located in", "from", "based in", "live in", "city", "state", "country"
+])
+_TECH_FILLER_PATTERN = re.compile(
+    r"i know|i'm proficient in|i have|experience with|skilled in|expertise in|familiar with|\band\b|,"
+)
+
+
+def extract_field_value_locally(user_message, field_name):
+    """
+        Extract a field value with deterministic rules only; returns None if nothing matched
+    """
+    if field_name == "name":
+        words = user_message.strip().split()
+        if len(words) <= 4 and len(user_message) < 50:
+            relevant_words = [w for w in words if w.lower() not in _NAME_FILLER_WORDS]
+            if relevant_words:
+                return " ".join(relevant_words)
+
+    elif field_name == "email":
+        match = _EMAIL_PATTERN.search(user_message)
+        if match:
+            return match.group(0)
+
+    elif field_name == "phone":
+        match = _PHONE_PATTERN.search(user_message)
+        if match:
+            return match.group(0)
+        phone_with_separators = _NON_DIGIT_PATTERN.sub('', user_message)
+        if len(phone_with_separators) >= 10:
+            return phone_with_separators[:10]
+
+    elif field_name == "years_experience":
+        if _FRESHER_PATTERN.search(user_message.lower()):
+            return 0
+        match = _NUMBER_PATTERN.search(user_message)
+        if match:
+            return int(match.group(0))
+
+    elif field_name == "desired_position":
+        if len(user_message) < 100:
+            cleaned = _POSITION_FILLER_PATTERN.sub('', user_message.lower()).strip()
+            if cleaned and len(cleaned) > 2:
+                return cleaned.title()
+
+    elif field_name == "location":
+        if len(user_message) < 50:
+            cleaned = _LOCATION_FILLER_PATTERN.sub('', user_message.lower()).strip()
+            if cleaned and len(cleaned) > 1:
+                return cleaned.title()
+
+    elif field_name == "tech_stack":
+        if "," in user_message:
+            return user_message.strip()
+        if find_technologies(user_message):
+            cleaned = _TECH_FILLER_PATTERN.sub('', user_message.lower()).strip()
+            if cleaned and len(cleaned) > 2:
+                return cleaned.strip()
+            return user_message.strip()
+
+    return None
@@ -0,0 +1,226 @@
+from collections import OrderedDict
+from datetime import datetime, timedelta
+import hashlib
+import hmac
+import os
+import re
+import threading
+import time
+
+# Candidate fields that identify a person across applications
+IDENTITY_FIELDS = ("email", "phone")
+
+_NON_DIGIT_PATTERN = re.compile(r"\D")
+_WARNED_NO_SECRET = False
+
+
+def normalize_identity(field, value):
+    """
+    Return the canonical form of an email or phone number, or None if it is empty.
+
+    Emails are lowercased with any +tag dropped from the local part; phone
+    numbers keep their last 10 digits, so a country code does not matter.
+    """
+    if value is None:
+        return None
+    if field == "email":
+        local, _, domain = str(value).strip().lower().partition("@")
+        value = f"{local.split('+', 1)[0]}@{domain}" if domain else local
+    elif field == "phone":
+        value = _NON_DIGIT_PATTERN.sub("", str(value))[-10:]
+    else:
+        raise KeyError(field)
+    return value or None
+
+
+def identity_secret():
+    """
+    Return the IDENTITY_HASH_SECRET key as bytes, or None when it is not set.
+
+    Phone numbers have too few digits for a plain hash to hide them, so
+    identities are only hashed with this key; without it duplicate detection
+    is off and no identity hashes are stored.
+    """
+    global _WARNED_NO_SECRET
+    secret = os.getenv("IDENTITY_HASH_SECRET")
+    if secret:
+        return secret.encode("utf-8")
+    if not _WARNED_NO_SECRET:
+        _WARNED_NO_SECRET = True
+        print("IDENTITY_HASH_SECRET is not set; repeat-applicant detection is off.")
+    return None
+
+
+def identity_hash(field, value):
+    """
+    Return the keyed HMAC-SHA256 of a normalized identity, so it can be
+    indexed and cached without storing it in clear, or None if the value is
+    empty or IDENTITY_HASH_SECRET is not set.
+
+    Changing the secret invalidates every stored hash.
+    """
+    normalized = normalize_identity(field, value)
+    if normalized is None:
+        return None
+    secret = identity_secret()
+    if secret is None:
+        return None
+    return hmac.new(secret, f"{field}\0{normalized}".encode("utf-8"), hashlib.sha256).hexdigest()
+
+
+def identity_hashes(candidate_info):
+    """
+    Return the identity hashes of a candidate_info dict.
+    """
+    hashes = (identity_hash(field, candidate_info.get(field)) for field in IDENTITY_FIELDS)
+    return [h for h in hashes if h is not None]
+
+
+class DuplicateIndex:
+    """
+    Recent completed interviews by identity hash: a local LRU cache in front
+    of an indexed MongoDB lookup.
+
+    Hits are served from memory. Misses query the interviews collection once
+    and are cached too, for negative_ttl_seconds, so other processes' new
+    interviews are picked up. Interviews saved by this process are added
+    directly with remember().
+    """
+
+    def __init__(self, get_collection, window_days=30, max_entries=100000, negative_ttl_seconds=60):
+        self._get_collection = get_collection
+        self.window = timedelta(days=window_days)
+        self.max_entries = max_entries
+        self.negative_ttl_seconds = negative_ttl_seconds
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self._stats = {"hits": 0, "misses": 0, "errors": 0}
+
+    def lookup(self, field, value, exclude=None):
+        """
+        Return {"interview_id", "timestamp"} of the newest completed interview
+        in the window for this email or phone, or None.
+        """
+        key = identity_hash(field, value)
+        if key is None:
+            return None
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[1] > time.time():
+                self._entries.move_to_end(key)
+                self._stats["hits"] += 1
+                return self._match(entry[0], exclude)
+            self._stats["misses"] += 1
+
+        try:
+            record = self._query(key)
+        except Exception as e:
+            # Never hold up an application because the lookup failed
+            with self._lock:
+                self._stats["errors"] += 1
+            print(f"Error looking up previous applications: {e}")
+            return None
+        self._store(key, record)
+        return self._match(record, exclude)
+
+    def remember(self, document):
+        """
+        Add a just-saved completed interview document to the cache.
+        """
+        if document.get("interview_stage_completed", 0) < 3:
+            return
+        record = {"interview_id": document["interview_id"], "timestamp": document["timestamp"]}
+        for key in identity_hashes(document.get("candidate_info") or {}):
+            self._store(key, record)
+
+    def stats(self):
+        with self._lock:
+            return dict(self._stats, entries=len(self._entries))
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def _cutoff(self):
+        return (datetime.now() - self.window).isoformat()
+
+    def _match(self, record, exclude):
+        if record is None or record["interview_id"] == exclude or record["timestamp"] < self._cutoff():
+            return None
+        return dict(record)
+
+    def _query(self, key):
+        document = self._get_collection().find_one(
+            {"identity_hashes": key, "interview_stage_completed": {"$gte": 3}, "timestamp": {"$gte": self._cutoff()}},
+            {"_id": 0, "interview_id": 1, "timestamp": 1},
+            sort=[("timestamp", -1)]
+        )
+        if document is None:
+            return None
+        return {"interview_id": document["interview_id"], "timestamp": document["timestamp"]}
+
+    def _store(self, key, record):
+        if record is None:
+            expires_at = time.time() + self.negative_ttl_seconds
+        else:
+            # Positive entries stay until they age out of the window (checked in _match)
+            expires_at = float("inf")
+        with self._lock:
+            self._entries[key] = (record, expires_at)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+
+_INDEX = None
+_INDEX_LOCK = threading.Lock()
+
+
+def duplicate_check_action():
+    """
+    Return DUPLICATE_APPLICANT_ACTION: "block" (default) or "off". Always
+    "off" when IDENTITY_HASH_SECRET is not set.
+
+    A matching email or phone is not proof of identity, so a match only ever
+    closes the new interview; it never reveals the earlier one.
+    """
+    action = os.getenv("DUPLICATE_APPLICANT_ACTION", "block").lower()
+    if action == "off" or identity_secret() is None:
+        return "off"
+    return "block"
+
+
+def get_duplicate_index():
+    """
+    Return the process-wide DuplicateIndex (window: DUPLICATE_WINDOW_DAYS, default 30).
+    """
+    global _INDEX
+    with _INDEX_LOCK:
+        if _INDEX is None:
+            from utils.database import get_interviews_collection
+            _INDEX = DuplicateIndex(
+                get_interviews_collection,
+                window_days=int(os.getenv("DUPLICATE_WINDOW_DAYS", "30")),
+                max_entries=int(os.getenv("DUPLICATE_CACHE_SIZE", "100000")),
+                negative_ttl_seconds=float(os.getenv("DUPLICATE_NEGATIVE_TTL_SECONDS", "60"))
+            )
+        return _INDEX
+
+
+def find_previous_application(field, value, exclude=None):
+    """
+    Return the candidate's recent completed interview for an accepted email
+    or phone, or None when there is none or the check is off.
+    """
+    if field not in IDENTITY_FIELDS or duplicate_check_action() == "off":
+        return None
+    return get_duplicate_index().lookup(field, value, exclude=exclude)
+
+
+def remember_interview(document):
+    """
+    Record a saved interview so this process recognizes the candidate's next application without a query.
+    """
+    if duplicate_check_action() != "off":
+        get_duplicate_index().remember(document)
@@ -0,0 +1,155 @@
+import threading
+import uuid
+
+CANDIDATE_FIELDS = ("name", "email", "phone", "years_experience", "desired_position", "location", "tech_stack")
+
+USER = "user"
+ASSISTANT = "assistant"
+
+
+class CandidateInfo:
+    """
+        The candidate's screening answers, one slot per field (None until provided)
+    """
+
+    __slots__ = CANDIDATE_FIELDS
+
+    def __init__(self, **values):
+        for field in CANDIDATE_FIELDS:
+            setattr(self, field, values.get(field))
+
+    def get(self, field):
+        return getattr(self, field)
+
+    def set(self, field, value):
+        if field not in CANDIDATE_FIELDS:
+            raise KeyError(field)
+        setattr(self, field, value)
+
+    def next_missing(self):
+        """
+            Return the first field that has not been provided yet, or None
+        """
+        for field in CANDIDATE_FIELDS:
+            if getattr(self, field) is None:
+                return field
+        return None
+
+    def collected(self):
+        return sum(1 for field in CANDIDATE_FIELDS if getattr(self, field) is not None)
+
+    def to_dict(self):
+        return {field: getattr(self, field) for field in CANDIDATE_FIELDS}
+
+
+class InterviewSession:
+    """
+        Everything one candidate's interview keeps between Streamlit reruns.
+
+        The transcript and technical QA are lists of tuples rather than dicts,
+        and the candidate's answers live in slots, so a session costs a small
+        fraction of the equivalent loose st.session_state keys. to_dict and
+        from_dict round-trip the durable state; the question-plan future, the
+        cached export and the checkpoint bookkeeping and lock are runtime-only
+        and are not serialized.
+    """
+
+    __slots__ = (
+        "interview_id", "stage", "current_field", "confirmation_pending", "question_count",
+        "current_question", "waiting_for_answer", "candidate", "technical_qa", "transcript",
+        "question_plan", "question_plan_future", "export", "persisted", "checkpoint_base", "checkpoint_lock",
+        "duplicate_of",
+    )
+
+    def __init__(self, interview_id=None):
+        self.interview_id = interview_id or uuid.uuid4().hex
+        self.stage = 1
+        self.current_field = CANDIDATE_FIELDS[0]
+        self.confirmation_pending = False
+        self.question_count = 0
+        self.current_question = None
+        self.waiting_for_answer = False
+        self.candidate = CandidateInfo()
+        # (question_number, question, answer)
+        self.technical_qa = []
+        # (role, content)
+        self.transcript = []
+        self.question_plan = None
+        self.question_plan_future = None
+        self.export = None
+        self.persisted = False
+        # What the checkpoint store already has: (scalar fields, transcript length, QA length)
+        self.checkpoint_base = None
+        # Held while a checkpoint is taken; the question plan's thread checkpoints too
+        self.checkpoint_lock = threading.Lock()
+        # Id of the candidate's earlier completed interview when this one was closed as a repeat
+        self.duplicate_of = None
+
+    def merge_question_plan(self, wait=True):
+        """
+            Fold the prefetched question plan into question_plan once it has landed.
+
+            With wait=False a plan that is still being generated is left alone.
+        """
+        future = self.question_plan_future
+        if future is None or not (wait or future.done()):
+            return
+        plan = dict(self.question_plan or {})
+        plan.update(future.result())
+        self.question_plan = plan
+        self.question_plan_future = None
+
+    def add_message(self, role, content):
+        self.transcript.append((role, content))
+
+    def add_answer(self, question_number, question, answer):
+        self.technical_qa.append((question_number, question, answer))
+
+    def technical_qa_dicts(self):
+        """
+            Return the technical QA in the exported {"question_number", "question", "answer"} form
+        """
+        return [
+            {"question_number": number, "question": question, "answer": answer}
+            for number, question, answer in self.technical_qa
+        ]
+
+    def to_dict(self):
+        """
+            Serialize the durable state into a compact, JSON-compatible dict
+        """
+        return {
+            "id": self.interview_id,
+            "stage": self.stage,
+            "field": self.current_field,
+            "confirming": self.confirmation_pending,
+            "question_count": self.question_count,
+            "question": self.current_question,
+            "waiting": self.waiting_for_answer,
+            "candidate": [getattr(self.candidate, field) for field in CANDIDATE_FIELDS],
+            "qa": [list(entry) for entry in self.technical_qa],
+            "transcript": [list(entry) for entry in self.transcript],
+            "plan": {str(n): q for n, q in (self.question_plan or {}).items()},
+            "persisted": self.persisted,
+            "duplicate": self.duplicate_of,
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        """
+            Rebuild a session from to_dict output
+        """
+        session = cls(data["id"])
+        session.stage = data["stage"]
+        session.current_field = data["field"]
+        session.confirmation_pending = data["confirming"]
+        session.question_count = data["question_count"]
+        session.current_question = data["question"]
+        session.waiting_for_answer = data["waiting"]
+        session.candidate = CandidateInfo(**dict(zip(CANDIDATE_FIELDS, data["candidate"])))
+        session.technical_qa = [tuple(entry) for entry in data["qa"]]
+        session.transcript = [tuple(entry) for entry in data["transcript"]]
+        session.question_plan = {int(n): q for n, q in data["plan"].items()} or None
+        session.persisted = data["persisted"]
+        session.duplicate_of = data.get("duplicate")
+        return session
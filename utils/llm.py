@@ -1,18 +1,98 @@
 import streamlit as st
-from langchain_groq import ChatGroq
 import os
+import threading
 
-def get_llm():
+DEFAULT_MODEL = "meta-llama/llama-prompt-guard-2-86m"
+DEFAULT_TEMPERATURE = 0.7
+
+# langchain_groq and httpx are imported on first use so that importing this
+# module (and everything app.py pulls in) does not slow down a cold start.
+
+# One ChatGroq per (model, temperature, api key), shared by every Streamlit
+# session in the process so keep-alive connections are reused between turns.
+_LLM_POOL = {}
+_LLM_POOL_LOCK = threading.Lock()
+_LLM_POOL_STATS = {"hits": 0, "misses": 0}
+_HTTP_CLIENT = None
+
+
+def _get_http_client():
+    """
+        Return the process-wide HTTP client used by all pooled LLM clients
+    """
+    global _HTTP_CLIENT
+    if _HTTP_CLIENT is None:
+        import httpx
+        _HTTP_CLIENT = httpx.Client(
+            limits=httpx.Limits(
+                max_connections=int(os.getenv("LLM_MAX_CONNECTIONS", "20")),
+                max_keepalive_connections=int(os.getenv("LLM_MAX_KEEPALIVE_CONNECTIONS", "10")),
+                keepalive_expiry=float(os.getenv("LLM_KEEPALIVE_EXPIRY_SECONDS", "60"))
+            )
+        )
+    return _HTTP_CLIENT
+
+
+def _build_llm(model, temperature, api_key):
+    """
+        Create a new ChatGroq client on top of the shared HTTP client
+    """
+    from langchain_groq import ChatGroq
+    return ChatGroq(
+        model=model,
+        temperature=temperature,
+        groq_api_key=api_key,
+        http_client=_get_http_client(),
+        # Retries are handled by utils.resilience so they share one deadline and breaker
+        request_timeout=float(os.getenv("LLM_REQUEST_TIMEOUT_SECONDS", "10")),
+        max_retries=0
+    )
+
+
+def get_llm(model=DEFAULT_MODEL, temperature=DEFAULT_TEMPERATURE):
     """
-        Initialize and return the LLM
+        Return the pooled LLM for the given model and temperature, creating it on first use
     """
     api_key = os.getenv("GROQ_API_KEY")
     if not api_key:
         st.error("API Key not found. Please set it in your environment variables as GROQ_API_KEY.")
         st.stop()
-    
-    return ChatGroq(
-        model="meta-llama/llama-prompt-guard-2-86m",
-        temperature=0.7,
-        groq_api_key=api_key
-    )
+
+    key = (model, temperature, api_key)
+
+    with _LLM_POOL_LOCK:
+        llm = _LLM_POOL.get(key)
+        if llm is not None:
+            _LLM_POOL_STATS["hits"] += 1
+            return llm
+
+        _LLM_POOL_STATS["misses"] += 1
+        llm = _build_llm(model, temperature, api_key)
+        _LLM_POOL[key] = llm
+        return llm
+
+
+def get_llm_pool_stats():
+    """
+        Return pool hit/miss counters and the number of pooled clients
+    """
+    with _LLM_POOL_LOCK:
+        return {
+            "hits": _LLM_POOL_STATS["hits"],
+            "misses": _LLM_POOL_STATS["misses"],
+            "clients": len(_LLM_POOL)
+        }
+
+
+def clear_llm_pool():
+    """
+        Drop all pooled LLM clients and reset the counters
+    """
+    global _HTTP_CLIENT
+    with _LLM_POOL_LOCK:
+        _LLM_POOL.clear()
+        _LLM_POOL_STATS["hits"] = 0
+        _LLM_POOL_STATS["misses"] = 0
+        if _HTTP_CLIENT is not None:
+            _HTTP_CLIENT.close()
+            _HTTP_CLIENT = None
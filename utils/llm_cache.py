@@ -0,0 +1,197 @@
+from collections import OrderedDict
+import hashlib
+import os
+import re
+import sqlite3
+import threading
+import time
+
+from utils.prompt_registry import check_token_budget, record_response_usage
+from utils.resilience import resilient_invoke
+from utils.tracing import record_usage, span
+
+_WHITESPACE = re.compile(r"\s+")
+
+
+def make_cache_key(model, prompt):
+    """
+        Hash the model name and whitespace-normalized prompt into a cache key
+    """
+    normalized = _WHITESPACE.sub(" ", prompt).strip()
+    return hashlib.sha256(f"{model}\0{normalized}".encode("utf-8")).hexdigest()
+
+
+class LLMResponseCache:
+    """
+        Process-wide LRU cache of LLM response texts, bounded by entry count
+        and total bytes, with a TTL per entry and an optional SQLite tier that
+        survives restarts and is shared by processes on the same host.
+
+        The SQLite tier has its own bounds (disk_max_entries, disk_max_bytes):
+        on open and every prune_every writes, expired rows are deleted and then
+        the rows closest to expiry until both bounds hold.
+    """
+
+    def __init__(self, max_entries=10000, max_bytes=16 * 1024 * 1024, ttl_seconds=24 * 3600, disk_path=None,
+                 disk_max_entries=100000, disk_max_bytes=256 * 1024 * 1024, prune_every=100):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl_seconds = ttl_seconds
+        self.disk_max_entries = disk_max_entries
+        self.disk_max_bytes = disk_max_bytes
+        self.prune_every = prune_every
+        self._entries = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self._stats = {"hits": 0, "disk_hits": 0, "misses": 0, "evictions": 0, "disk_pruned": 0}
+        self._disk_writes = 0
+
+        self._disk = None
+        if disk_path:
+            self._disk = sqlite3.connect(disk_path, check_same_thread=False)
+            with self._disk:
+                self._disk.execute(
+                    "CREATE TABLE IF NOT EXISTS llm_cache (key TEXT PRIMARY KEY, value TEXT, expires_at REAL)"
+                )
+                self._disk.execute("CREATE INDEX IF NOT EXISTS llm_cache_expires_at ON llm_cache (expires_at)")
+            with self._lock:
+                self._prune_disk()
+
+    def get(self, key):
+        now = time.time()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                value, expires_at = entry
+                if expires_at > now:
+                    self._entries.move_to_end(key)
+                    self._stats["hits"] += 1
+                    return value
+                self._remove(key)
+
+            if self._disk is not None:
+                row = self._disk.execute(
+                    "SELECT value, expires_at FROM llm_cache WHERE key = ? AND expires_at > ?", (key, now)
+                ).fetchone()
+                if row is not None:
+                    self._store(key, row[0], row[1])
+                    self._stats["disk_hits"] += 1
+                    return row[0]
+
+            self._stats["misses"] += 1
+            return None
+
+    def put(self, key, value):
+        expires_at = time.time() + self.ttl_seconds
+        with self._lock:
+            self._store(key, value, expires_at)
+            if self._disk is not None:
+                with self._disk:
+                    self._disk.execute(
+                        "INSERT OR REPLACE INTO llm_cache (key, value, expires_at) VALUES (?, ?, ?)",
+                        (key, value, expires_at)
+                    )
+                self._disk_writes += 1
+                if self._disk_writes % self.prune_every == 0:
+                    self._prune_disk()
+
+    def _prune_disk(self):
+        # Rows expiring last are kept; expires_at is write time + TTL, so these are the newest
+        with self._disk:
+            pruned = self._disk.execute("DELETE FROM llm_cache WHERE expires_at <= ?", (time.time(),)).rowcount
+            pruned += self._disk.execute(
+                "DELETE FROM llm_cache WHERE key IN ("
+                "SELECT key FROM (SELECT key, ROW_NUMBER() OVER w AS n, "
+                "SUM(LENGTH(CAST(key AS BLOB)) + LENGTH(CAST(value AS BLOB))) OVER w AS total "
+                "FROM llm_cache WINDOW w AS (ORDER BY expires_at DESC, key)) "
+                "WHERE n > ? OR total > ?)",
+                (self.disk_max_entries, self.disk_max_bytes)
+            ).rowcount
+        self._stats["disk_pruned"] += pruned
+
+    def stats(self):
+        with self._lock:
+            lookups = self._stats["hits"] + self._stats["disk_hits"] + self._stats["misses"]
+            return dict(
+                self._stats,
+                entries=len(self._entries),
+                bytes=self._bytes,
+                hit_rate=(self._stats["hits"] + self._stats["disk_hits"]) / lookups if lookups else 0.0
+            )
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+            if self._disk is not None:
+                with self._disk:
+                    self._disk.execute("DELETE FROM llm_cache")
+
+    def _store(self, key, value, expires_at):
+        if key in self._entries:
+            self._remove(key)
+        size = len(key) + len(value.encode("utf-8"))
+        if size > self.max_bytes:
+            return
+        self._entries[key] = (value, expires_at)
+        self._bytes += size
+        while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+            oldest = next(iter(self._entries))
+            self._remove(oldest)
+            self._stats["evictions"] += 1
+
+    def _remove(self, key):
+        value, _ = self._entries.pop(key)
+        self._bytes -= len(key) + len(value.encode("utf-8"))
+
+
+_CACHE = None
+_CACHE_LOCK = threading.Lock()
+
+
+def get_response_cache():
+    """
+        Return the process-wide response cache, or None when LLM_CACHE_ENABLED=false
+    """
+    global _CACHE
+    if os.getenv("LLM_CACHE_ENABLED", "true").lower() != "true":
+        return None
+
+    with _CACHE_LOCK:
+        if _CACHE is None:
+            _CACHE = LLMResponseCache(
+                max_entries=int(os.getenv("LLM_CACHE_MAX_ENTRIES", "10000")),
+                max_bytes=int(os.getenv("LLM_CACHE_MAX_BYTES", str(16 * 1024 * 1024))),
+                ttl_seconds=int(os.getenv("LLM_CACHE_TTL_SECONDS", str(24 * 3600))),
+                disk_path=os.getenv("LLM_CACHE_PATH") or None,
+                disk_max_entries=int(os.getenv("LLM_CACHE_DISK_MAX_ENTRIES", "100000")),
+                disk_max_bytes=int(os.getenv("LLM_CACHE_DISK_MAX_BYTES", str(256 * 1024 * 1024)))
+            )
+        return _CACHE
+
+
+def invoke_prompt(llm, template, use_cache=True, **variables):
+    """
+        Invoke the LLM with a registered prompt template, memoizing the response
+        text and charging the call's tokens to the template and the current interview
+    """
+    model = getattr(llm, "model_name", "")
+    messages = template.messages(**variables)
+    with span(f"llm.{template.name}", model=model) as active:
+        cache = get_response_cache() if use_cache else None
+        key = None
+        if cache is not None:
+            key = make_cache_key(model, "\n".join(m.content for m in messages))
+            cached = cache.get(key)
+            if cached is not None:
+                active.set(cache="hit")
+                return cached
+            active.set(cache="miss")
+
+        check_token_budget()
+        response = resilient_invoke(llm, messages)
+        record_usage(active, response)
+        record_response_usage(template, messages, response)
+        if cache is not None:
+            cache.put(key, response.content)
+        return response.content
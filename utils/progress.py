@@ -1,16 +1,19 @@
 import streamlit as st
 
+from utils.session_state import get_session
+
 def calculate_progress():
     """
         Calculate interview progress percentage
     """
-    if st.session_state.stage == 1:
-        collected = sum([1 for v in st.session_state.candidate_data.values() if v is not None])
+    session = get_session()
+    if session.stage == 1:
+        collected = session.candidate.collected()
         return int((collected / 7) * 40)
-    elif st.session_state.stage == 2:
-        answered = len(st.session_state.technical_qa)
+    elif session.stage == 2:
+        answered = len(session.technical_qa)
         return 40 + int((answered / 5) * 50)
-    elif st.session_state.stage >= 3:
+    elif session.stage >= 3:
         return 100
     return 0
 
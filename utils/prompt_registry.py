@@ -0,0 +1,321 @@
+from collections import OrderedDict
+import contextvars
+import math
+import os
+import re
+import threading
+
+_TOKEN_PATTERN = re.compile(r"\w+|[^\w\s]|\s{2,}")
+_BLANK_LINES = re.compile(r"\n{3,}")
+
+
+def count_tokens(text):
+    """
+        Estimate the token count of text: ~4 characters per token for words and
+        whitespace runs (indentation is billed too), one per punctuation mark
+    """
+    return sum(
+        1 if len(piece) == 1 and not piece.isalnum() else math.ceil(len(piece) / 4)
+        for piece in _TOKEN_PATTERN.findall(text)
+    )
+
+
+def compact(text):
+    """
+        Strip indentation and trailing whitespace from every line and collapse runs of blank lines
+    """
+    lines = [line.strip() for line in text.strip().splitlines()]
+    return _BLANK_LINES.sub("\n\n", "\n".join(lines))
+
+
+class PromptTemplate:
+    """
+        A prompt split into a static prefix and a variable suffix.
+
+        Both parts are compacted once at registration. The prefix is sent as
+        an identical system message on every call so provider-side prompt
+        caching can reuse it; only the short suffix varies per call.
+    """
+
+    __slots__ = ("name", "prefix", "suffix", "prefix_tokens")
+
+    def __init__(self, name, prefix, suffix):
+        self.name = name
+        self.prefix = compact(prefix)
+        self.suffix = compact(suffix)
+        self.prefix_tokens = count_tokens(self.prefix)
+
+    def render_suffix(self, **variables):
+        return self.suffix.format(**variables)
+
+    def messages(self, **variables):
+        from langchain_core.messages import HumanMessage, SystemMessage
+        return [SystemMessage(content=self.prefix), HumanMessage(content=self.render_suffix(**variables))]
+
+
+PROMPTS = {}
+
+
+def register_prompt(name, prefix, suffix):
+    PROMPTS[name] = PromptTemplate(name, prefix, suffix)
+    return PROMPTS[name]
+
+
+register_prompt(
+    "relevance",
+    """
+    You are a recruitment chatbot filter. Determine if the user's message is relevant to a job recruitment screening process.
+
+    A message is RELEVANT if it:
+    - Provides personal information (name, email, phone, experience, position, location, skills)
+    - Answers the current question being asked
+    - Asks clarifying questions about the job or interview process
+    - Expresses willingness to continue or provides acknowledgments
+    - Requests to update previously provided information
+
+    A message is IRRELEVANT if it:
+    - Asks general knowledge questions (capitals, math problems, trivia, science facts)
+    - Requests unrelated tasks (writing stories, translating text, jokes)
+    - Contains off-topic conversation
+    - Asks about unrelated topics (weather, sports, entertainment)
+
+    Respond with ONLY one word: RELEVANT or IRRELEVANT
+    """,
+    """
+    User message: "{user_message}"
+    Context: {context}
+    """
+)
+
+register_prompt(
+    "update_detection",
+    """
+    Analyze if the user wants to UPDATE previously provided information.
+    Available fields: name, email, phone, years_experience, desired_position, location, tech_stack
+
+    Determine:
+    1. Does the user want to update something? (yes/no)
+    2. If yes, which field? (use exact field names above)
+    3. If yes, what's the new value?
+
+    Return ONLY a JSON object:
+    {"wants_update": true/false, "field": "field_name or null", "new_value": "value or null"}
+
+    Examples:
+    - "update email to john@example.com" -> {"wants_update": true, "field": "email", "new_value": "john@example.com"}
+    - "change my phone number to 1234567890" -> {"wants_update": true, "field": "phone", "new_value": "1234567890"}
+    - "no" or "looks good" -> {"wants_update": false, "field": null, "new_value": null}
+    """,
+    """
+    User message: "{user_message}"
+    """
+)
+
+register_prompt(
+    "extraction",
+    """
+    Extract the requested information from the user's message.
+
+    Rules:
+    - If the information is clearly present, extract it
+    - For years of experience: "fresher", "fresh graduate", "no experience" or "0" mean 0
+    - For a tech stack: give comma-separated values
+    - If the information is NOT present or unclear, return null
+
+    Return ONLY a JSON object with this format: {"value": <extracted_value>}
+    Examples: {"value": "John Doe"}, {"value": 3}, {"value": "Python, Django, React"}, {"value": null}
+    """,
+    """
+    Extract: {field_description}
+    User message: "{user_message}"
+    """
+)
+
+register_prompt(
+    "turn_understanding",
+    """
+    You are the input parser for a recruitment screening chatbot.
+    Fields: name, email, phone, years_experience, desired_position, location, tech_stack
+
+    Determine:
+    1. relevant: is the message relevant to the screening (answers, acknowledgements, updates, questions about the job)? Trivia, jokes, weather, unrelated tasks are NOT relevant.
+    2. intent: "answer" (provides the requested field), "update" (changes a previously given field) or "confirm" (accepts the details / wants to continue)
+    3. field: the field being answered or updated, or null
+    4. value: the extracted value for that field, or null. Use 0 for fresh graduates; give tech_stack as comma-separated values.
+
+    Return ONLY a JSON object:
+    {"relevant": true/false, "intent": "answer|update|confirm", "field": "field_name or null", "value": "value or null"}
+    """,
+    """
+    Context: {context}
+    {expected}
+    User message: "{user_message}"
+    """
+)
+
+register_prompt(
+    "technical_question",
+    """
+    You are a technical interviewer. Generate a single, clear technical interview question for a candidate.
+
+    Generate a question that:
+    - Tests practical knowledge of their stated technologies
+    - Is appropriate for their tech stack
+    - Varies in difficulty (mix of fundamental and advanced topics)
+    - Is specific and clear
+
+    Return ONLY the question, no additional text or numbering.
+    """,
+    """
+    Candidate's Tech Stack: {tech_stack}
+    Question Number: {question_number} of 5
+    """
+)
+
+register_prompt(
+    "technical_questions",
+    """
+    You are a technical interviewer. Generate distinct, clear technical interview questions for a candidate.
+
+    The questions should:
+    - Test practical knowledge of their stated technologies
+    - Cover different topics, progressing from fundamental to advanced
+    - Be specific and clear
+
+    Return ONLY a JSON array of strings, one question per element, with no numbering.
+    """,
+    """
+    Candidate's Tech Stack: {tech_stack}
+    Number of questions: {count}
+    """
+)
+
+register_prompt(
+    "answer_scoring",
+    """
+    You are a senior technical interviewer grading a candidate's written answers.
+
+    Score every answer from 0 to 10 on each criterion:
+    - correctness: is it technically accurate?
+    - depth: does it show practical understanding beyond definitions?
+    - clarity: is it clearly explained?
+    An empty, evasive or off-topic answer scores 0 on every criterion.
+
+    Return ONLY a JSON array with one object per answer:
+    [{"question_number": 1, "correctness": 0-10, "depth": 0-10, "clarity": 0-10, "feedback": "one sentence"}]
+    """,
+    """
+    Candidate's Tech Stack: {tech_stack}
+    Answers: {answers}
+    """
+)
+
+
+class TokenBudgetExceeded(RuntimeError):
+    """
+        Raised instead of calling the LLM once an interview has used its token budget
+    """
+
+
+_current_interview = contextvars.ContextVar("prompt_interview", default=None)
+
+_TEMPLATE_USAGE = {}
+_INTERVIEW_USAGE = OrderedDict()
+_MAX_TRACKED_INTERVIEWS = 10000
+_USAGE_LOCK = threading.Lock()
+
+
+class _InterviewScope:
+    __slots__ = ("interview_id", "token")
+
+    def __init__(self, interview_id):
+        self.interview_id = interview_id
+        self.token = None
+
+    def __enter__(self):
+        self.token = _current_interview.set(self.interview_id)
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        _current_interview.reset(self.token)
+        return False
+
+
+def interview_scope(interview_id):
+    """
+        Attribute LLM token usage inside the block to the given interview
+    """
+    return _InterviewScope(interview_id)
+
+
+def over_token_budget():
+    """
+        Whether the current interview has used its LLM_TOKEN_BUDGET_PER_INTERVIEW (0 = no cap)
+    """
+    budget = int(os.getenv("LLM_TOKEN_BUDGET_PER_INTERVIEW", "0"))
+    interview_id = _current_interview.get()
+    if not budget or interview_id is None:
+        return False
+    with _USAGE_LOCK:
+        used = _INTERVIEW_USAGE.get(interview_id, {}).get("total_tokens", 0)
+    return used >= budget
+
+
+def check_token_budget():
+    """
+        Raise TokenBudgetExceeded if the current interview is over its token budget
+    """
+    if over_token_budget():
+        raise TokenBudgetExceeded(f"Interview {_current_interview.get()} is over its LLM token budget.")
+
+
+def record_prompt_usage(template, prompt_tokens, response_tokens):
+    """
+        Add one call's token counts to the template's and the current interview's totals
+    """
+    interview_id = _current_interview.get()
+    with _USAGE_LOCK:
+        usage = _TEMPLATE_USAGE.setdefault(template.name, {"calls": 0, "prompt_tokens": 0, "response_tokens": 0})
+        usage["calls"] += 1
+        usage["prompt_tokens"] += prompt_tokens
+        usage["response_tokens"] += response_tokens
+
+        if interview_id is not None:
+            totals = _INTERVIEW_USAGE.pop(interview_id, {"calls": 0, "total_tokens": 0})
+            totals["calls"] += 1
+            totals["total_tokens"] += prompt_tokens + response_tokens
+            _INTERVIEW_USAGE[interview_id] = totals
+            while len(_INTERVIEW_USAGE) > _MAX_TRACKED_INTERVIEWS:
+                _INTERVIEW_USAGE.popitem(last=False)
+
+
+def record_response_usage(template, messages, response):
+    """
+        Record a response's token usage, estimating any counts the provider did not report
+    """
+    usage = getattr(response, "usage_metadata", None) or {}
+    prompt_tokens = usage.get("input_tokens") or count_tokens("\n".join(m.content for m in messages))
+    response_tokens = usage.get("output_tokens") or count_tokens(response.content)
+    record_prompt_usage(template, prompt_tokens, response_tokens)
+
+
+def get_prompt_stats():
+    """
+        Return static prefix size and accumulated usage per template
+    """
+    with _USAGE_LOCK:
+        return {
+            name: dict(
+                _TEMPLATE_USAGE.get(name, {"calls": 0, "prompt_tokens": 0, "response_tokens": 0}),
+                prefix_tokens=template.prefix_tokens
+            )
+            for name, template in PROMPTS.items()
+        }
+
+
+def get_interview_usage(interview_id):
+    """
+        Return the LLM calls and tokens recorded for an interview so far
+    """
+    with _USAGE_LOCK:
+        return dict(_INTERVIEW_USAGE.get(interview_id, {"calls": 0, "total_tokens": 0}))
@@ -1,7 +1,13 @@
-import streamlit as st
-from langchain_core.messages import SystemMessage
+import json
+import time
 
 from utils.llm import get_llm
+from utils.session_state import get_session
+from utils.prompt_registry import (
+    PROMPTS, check_token_budget, count_tokens, over_token_budget, record_prompt_usage, record_response_usage
+)
+from utils.resilience import LLM_BREAKER, llm_slot, resilient_invoke
+from utils.tracing import record_usage, span
 
 FIELD_PROMPTS = {
     "name": "What's your full name?",
@@ -57,42 +63,126 @@ def generate_confirmation_prompt():
         You can say something like:
             - "Update email to newemail@example.com"
             - "Change phone to 9876543210"
-            - Or simply say "No" or "Looks good" to continue to the technical interview.""".format(**st.session_state.candidate_data)
+            - Or simply say "No" or "Looks good" to continue to the technical interview.""".format(**get_session().candidate.to_dict())
     
     return confirmation
 
 
-def generate_technical_question(tech_stack, question_number):
+def get_fallback_question(tech_stack, question_number):
     """
-    Generate a technical question based on the candidate's tech stack
+        Return the canned question used when the LLM cannot produce one
+    """
+    fallback_questions = [
+        f"Can you explain a challenging problem you've solved using {tech_stack.split(',')[0].strip()}?",
+        f"What are the key principles you follow when designing scalable applications?",
+        f"How do you approach debugging complex issues in production?",
+        f"Describe your experience with version control and collaboration workflows.",
+        f"What testing strategies do you implement in your projects?"
+    ]
+    return fallback_questions[(question_number - 1) % len(fallback_questions)]
+
+
+def request_technical_question(tech_stack, question_number):
+    """
+        Ask the LLM for a single technical question; errors are raised to the caller
     """
     llm = get_llm()
     
-    prompt = f"""You are a technical interviewer. Generate a single, clear technical interview question for a candidate.
+    template = PROMPTS["technical_question"]
+    messages = template.messages(tech_stack=tech_stack, question_number=question_number)
+    
+    with span("llm.question", model=llm.model_name, question_number=question_number) as active:
+        check_token_budget()
+        response = resilient_invoke(llm, messages)
+        record_usage(active, response)
+        record_response_usage(template, messages, response)
+    question = response.content.strip()
+    if not question:
+        raise ValueError("LLM returned an empty question.")
+    return question
+
+
+def request_technical_questions(tech_stack, count):
+    """
+        Ask the LLM for several distinct technical questions in one structured call
+    """
+    llm = get_llm()
 
-Candidate's Tech Stack: {tech_stack}
-Question Number: {question_number} of 5
+    template = PROMPTS["technical_questions"]
+    messages = template.messages(tech_stack=tech_stack, count=count)
 
-Generate a question that:
-- Tests practical knowledge of their stated technologies
-- Is appropriate for their tech stack
-- Varies in difficulty (mix of fundamental and advanced topics)
-- Is specific and clear
+    with span("llm.question_batch", model=llm.model_name, count=count) as active:
+        check_token_budget()
+        response = resilient_invoke(llm, messages)
+        record_usage(active, response)
+        record_response_usage(template, messages, response)
+    content = response.content.strip()
 
-Return ONLY the question, no additional text or numbering."""
-    
+    start, end = content.find("["), content.rfind("]")
+    if start == -1 or end < start:
+        raise ValueError("LLM response did not contain a JSON array.")
+
+    questions = json.loads(content[start:end + 1])
+    if not isinstance(questions, list):
+        raise ValueError("LLM response was not a JSON array.")
+
+    return [q.strip() if isinstance(q, str) and q.strip() else None for q in questions[:count]]
+
+
+def generate_technical_question(tech_stack, question_number):
+    """
+    Generate a technical question based on the candidate's tech stack
+    """
     try:
-        response = llm.invoke([SystemMessage(content=prompt)])
-        return response.content.strip()
+        return request_technical_question(tech_stack, question_number)
     except Exception as e:
-        fallback_questions = [
-            f"Can you explain a challenging problem you've solved using {tech_stack.split(',')[0].strip()}?",
-            f"What are the key principles you follow when designing scalable applications?",
-            f"How do you approach debugging complex issues in production?",
-            f"Describe your experience with version control and collaboration workflows.",
-            f"What testing strategies do you implement in your projects?"
-        ]
-        return fallback_questions[question_number - 1]
+        return get_fallback_question(tech_stack, question_number)
+
+
+def stream_technical_question(tech_stack, question_number):
+    """
+        Stream a technical question token by token, yielding the fallback question if nothing arrives
+    """
+    produced = []
+    with span("llm.question_stream", question_number=question_number) as active:
+        started = time.perf_counter()
+        if over_token_budget():
+            active.set(budget="exceeded")
+        elif not LLM_BREAKER.allow():
+            active.set(breaker="open")
+        else:
+            finished = False
+            try:
+                llm = get_llm()
+                template = PROMPTS["technical_question"]
+                messages = template.messages(tech_stack=tech_stack, question_number=question_number)
+                with llm_slot():
+                    for chunk in llm.stream(messages):
+                        if chunk.content:
+                            if not produced:
+                                active.set(model=llm.model_name, ttft_ms=(time.perf_counter() - started) * 1000)
+                            produced.append(chunk.content)
+                            yield chunk.content
+                finished = True
+                LLM_BREAKER.record_success()
+                # Streamed chunks carry no usage metadata, so both sides are estimated
+                record_prompt_usage(
+                    template,
+                    count_tokens("\n".join(m.content for m in messages)),
+                    count_tokens("".join(produced))
+                )
+            except Exception as e:
+                finished = True
+                LLM_BREAKER.record_failure()
+                active.set(error=f"{type(e).__name__}: {e}")
+                print(f"Error streaming question {question_number}: {e}")
+            finally:
+                if not finished:
+                    # Abandoned mid-stream (GeneratorExit): free a half-open trial
+                    LLM_BREAKER.release_trial()
+
+    if not produced:
+        yield get_fallback_question(tech_stack, question_number)
 
 
 def generate_irrelevant_response():
@@ -108,15 +198,16 @@ def generate_irrelevant_response():
     import random
     base_response = random.choice(responses)
     
-    if st.session_state.stage == 1:
-        if st.session_state.confirmation_pending:
+    session = get_session()
+    if session.stage == 1:
+        if session.confirmation_pending:
             return base_response + "Please let me know if you'd like to update any information (e.g., 'update email to john@example.com') or say 'no' to continue."
         else:
-            current_field = st.session_state.current_field
+            current_field = session.current_field
             field_name = current_field.replace("_", " ")
             return base_response + f"Let's continue - I need your {field_name}."
-    elif st.session_state.stage == 2:
-        return base_response + f"Please answer the current technical question (Question {st.session_state.question_count}/5)."
+    elif session.stage == 2:
+        return base_response + f"Please answer the current technical question (Question {session.question_count}/5)."
     
     return base_response + "Let's get back to the interview."
 
@@ -125,13 +216,14 @@ def generate_conclusion():
     """
         Generate conclusion message
     """
+    candidate = get_session().candidate
     conclusion = f""" **Interview Complete!**
 
-Thank you, {st.session_state.candidate_data['name']}, for taking the time to complete our screening process!
+Thank you, {candidate.name}, for taking the time to complete our screening process!
 
 **Next Steps:**
 1. Our team will review your responses within 2-3 business days
-2. You'll receive an email at **{st.session_state.candidate_data['email']}** with our decision
+2. You'll receive an email at **{candidate.email}** with our decision
 3. If selected, we'll schedule a follow-up interview with our technical team
 
 **What to Expect:**
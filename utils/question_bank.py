@@ -0,0 +1,267 @@
+from collections import OrderedDict
+from datetime import datetime, timezone
+import hashlib
+import os
+import random
+import sqlite3
+import threading
+import time
+
+from utils.tech_stack import normalize_tech_stack
+
+
+def stack_key(technologies):
+    """
+    Content-address a normalized tech stack.
+    """
+    return hashlib.sha256("|".join(technologies).encode("utf-8")).hexdigest()
+
+
+class MemoryQuestionStore:
+    """
+    In-process question pools with LRU eviction over keys and a per-question TTL.
+    """
+
+    def __init__(self, max_keys=1000, ttl_seconds=7 * 24 * 3600, max_questions_per_key=50):
+        self.max_keys = max_keys
+        self.ttl_seconds = ttl_seconds
+        self.max_questions_per_key = max_questions_per_key
+        self._pools = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        cutoff = time.time() - self.ttl_seconds
+        with self._lock:
+            pool = self._pools.get(key)
+            if pool is None:
+                return []
+            pool = [(text, created) for text, created in pool if created > cutoff]
+            if not pool:
+                del self._pools[key]
+                return []
+            self._pools[key] = pool
+            self._pools.move_to_end(key)
+            return [text for text, _ in pool]
+
+    def add(self, key, technologies, questions):
+        now = time.time()
+        with self._lock:
+            pool = self._pools.pop(key, [])
+            known = {text for text, _ in pool}
+            pool.extend((q, now) for q in questions if q not in known)
+            self._pools[key] = pool[-self.max_questions_per_key:]
+            while len(self._pools) > self.max_keys:
+                self._pools.popitem(last=False)
+
+
+class SQLiteQuestionStore:
+    """
+    Question pools in a local SQLite file, shared by processes on one host.
+    """
+
+    def __init__(self, path, max_keys=10000, ttl_seconds=7 * 24 * 3600, max_questions_per_key=50):
+        self.max_keys = max_keys
+        self.ttl_seconds = ttl_seconds
+        self.max_questions_per_key = max_questions_per_key
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        with self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS question_bank_keys ("
+                "key TEXT PRIMARY KEY, technologies TEXT, last_used REAL)"
+            )
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS question_bank ("
+                "key TEXT, question TEXT, created_at REAL, PRIMARY KEY (key, question))"
+            )
+
+    def get(self, key):
+        now = time.time()
+        with self._lock, self._conn:
+            self._conn.execute(
+                "DELETE FROM question_bank WHERE key = ? AND created_at <= ?",
+                (key, now - self.ttl_seconds)
+            )
+            rows = self._conn.execute(
+                "SELECT question FROM question_bank WHERE key = ?", (key,)
+            ).fetchall()
+            if rows:
+                self._conn.execute(
+                    "UPDATE question_bank_keys SET last_used = ? WHERE key = ?", (now, key)
+                )
+            return [row[0] for row in rows]
+
+    def add(self, key, technologies, questions):
+        now = time.time()
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT INTO question_bank_keys (key, technologies, last_used) VALUES (?, ?, ?) "
+                "ON CONFLICT(key) DO UPDATE SET last_used = excluded.last_used",
+                (key, ",".join(technologies), now)
+            )
+            self._conn.executemany(
+                "INSERT OR IGNORE INTO question_bank (key, question, created_at) VALUES (?, ?, ?)",
+                [(key, q, now) for q in questions]
+            )
+            self._conn.execute(
+                "DELETE FROM question_bank WHERE key = ? AND question NOT IN ("
+                "SELECT question FROM question_bank WHERE key = ? ORDER BY created_at DESC LIMIT ?)",
+                (key, key, self.max_questions_per_key)
+            )
+            evicted = self._conn.execute(
+                "SELECT key FROM question_bank_keys ORDER BY last_used DESC LIMIT -1 OFFSET ?",
+                (self.max_keys,)
+            ).fetchall()
+            if evicted:
+                self._conn.executemany("DELETE FROM question_bank WHERE key = ?", evicted)
+                self._conn.executemany("DELETE FROM question_bank_keys WHERE key = ?", evicted)
+
+
+class MongoQuestionStore:
+    """
+    Question pools in a MongoDB collection, shared by every replica.
+
+    Keys that go unused for ttl_seconds are removed by a TTL index on
+    last_used; individual questions expire on read.
+    """
+
+    def __init__(self, get_collection, ttl_seconds=7 * 24 * 3600, max_questions_per_key=50):
+        self._get_collection = get_collection
+        self.ttl_seconds = ttl_seconds
+        self.max_questions_per_key = max_questions_per_key
+        self._indexed = False
+
+    def _collection(self):
+        collection = self._get_collection()
+        if not self._indexed:
+            collection.create_index("last_used", expireAfterSeconds=self.ttl_seconds)
+            self._indexed = True
+        return collection
+
+    def get(self, key):
+        now = datetime.now(timezone.utc)
+        document = self._collection().find_one_and_update(
+            {"_id": key}, {"$set": {"last_used": now}}
+        )
+        if not document:
+            return []
+        cutoff = now.timestamp() - self.ttl_seconds
+        return [q["text"] for q in document.get("questions", []) if q["created_at"] > cutoff]
+
+    def add(self, key, technologies, questions):
+        now = datetime.now(timezone.utc)
+        collection = self._collection()
+        existing = collection.find_one({"_id": key}, {"questions.text": 1}) or {}
+        known = {q["text"] for q in existing.get("questions", [])}
+        new_questions = [{"text": q, "created_at": now.timestamp()} for q in questions if q not in known]
+        collection.update_one(
+            {"_id": key},
+            {
+                "$set": {"technologies": list(technologies), "last_used": now},
+                "$push": {"questions": {"$each": new_questions, "$slice": -self.max_questions_per_key}}
+            },
+            upsert=True
+        )
+
+
+class QuestionBank:
+    """
+    Reuse generated questions across candidates with the same normalized stack.
+
+    A pool is only served once it holds at least min_pool_size questions, and
+    each candidate gets a sample drawn without replacement, so early
+    candidates grow the pool and later ones still see variety.
+    """
+
+    def __init__(self, store, min_pool_size=15):
+        self.store = store
+        self.min_pool_size = min_pool_size
+        self._stats = {"hits": 0, "misses": 0}
+        self._lock = threading.Lock()
+
+    def take(self, tech_stack, count):
+        """
+        Return up to count distinct banked questions for the stack.
+        """
+        technologies = normalize_tech_stack(tech_stack)
+        if not technologies:
+            return []
+
+        try:
+            pool = self.store.get(stack_key(technologies))
+        except Exception as e:
+            print(f"Error reading question bank: {e}")
+            pool = []
+
+        if len(pool) < self.min_pool_size:
+            self._record(hits=0, misses=count)
+            return []
+
+        questions = random.sample(pool, min(count, len(pool)))
+        self._record(hits=len(questions), misses=count - len(questions))
+        return questions
+
+    def add(self, tech_stack, questions):
+        """
+        Add freshly generated questions to the stack's pool.
+        """
+        technologies = normalize_tech_stack(tech_stack)
+        questions = [q for q in questions if q]
+        if not technologies or not questions:
+            return
+        try:
+            self.store.add(stack_key(technologies), technologies, questions)
+        except Exception as e:
+            print(f"Error writing question bank: {e}")
+
+    def stats(self):
+        with self._lock:
+            total = self._stats["hits"] + self._stats["misses"]
+            return {
+                "hits": self._stats["hits"],
+                "misses": self._stats["misses"],
+                "hit_rate": self._stats["hits"] / total if total else 0.0
+            }
+
+    def _record(self, hits, misses):
+        with self._lock:
+            self._stats["hits"] += hits
+            self._stats["misses"] += misses
+
+
+_BANK = None
+_BANK_LOCK = threading.Lock()
+
+
+def _build_store(backend):
+    ttl_seconds = int(os.getenv("QUESTION_BANK_TTL_SECONDS", str(7 * 24 * 3600)))
+    max_keys = int(os.getenv("QUESTION_BANK_MAX_KEYS", "1000"))
+
+    if backend == "sqlite":
+        return SQLiteQuestionStore(
+            os.getenv("QUESTION_BANK_PATH", "question_bank.sqlite3"),
+            max_keys=max_keys,
+            ttl_seconds=ttl_seconds
+        )
+    if backend == "mongo":
+        from utils.database import get_database
+        return MongoQuestionStore(lambda: get_database()["question_bank"], ttl_seconds=ttl_seconds)
+    return MemoryQuestionStore(max_keys=max_keys, ttl_seconds=ttl_seconds)
+
+
+def get_question_bank():
+    """
+    Return the process-wide question bank, or None when QUESTION_BANK_BACKEND=none.
+    """
+    global _BANK
+    backend = os.getenv("QUESTION_BANK_BACKEND", "memory").lower()
+    if backend == "none":
+        return None
+
+    with _BANK_LOCK:
+        if _BANK is None:
+            _BANK = QuestionBank(
+                _build_store(backend),
+                min_pool_size=int(os.getenv("QUESTION_BANK_MIN_POOL_SIZE", "15"))
+            )
+        return _BANK
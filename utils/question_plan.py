@@ -0,0 +1,101 @@
+from concurrent.futures import ThreadPoolExecutor
+import os
+
+from utils.question_bank import get_question_bank
+from utils.tracing import span, submit_with_context
+from utils.prompts import get_fallback_question, request_technical_question, request_technical_questions
+
+TOTAL_QUESTIONS = 5
+
+# Shared by all sessions; each plan submits at most TOTAL_QUESTIONS jobs.
+_EXECUTOR = ThreadPoolExecutor(
+    max_workers=int(os.getenv("QUESTION_PLAN_WORKERS", "10")),
+    thread_name_prefix="question-plan"
+)
+
+
+# Background plans get their own pool: they fan out onto _EXECUTOR, and
+# waiting on it from one of its own workers could deadlock.
+_PREFETCH_EXECUTOR = ThreadPoolExecutor(
+    max_workers=int(os.getenv("QUESTION_PREFETCH_WORKERS", "4")),
+    thread_name_prefix="question-prefetch"
+)
+
+
+def _generate_parallel(tech_stack, question_numbers):
+    """
+        Generate one question per slot concurrently; failed slots come back as None
+    """
+    futures = {
+        number: submit_with_context(_EXECUTOR, request_technical_question, tech_stack, number)
+        for number in question_numbers
+    }
+
+    questions = {}
+    for number, future in futures.items():
+        try:
+            questions[number] = future.result()
+        except Exception as e:
+            print(f"Error generating question {number}: {e}")
+            questions[number] = None
+    return questions
+
+
+def _generate_batch(tech_stack, question_numbers):
+    """
+        Generate every slot with a single structured LLM call
+    """
+    try:
+        generated = request_technical_questions(tech_stack, len(question_numbers))
+    except Exception as e:
+        print(f"Error generating question batch: {e}")
+        generated = []
+
+    return {
+        number: generated[i] if i < len(generated) else None
+        for i, number in enumerate(question_numbers)
+    }
+
+
+def build_question_plan(tech_stack, question_numbers=None, mode=None):
+    """
+        Generate the technical questions for a candidate up front.
+
+        mode is "parallel" (one concurrent call per question) or "batch" (one
+        structured call for all of them); it defaults to QUESTION_PLAN_MODE.
+        Slots are served from the question bank when it has a large enough
+        pool for the normalized stack; only the rest reach the LLM, and what
+        it produces is added back to the bank.
+        Returns a dict of question number to question text. Only slots the
+        LLM failed to produce fall back to the canned questions.
+    """
+    question_numbers = list(question_numbers or range(1, TOTAL_QUESTIONS + 1))
+    mode = mode or os.getenv("QUESTION_PLAN_MODE", "parallel")
+
+    with span("question_plan", mode=mode, slots=len(question_numbers)) as active:
+        bank = get_question_bank()
+        banked = bank.take(tech_stack, len(question_numbers)) if bank else []
+        questions = dict(zip(question_numbers, banked))
+        missing = question_numbers[len(banked):]
+        active.set(banked=len(banked))
+
+        if missing:
+            if mode == "batch":
+                generated = _generate_batch(tech_stack, missing)
+            else:
+                generated = _generate_parallel(tech_stack, missing)
+            questions.update(generated)
+            if bank:
+                bank.add(tech_stack, generated.values())
+
+    return {
+        number: question or get_fallback_question(tech_stack, number)
+        for number, question in questions.items()
+    }
+
+
+def prefetch_question_plan(tech_stack, question_numbers=None, mode=None):
+    """
+        Build the question plan in the background; returns a Future of the plan dict
+    """
+    return submit_with_context(_PREFETCH_EXECUTOR, build_question_plan, tech_stack, question_numbers, mode)
@@ -0,0 +1,139 @@
+import math
+import os
+import re
+import threading
+
+from utils.tech_stack import TECH_ALIASES
+from utils.tracing import span
+
+RELEVANT = "RELEVANT"
+IRRELEVANT = "IRRELEVANT"
+
+_ACKNOWLEDGEMENTS = {
+    "yes", "y", "yeah", "yep", "yup", "sure", "ok", "okay", "k", "fine", "done",
+    "no", "n", "nope", "nah", "no thanks", "no changes", "nothing", "none",
+    "looks good", "all good", "looks fine", "looks correct", "correct", "right",
+    "that's right", "thats right", "that's correct", "perfect", "great", "good",
+    "continue", "proceed", "next", "go ahead", "let's go", "lets go", "let's continue",
+    "i don't know", "i dont know", "not sure", "skip", "pass", "fresher", "thanks", "thank you",
+}
+
+_EMAIL = re.compile(r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$")
+_PHONE = re.compile(r"^\+?[\d\s().-]{10,18}$")
+_NUMBER = re.compile(r"^\d{1,2}(?:\s*\+)?(?:\s*(?:years?|yrs?))?$")
+_TOKEN = re.compile(r"[a-z0-9#+.']+")
+
+# Uni/bi/trigram weights; positive leans RELEVANT, negative IRRELEVANT.
+# Negative terms must be unambiguous: words like "match", "score" or
+# "write a" turn up in ordinary technical answers.
+_TERM_WEIGHTS = {
+    "experience": 2.0, "years": 1.5, "year": 1.5, "developer": 2.0, "engineer": 2.0,
+    "engineering": 1.5, "intern": 1.5, "graduate": 1.5, "position": 2.0, "role": 1.5,
+    "job": 1.0, "interview": 2.0, "skills": 2.0, "stack": 1.5, "frameworks": 1.5,
+    "framework": 1.5, "database": 1.5, "backend": 2.0, "frontend": 2.0, "fullstack": 2.0,
+    "scientist": 1.5, "analyst": 1.5, "architect": 1.5, "devops": 2.0, "located": 2.0,
+    "based": 1.0, "live": 0.5, "email": 2.0, "phone": 2.0, "number": 0.5, "name": 1.5,
+    "update": 2.0, "change": 1.5, "correct": 1.5, "fix": 1.0, "typo": 1.5, "mistake": 1.5,
+    "worked": 1.5, "working": 1.0, "project": 1.5, "projects": 1.5, "production": 1.5,
+    "api": 1.5, "apis": 1.5, "scalable": 1.5, "testing": 1.5, "debugging": 1.5,
+    "my name": 3.0, "i am": 1.0, "i'm": 1.0, "applying for": 3.0, "worked on": 2.0,
+    "weather": -3.0, "joke": -3.0, "jokes": -3.0, "recipe": -3.0,
+    "song": -2.5, "lyrics": -3.0, "poem": -3.0,
+    "translate": -3.0, "football": -3.0, "cricket": -3.0, "sports": -3.0,
+    "capital": -2.5, "president": -2.5, "trivia": -3.0, "horoscope": -3.0, "celebrity": -3.0,
+    "tell me a": -3.0, "who won": -3.0,
+    "capital of": -3.0, "what's the weather": -3.0, "how to cook": -3.0, "who is": -1.5,
+}
+for _alias in TECH_ALIASES:
+    if len(_alias) > 2:
+        _TERM_WEIGHTS.setdefault(_alias, 2.0)
+
+_TIER_STATS = {"rules": 0, "scorer": 0, "llm": 0}
+_STATS_LOCK = threading.Lock()
+
+
+def _record_tier(tier):
+    with _STATS_LOCK:
+        _TIER_STATS[tier] += 1
+
+
+def is_acknowledgement(user_message):
+    """
+        Whether the message is a bare acknowledgement such as "yes", "no" or "looks good"
+    """
+    return user_message.lower().strip(" .!?") in _ACKNOWLEDGEMENTS
+
+
+def _apply_rules(text):
+    """
+        Decide messages that are obviously relevant from their shape alone
+    """
+    normalized = text.lower().strip(" .!?")
+    if normalized in _ACKNOWLEDGEMENTS:
+        return RELEVANT
+    if _EMAIL.match(text) or _NUMBER.match(normalized):
+        return RELEVANT
+    if _PHONE.match(text) and len(re.sub(r"\D", "", text)) >= 10:
+        return RELEVANT
+    return None
+
+
+def _relevance_probability(text):
+    """
+        Score the message with the keyword/n-gram weights and squash it to a probability.
+
+        Returns (probability, has_positive), where has_positive says whether
+        any term leaning RELEVANT matched.
+    """
+    tokens = _TOKEN.findall(text.lower())
+    grams = tokens + [f"{a} {b}" for a, b in zip(tokens, tokens[1:])]
+    grams += [f"{a} {b} {c}" for a, b, c in zip(tokens, tokens[1:], tokens[2:])]
+    weights = [_TERM_WEIGHTS.get(gram, 0.0) for gram in grams]
+    score = sum(weights)
+    return 1.0 / (1.0 + math.exp(-score)), any(weight > 0 for weight in weights)
+
+
+def classify_message_locally(user_message, threshold=None, allow_irrelevant=True):
+    """
+        Classify a message without the LLM.
+
+        Returns RELEVANT or IRRELEVANT when the rules or the scorer are at least
+        threshold confident (RELEVANCE_LOCAL_THRESHOLD, default 0.9), and None
+        when the message is ambiguous and should go to the model. IRRELEVANT
+        needs strong off-topic terms and no on-topic ones; with
+        allow_irrelevant=False it is never decided locally.
+    """
+    with span("relevance.local") as active:
+        label, tier = _classify(user_message, threshold, allow_irrelevant)
+        active.set(tier=tier, label=label)
+        _record_tier(tier)
+        return label
+
+
+def _classify(user_message, threshold, allow_irrelevant=True):
+    text = user_message.strip()
+    if not text:
+        return None, "llm"
+
+    label = _apply_rules(text)
+    if label is not None:
+        return label, "rules"
+
+    if threshold is None:
+        threshold = float(os.getenv("RELEVANCE_LOCAL_THRESHOLD", "0.9"))
+
+    probability, has_positive = _relevance_probability(text)
+    if probability >= threshold:
+        return RELEVANT, "scorer"
+    if allow_irrelevant and not has_positive and probability <= 1.0 - threshold:
+        return IRRELEVANT, "scorer"
+
+    return None, "llm"
+
+
+def get_relevance_stats():
+    """
+        Return how many messages each tier (rules, scorer, llm) resolved
+    """
+    with _STATS_LOCK:
+        return dict(_TIER_STATS)
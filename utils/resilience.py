@@ -0,0 +1,194 @@
+from contextlib import contextmanager
+import os
+import random
+import threading
+import time
+
+# Exception class names (from groq, httpx and the stdlib) worth retrying.
+# Matched by name so this module does not have to import the client libraries.
+_TRANSIENT_ERRORS = {
+    "APITimeoutError", "APIConnectionError", "RateLimitError", "InternalServerError",
+    "TimeoutException", "ConnectTimeout", "ReadTimeout", "WriteTimeout", "PoolTimeout",
+    "ConnectError", "ReadError", "RemoteProtocolError", "TimeoutError", "ConnectionError",
+}
+_TRANSIENT_STATUS_CODES = {408, 409, 429, 500, 502, 503, 504}
+
+
+class CircuitOpenError(RuntimeError):
+    """
+        Raised instead of calling the LLM while the circuit breaker is open
+    """
+
+
+class CircuitBreaker:
+    """
+        Classic closed/open/half-open breaker.
+
+        After failure_threshold consecutive failed calls the breaker opens and
+        rejects calls for reset_timeout seconds; then a single trial call is
+        let through and its outcome closes or re-opens the breaker.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, failure_threshold=5, reset_timeout=30.0):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._state = self.CLOSED
+        self._consecutive_failures = 0
+        self._opened_at = 0.0
+        self._trial_in_flight = False
+        self._lock = threading.Lock()
+        self._stats = {"successes": 0, "failures": 0, "rejected": 0, "opened": 0}
+
+    def allow(self):
+        with self._lock:
+            if self._state == self.OPEN and time.monotonic() - self._opened_at >= self.reset_timeout:
+                self._state = self.HALF_OPEN
+                self._trial_in_flight = False
+
+            if self._state == self.CLOSED:
+                return True
+            if self._state == self.HALF_OPEN and not self._trial_in_flight:
+                self._trial_in_flight = True
+                return True
+
+            self._stats["rejected"] += 1
+            return False
+
+    def record_success(self):
+        with self._lock:
+            self._stats["successes"] += 1
+            self._consecutive_failures = 0
+            self._state = self.CLOSED
+            self._trial_in_flight = False
+
+    def release_trial(self):
+        """
+            Give up a half-open trial whose outcome is unknown (e.g. an abandoned
+            stream) so the next call can make the trial instead
+        """
+        with self._lock:
+            if self._state == self.HALF_OPEN:
+                self._trial_in_flight = False
+
+    def record_failure(self):
+        with self._lock:
+            self._stats["failures"] += 1
+            self._consecutive_failures += 1
+            if self._state == self.HALF_OPEN or self._consecutive_failures >= self.failure_threshold:
+                if self._state != self.OPEN:
+                    self._stats["opened"] += 1
+                self._state = self.OPEN
+                self._opened_at = time.monotonic()
+                self._trial_in_flight = False
+
+    def stats(self):
+        with self._lock:
+            return dict(self._stats, state=self._state, consecutive_failures=self._consecutive_failures)
+
+
+LLM_BREAKER = CircuitBreaker(
+    failure_threshold=int(os.getenv("LLM_BREAKER_FAILURE_THRESHOLD", "5")),
+    reset_timeout=float(os.getenv("LLM_BREAKER_RESET_SECONDS", "30"))
+)
+
+
+def is_transient_error(error):
+    """
+        Whether an LLM error is worth retrying (timeouts, connection errors, 429 and 5xx)
+    """
+    if type(error).__name__ in _TRANSIENT_ERRORS:
+        return True
+    return getattr(error, "status_code", None) in _TRANSIENT_STATUS_CODES
+
+
+def call_with_resilience(fn, *args, deadline=None, max_retries=None, breaker=LLM_BREAKER):
+    """
+        Call fn through the circuit breaker, retrying transient errors with
+        jittered exponential backoff until max_retries or the deadline (in
+        seconds from now) is reached. Raises CircuitOpenError without calling
+        fn while the breaker is open.
+
+        fn is called as fn(*args, timeout=seconds), with the attempt's timeout
+        capped at the time left before the deadline.
+    """
+    if deadline is None:
+        deadline = float(os.getenv("LLM_CALL_DEADLINE_SECONDS", "20"))
+    if max_retries is None:
+        max_retries = int(os.getenv("LLM_MAX_RETRIES", "2"))
+    base_delay = float(os.getenv("LLM_RETRY_BASE_DELAY", "0.25"))
+    max_delay = float(os.getenv("LLM_RETRY_MAX_DELAY", "2.0"))
+
+    if not breaker.allow():
+        raise CircuitOpenError("LLM circuit breaker is open.")
+
+    give_up_at = time.monotonic() + deadline
+    attempt = 0
+    while True:
+        try:
+            result = fn(*args, timeout=max(0.001, give_up_at - time.monotonic()))
+        except Exception as e:
+            delay = random.uniform(0, min(max_delay, base_delay * (2 ** attempt)))
+            out_of_time = time.monotonic() + delay >= give_up_at
+            if not is_transient_error(e) or attempt >= max_retries or out_of_time:
+                breaker.record_failure()
+                raise
+            attempt += 1
+            time.sleep(delay)
+            continue
+
+        breaker.record_success()
+        return result
+
+
+_LLM_SLOTS = None
+
+
+def set_llm_concurrency(limit):
+    """
+        Bound how many LLM requests may be in flight across the process (0 = unbounded)
+    """
+    global _LLM_SLOTS
+    _LLM_SLOTS = threading.BoundedSemaphore(limit) if limit else None
+
+
+set_llm_concurrency(int(os.getenv("LLM_MAX_CONCURRENCY", "0")))
+
+
+@contextmanager
+def llm_slot():
+    """
+        Hold one of the LLM_MAX_CONCURRENCY request slots (a no-op when unbounded)
+    """
+    slots = _LLM_SLOTS
+    if slots is None:
+        yield
+        return
+    with slots:
+        yield
+
+
+def resilient_invoke(llm, messages):
+    """
+        llm.invoke(messages) with deadline, retries, the shared circuit breaker
+        and the LLM_MAX_CONCURRENCY bound (a slot is held per attempt, not
+        during backoff). Each attempt's timeout is the smaller of
+        LLM_REQUEST_TIMEOUT_SECONDS and the time left before the deadline.
+    """
+    request_timeout = float(os.getenv("LLM_REQUEST_TIMEOUT_SECONDS", "10"))
+
+    def bounded_invoke(messages, timeout):
+        with llm_slot():
+            return llm.invoke(messages, timeout=min(timeout, request_timeout))
+
+    return call_with_resilience(bounded_invoke, messages)
+
+
+def get_breaker_stats():
+    """
+        Return the LLM circuit breaker state and counters
+    """
+    return LLM_BREAKER.stats()
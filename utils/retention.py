@@ -0,0 +1,275 @@
+"""
+Retention of stored interviews (RETENTION_DAYS, default 90).
+
+Every saved interview gets an "expires_at" datetime, and a TTL index on it
+lets MongoDB delete it once it passes. Interviews on hold (e.g. the candidate
+was selected for further interviews) carry "retention_hold" instead of
+"expires_at", so the TTL monitor skips them.
+
+purge() handles what the TTL index cannot: it puts interviews whose hold
+"until" has passed back under retention (a hold only ever extends it), and
+deletes documents saved before expires_at existed (their "timestamp" is an
+ISO string, which TTL indexes ignore) and expired documents the TTL monitor
+has not reached yet. It deletes in rate-limited batches so it does not compete
+with the live insert path, and reports what it removed. Entries in the
+background writer's dead-letter file (MONGO_DEAD_LETTER_PATH) are removed
+after the same RETENTION_DAYS.
+
+    python -m utils.retention [--batch-size 500] [--max-deletes-per-second 1000] [--dry-run]
+"""
+from datetime import datetime, timedelta, timezone
+import argparse
+import os
+import sys
+import threading
+import time
+
+from utils.tracing import span
+
+_STARTED = False
+_LOCK = threading.Lock()
+_LAST_RUN = {}
+
+
+def retention_days():
+    return int(os.getenv("RETENTION_DAYS", "90"))
+
+
+def _now():
+    return datetime.now(timezone.utc)
+
+
+def _parse_timestamp(value):
+    # Stored timestamps are naive local-time isoformat() strings
+    try:
+        parsed = datetime.fromisoformat(str(value))
+    except ValueError:
+        return None
+    return parsed.astimezone(timezone.utc)
+
+
+def _aware(value):
+    # pymongo returns naive UTC datetimes unless the client is tz_aware
+    return value.replace(tzinfo=timezone.utc) if value.tzinfo is None else value
+
+
+def expiry_for(document):
+    """
+    Return when a document should expire: RETENTION_DAYS after its timestamp, or after now if it has none.
+    """
+    saved_at = _parse_timestamp(document.get("timestamp")) or _now()
+    return saved_at + timedelta(days=retention_days())
+
+
+def ended_hold_expiry(document):
+    """
+    Return when a document whose hold has ended should expire: the later of
+    the hold's "until" and its normal expiry.
+    """
+    until = (document.get("retention_hold") or {}).get("until")
+    expires_at = expiry_for(document)
+    return max(expires_at, _aware(until)) if until else expires_at
+
+
+def apply_retention(document):
+    """
+    Set "expires_at" on a document about to be saved, unless it is on hold.
+    """
+    if not document.get("retention_hold"):
+        document["expires_at"] = expiry_for(document)
+    return document
+
+
+def place_hold(interview_id, reason="selected for further interviews", until=None, collection=None):
+    """
+    Exempt an interview from retention until the given datetime (indefinitely if None).
+    """
+    from utils.database import update_interview
+    hold = {"reason": reason, "since": _now(), "until": until}
+    return update_interview(interview_id, {"$set": {"retention_hold": hold}, "$unset": {"expires_at": ""}}, collection)
+
+
+def release_hold(interview_id, collection=None):
+    """
+    Put an interview back under the normal retention period, counted from its timestamp.
+
+    An interview already older than RETENTION_DAYS expires at the TTL
+    monitor's next pass.
+    """
+    from utils.database import get_interviews_collection, update_interview
+    if collection is None:
+        collection = get_interviews_collection()
+    document = collection.find_one({"_id": interview_id}, {"timestamp": 1})
+    if document is None:
+        return None
+    update = {"$set": {"expires_at": expiry_for(document)}, "$unset": {"retention_hold": ""}}
+    return update_interview(interview_id, update, collection)
+
+
+def end_holds(collection, now=None, batch_size=500, dry_run=False):
+    """
+    Put interviews whose hold "until" has passed back under retention, with
+    expires_at from ended_hold_expiry. Returns how many holds ended.
+
+    Each update re-checks the hold, so one replaced while this runs is kept.
+    """
+    now = now or _now()
+    query = {"retention_hold.until": {"$lte": now}}
+    ended = 0
+    last_id = None
+    while True:
+        page_query = dict(query, _id={"$gt": last_id}) if last_id is not None else query
+        documents = list(collection.find(
+            page_query, {"timestamp": 1, "retention_hold": 1}, sort=[("_id", 1)], limit=batch_size
+        ))
+        for document in documents:
+            if dry_run:
+                ended += 1
+                continue
+            result = collection.update_one(
+                {"_id": document["_id"], "retention_hold": document["retention_hold"]},
+                {"$set": {"expires_at": ended_hold_expiry(document)}, "$unset": {"retention_hold": ""}}
+            )
+            ended += result.matched_count
+        if len(documents) < batch_size:
+            return ended
+        last_id = documents[-1]["_id"]
+
+
+def purge_rules(now=None):
+    """
+    Return (reason, query) for each kind of document purge() deletes.
+    """
+    now = now or _now()
+    # Legacy timestamps were written with datetime.now().isoformat(), so compare in local time
+    legacy_cutoff = (datetime.now() - timedelta(days=retention_days())).isoformat()
+    return (
+        ("expired", {"expires_at": {"$lte": now}, "retention_hold": None}),
+        ("legacy", {"expires_at": None, "retention_hold": None, "timestamp": {"$lt": legacy_cutoff}}),
+    )
+
+
+def purge(collection=None, batch_size=500, max_deletes_per_second=1000, dry_run=False, dead_letter_file=None):
+    """
+    Delete documents past retention in batches of batch_size, at most
+    max_deletes_per_second on average (0 = no limit).
+
+    Ended holds are released first (end_holds), so their interviews are
+    deleted only once past their restored expires_at. Each batch re-applies
+    its rule in delete_many, so a hold placed while the job runs still
+    protects the interview. Dead-letter entries (dead_letter_file, default
+    MONGO_DEAD_LETTER_PATH) older than RETENTION_DAYS are removed as well.
+    Returns the run's metrics.
+    """
+    from utils.database import dead_letter_path, get_interviews_collection, purge_dead_letters
+    if collection is None:
+        collection = get_interviews_collection()
+    if dead_letter_file is None:
+        dead_letter_file = dead_letter_path()
+
+    started = time.monotonic()
+    stats = {"purged": {}, "batches": 0, "dry_run": dry_run}
+    with span("retention.purge", dry_run=dry_run) as active:
+        stats["holds_ended"] = end_holds(collection, batch_size=batch_size, dry_run=dry_run)
+        for reason, query in purge_rules():
+            purged = 0
+            last_id = None
+            while True:
+                page_query = dict(query, _id={"$gt": last_id}) if dry_run and last_id is not None else query
+                ids = [d["_id"] for d in collection.find(page_query, {"_id": 1}, sort=[("_id", 1)], limit=batch_size)]
+                if not ids:
+                    break
+                batch_started = time.monotonic()
+                if dry_run:
+                    deleted = len(ids)
+                    last_id = ids[-1]
+                else:
+                    deleted = collection.delete_many(dict(query, _id={"$in": ids})).deleted_count
+                purged += deleted
+                stats["batches"] += 1
+                if len(ids) < batch_size:
+                    break
+                if max_deletes_per_second:
+                    time.sleep(max(0.0, len(ids) / max_deletes_per_second - (time.monotonic() - batch_started)))
+            stats["purged"][reason] = purged
+
+        # failed_at is written with datetime.now().isoformat(), like legacy timestamps
+        dead_letter_cutoff = (datetime.now() - timedelta(days=retention_days())).isoformat()
+        stats["dead_letters"] = (
+            purge_dead_letters(dead_letter_file, dead_letter_cutoff, dry_run=dry_run) if dead_letter_file else 0
+        )
+
+        stats["total"] = sum(stats["purged"].values())
+        stats["seconds"] = round(time.monotonic() - started, 2)
+        stats["finished_at"] = _now().isoformat()
+        active.set(
+            holds_ended=stats["holds_ended"], dead_letters=stats["dead_letters"],
+            **{f"purged_{reason}": n for reason, n in stats["purged"].items()}
+        )
+
+    with _LOCK:
+        _LAST_RUN.clear()
+        _LAST_RUN.update(stats)
+    return stats
+
+
+def get_last_purge():
+    """
+    Return the metrics of this process's last purge run, or {}
+    """
+    with _LOCK:
+        return dict(_LAST_RUN)
+
+
+def _purge_forever(interval):
+    while True:
+        try:
+            purge(
+                batch_size=int(os.getenv("RETENTION_BATCH_SIZE", "500")),
+                max_deletes_per_second=float(os.getenv("RETENTION_MAX_DELETES_PER_SECOND", "200"))
+            )
+        except Exception as e:
+            print(f"Error purging expired interviews: {e}")
+        time.sleep(interval)
+
+
+def start_retention_purge():
+    """
+    Run purge every RETENTION_PURGE_INTERVAL_SECONDS (default 3600, 0 disables)
+    on a daemon thread, once per process and only when MONGO_URI is set.
+    """
+    global _STARTED
+    interval = float(os.getenv("RETENTION_PURGE_INTERVAL_SECONDS", "3600"))
+    if interval <= 0 or not os.getenv("MONGO_URI"):
+        return
+    with _LOCK:
+        if _STARTED:
+            return
+        _STARTED = True
+    threading.Thread(target=_purge_forever, args=(interval,), name="retention-purge", daemon=True).start()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--batch-size", type=int, default=500, help="documents deleted per delete_many call")
+    parser.add_argument("--max-deletes-per-second", type=float, default=1000, help="average delete rate (0 = unlimited)")
+    parser.add_argument("--dry-run", action="store_true", help="count what would be purged without deleting")
+    args = parser.parse_args(argv)
+
+    from dotenv import load_dotenv
+    load_dotenv()
+    from utils.database import ensure_interview_indexes
+    ensure_interview_indexes()
+
+    stats = purge(batch_size=args.batch_size, max_deletes_per_second=args.max_deletes_per_second, dry_run=args.dry_run)
+    verb = "Would purge" if args.dry_run else "Purged"
+    details = ", ".join(f"{n} {reason}" for reason, n in stats["purged"].items())
+    print(
+        f"{verb} {stats['total']} interviews ({details}) in {stats['batches']} batches, {stats['seconds']}s; "
+        f"{stats['holds_ended']} ended holds back under retention, {stats['dead_letters']} dead-letter entries"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,147 @@
+"""
+Read-side queries for reviewers over the interviews collection.
+
+Results are newest first and paginated with an opaque cursor over
+(timestamp, _id) rather than skip(), so every page is an index range scan
+however deep the reviewer pages. Answer bodies are left out unless asked for.
+
+    page, cursor = list_interviews(build_filter(technologies="python, django"))
+    more, cursor = list_interviews(build_filter(technologies="python, django"), after=cursor)
+"""
+from datetime import date, datetime
+import base64
+import json
+
+from utils.database import get_interviews_collection
+from utils.tech_stack import normalize_tech_stack
+
+SORT = [("timestamp", -1), ("_id", -1)]
+
+# Excluded from list results unless include_answers=True
+ANSWER_FIELDS = ("technical_interview.answer", "evaluation.answers.feedback")
+
+
+def _timestamp(value):
+    # Stored timestamps are datetime.isoformat() strings, which sort correctly as text
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    return str(value)
+
+
+def build_filter(email=None, position=None, technologies=None, since=None, until=None, stage_completed=None):
+    """
+    Build a query document from reviewer filters; None means "any".
+
+    technologies may be free text or a list and matches interviews listing
+    all of them after normalization ("react.js" finds "react"). since is
+    inclusive and until exclusive; both take datetimes, dates or ISO strings.
+    """
+    query = {}
+    if email:
+        query["candidate_info.email"] = email.strip().lower()
+    if position:
+        query["candidate_info.desired_position"] = position.strip()
+    if technologies:
+        if not isinstance(technologies, str):
+            technologies = ", ".join(technologies)
+        wanted = list(normalize_tech_stack(technologies))
+        if wanted:
+            query["technologies"] = {"$all": wanted}
+    if since is not None or until is not None:
+        query["timestamp"] = {}
+        if since is not None:
+            query["timestamp"]["$gte"] = _timestamp(since)
+        if until is not None:
+            query["timestamp"]["$lt"] = _timestamp(until)
+    if stage_completed is not None:
+        query["interview_stage_completed"] = {"$gte": stage_completed}
+    return query
+
+
+def projection(include_answers=False, fields=None):
+    """
+    Return the projection for reviewer queries.
+
+    fields limits results to those fields (plus _id and timestamp, which the
+    cursor needs); otherwise whole documents are returned minus ANSWER_FIELDS
+    unless include_answers is set.
+    """
+    if fields:
+        return dict.fromkeys(("timestamp", *fields), 1)
+    if include_answers:
+        return None
+    return dict.fromkeys(ANSWER_FIELDS, 0)
+
+
+def encode_cursor(document):
+    """
+    Return the opaque cursor that resumes a listing after document.
+    """
+    _id = document["_id"]
+    payload = {"t": document.get("timestamp"), "i": str(_id), "o": type(_id).__name__ == "ObjectId"}
+    return base64.urlsafe_b64encode(json.dumps(payload, separators=(",", ":")).encode()).decode()
+
+
+def decode_cursor(cursor):
+    """
+    Return the (timestamp, _id) a cursor from encode_cursor points at; raises ValueError if it is malformed.
+    """
+    try:
+        payload = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        timestamp, _id = payload["t"], payload["i"]
+        if payload.get("o"):
+            from bson import ObjectId
+            _id = ObjectId(_id)
+    except Exception as e:
+        raise ValueError(f"Invalid cursor: {cursor!r}") from e
+    return timestamp, _id
+
+
+def _after(cursor):
+    timestamp, _id = decode_cursor(cursor)
+    return {"$or": [
+        {"timestamp": {"$lt": timestamp}},
+        {"timestamp": timestamp, "_id": {"$lt": _id}}
+    ]}
+
+
+def list_interviews(filters=None, limit=50, after=None, include_answers=False, fields=None, collection=None):
+    """
+    Return (documents, next_cursor) for one page of interviews, newest first.
+
+    filters is a query document, usually from build_filter. Pass next_cursor
+    back as after to get the following page; it is None on the last page.
+    """
+    if collection is None:
+        collection = get_interviews_collection()
+
+    query = dict(filters or {})
+    if after:
+        query = {"$and": [query, _after(after)]} if query else _after(after)
+
+    documents = list(
+        collection.find(query, projection(include_answers, fields)).sort(SORT).limit(limit + 1)
+    )
+    if len(documents) <= limit:
+        return documents, None
+    documents = documents[:limit]
+    return documents, encode_cursor(documents[-1])
+
+
+def get_interview(interview_id, include_answers=True, collection=None):
+    """
+    Return one interview by id, or None.
+    """
+    if collection is None:
+        collection = get_interviews_collection()
+    return collection.find_one({"_id": interview_id}, projection(include_answers))
+
+
+def find_by_email(email, include_answers=False, limit=50, collection=None):
+    """
+    Return the most recent interviews for a candidate email.
+    """
+    documents, _ = list_interviews(
+        build_filter(email=email), limit=limit, include_answers=include_answers, collection=collection
+    )
+    return documents
@@ -0,0 +1,123 @@
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+import json
+import os
+
+from utils.llm_cache import invoke_prompt
+from utils.prompt_registry import PROMPTS
+from utils.tracing import span
+
+RUBRIC = ("correctness", "depth", "clarity")
+
+# Scoring runs after the conclusion screen, so a small pool is enough and
+# keeps it from competing with live interviews for LLM capacity.
+_EXECUTOR = ThreadPoolExecutor(
+    max_workers=int(os.getenv("SCORING_WORKERS", "2")),
+    thread_name_prefix="answer-scoring"
+)
+
+
+def _criterion_score(value):
+    try:
+        return min(10, max(0, int(round(float(value)))))
+    except (TypeError, ValueError):
+        return None
+
+
+def request_answer_scores(llm, tech_stack, qa_items):
+    """
+        Score several answers with one rubric call; returns {question_number: evaluation} for the answers the LLM scored
+    """
+    answers = json.dumps([
+        {"question_number": qa["question_number"], "question": qa["question"], "answer": qa["answer"]}
+        for qa in qa_items
+    ], ensure_ascii=False)
+    content = invoke_prompt(llm, PROMPTS["answer_scoring"], tech_stack=tech_stack, answers=answers)
+
+    start, end = content.find("["), content.rfind("]")
+    if start == -1 or end < start:
+        raise ValueError("LLM response did not contain a JSON array.")
+    items = json.loads(content[start:end + 1])
+
+    requested = {qa["question_number"] for qa in qa_items}
+    scores = {}
+    for item in items if isinstance(items, list) else []:
+        if not isinstance(item, dict) or item.get("question_number") not in requested:
+            continue
+        criteria = {name: _criterion_score(item.get(name)) for name in RUBRIC}
+        if None in criteria.values():
+            continue
+        scores[item["question_number"]] = dict(
+            criteria,
+            score=round(sum(criteria.values()) / len(RUBRIC), 1),
+            feedback=str(item.get("feedback") or "").strip()
+        )
+    return scores
+
+
+def score_answers(tech_stack, technical_qa, llm=None, batch_size=None):
+    """
+        Score every question/answer pair, batch_size answers per LLM call (SCORING_BATCH_SIZE, default 5).
+
+        Answers the LLM could not score are kept with status "unscored"; the
+        evaluation's status is "scored", "partial" or "failed" accordingly.
+    """
+    if llm is None:
+        from utils.llm import get_llm
+        llm = get_llm()
+    batch_size = batch_size or int(os.getenv("SCORING_BATCH_SIZE", "5"))
+
+    answers = []
+    for start in range(0, len(technical_qa), batch_size):
+        chunk = technical_qa[start:start + batch_size]
+        try:
+            scores = request_answer_scores(llm, tech_stack, chunk)
+        except Exception as e:
+            print(f"Error scoring answers: {e}")
+            scores = {}
+        for qa in chunk:
+            evaluation = scores.get(qa["question_number"])
+            if evaluation is None:
+                answers.append({"question_number": qa["question_number"], "status": "unscored"})
+            else:
+                answers.append(dict(evaluation, question_number=qa["question_number"], status="scored"))
+
+    scored = [a["score"] for a in answers if a["status"] == "scored"]
+    if len(scored) == len(answers):
+        status = "scored"
+    else:
+        status = "partial" if scored else "failed"
+
+    return {
+        "status": status,
+        "overall": round(sum(scored) / len(scored), 1) if scored else None,
+        "model": getattr(llm, "model_name", ""),
+        "scored_at": datetime.now(timezone.utc),
+        "answers": answers
+    }
+
+
+def score_interview(interview_id, tech_stack, technical_qa, llm=None, collection=None):
+    """
+        Score an interview's answers and $set the result as its "evaluation" field
+    """
+    from utils.database import update_interview
+
+    with span("scoring", answers=len(technical_qa)) as active:
+        evaluation = score_answers(tech_stack, technical_qa, llm=llm)
+        active.set(status=evaluation["status"])
+        try:
+            update_interview(interview_id, {"$set": {"evaluation": evaluation}}, collection=collection)
+        except Exception as e:
+            print(f"Error saving evaluation for {interview_id}: {e}")
+            raise
+    return evaluation
+
+
+def submit_scoring(interview_id, tech_stack, technical_qa, llm=None, collection=None):
+    """
+        Queue score_interview on the scoring pool; returns its Future, or None when ANSWER_SCORING=false
+    """
+    if os.getenv("ANSWER_SCORING", "true").lower() != "true" or not technical_qa:
+        return None
+    return _EXECUTOR.submit(score_interview, interview_id, tech_stack, list(technical_qa), llm, collection)
@@ -1,12 +1,85 @@
 import streamlit as st
 from datetime import datetime
 
+import os
+
 from utils.export import export_candidate_data
+from utils.prompt_registry import get_interview_usage, get_prompt_stats
+from utils.resilience import get_breaker_stats
+from utils.retention import get_last_purge
+from utils.database import get_writer_stats
+from utils.session_state import get_session
+from utils.tracing import get_trace_aggregates, tracing_enabled
+
+def render_trace_panel():
+    """
+        Render live per-stage latency aggregates for admins (ADMIN_PANEL=true)
+    """
+    if os.getenv("ADMIN_PANEL", "false").lower() != "true":
+        return
+
+    with st.sidebar.expander("Turn latency (admin)"):
+        breaker = get_breaker_stats()
+        st.caption(
+            f"LLM breaker: {breaker['state']} · failures {breaker['failures']} · "
+            f"rejected {breaker['rejected']} · opened {breaker['opened']}"
+        )
+
+        writes = get_writer_stats()
+        if writes:
+            st.caption(
+                f"Mongo writer: {writes['written']} written · {writes['queued']} queued · "
+                f"{writes['retries']} retries · {writes['failed']} failed"
+            )
+
+        purge = get_last_purge()
+        if purge:
+            st.caption(
+                f"Retention purge: {purge['total']} removed at {purge['finished_at'][:16]} · "
+                + " · ".join(f"{reason} {n}" for reason, n in purge["purged"].items())
+                + f" · holds ended {purge['holds_ended']} · dead letters {purge['dead_letters']}"
+            )
+
+        usage = get_interview_usage(get_session().interview_id)
+        st.caption(f"This interview: {usage['calls']} LLM calls · {usage['total_tokens']} tokens")
+        st.dataframe([
+            {
+                "prompt": name,
+                "prefix tokens": p["prefix_tokens"],
+                "calls": p["calls"],
+                "prompt tokens": p["prompt_tokens"],
+                "response tokens": p["response_tokens"]
+            }
+            for name, p in sorted(get_prompt_stats().items())
+        ], hide_index=True)
+
+        if not tracing_enabled():
+            st.caption("Tracing is off. Set TRACE_EXPORTER to memory, jsonl or otel.")
+            return
+
+        aggregates = get_trace_aggregates()
+        if not aggregates:
+            st.caption("No spans recorded yet.")
+            return
+
+        st.dataframe([
+            {
+                "stage": name,
+                "count": a["count"],
+                "mean ms": round(a["mean_ms"], 1),
+                "max ms": round(a["max_ms"], 1),
+                "errors": a["errors"],
+                "cache hits": a["cache_hits"]
+            }
+            for name, a in sorted(aggregates.items())
+        ], hide_index=True)
+
 
 def render_sidebar():
     """
         Render sidebar with information
     """
+    session = get_session()
     st.sidebar.markdown("---")
     
     if "show_interview_progress" not in st.session_state:
@@ -22,7 +95,7 @@ def render_sidebar():
             3: "Completed"
         }
 
-        current_stage = min(st.session_state.stage, 4)
+        current_stage = min(session.stage, 4)
         for stage_num, stage_name in stages.items():
             if stage_num < current_stage:
                 st.sidebar.markdown(f"✅ {stage_name}")
@@ -33,12 +106,14 @@ def render_sidebar():
     
     st.sidebar.markdown("---")
 
-    if st.session_state.stage >= 3:
+    render_trace_panel()
+
+    if session.stage >= 3 and session.duplicate_of is None:
         if st.sidebar.button("📥 Download Interview Data"):
             data = export_candidate_data()
             st.sidebar.download_button(
                 label=" Download JSON",
                 data=data,
-                file_name=f"candidate_{st.session_state.candidate_data.get('name', 'unknown').replace(' ', '_')}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json",
+                file_name=f"candidate_{(session.candidate.name or 'unknown').replace(' ', '_')}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json",
                 mime="application/json"
             )
@@ -0,0 +1,201 @@
+import re
+
+# Alias -> canonical technology name. Anything not listed is kept as typed
+# (lowercased), so unknown technologies still take part in the key.
+TECH_ALIASES = {
+    "python": "python", "python3": "python", "py": "python",
+    "java": "java",
+    "javascript": "javascript", "js": "javascript", "ecmascript": "javascript",
+    "typescript": "typescript", "ts": "typescript",
+    "react": "react", "reactjs": "react", "react.js": "react",
+    "node": "node.js", "nodejs": "node.js", "node.js": "node.js",
+    "django": "django",
+    "flask": "flask",
+    "fastapi": "fastapi",
+    "express": "express", "expressjs": "express", "express.js": "express",
+    "spring": "spring", "spring boot": "spring", "springboot": "spring",
+    "sql": "sql",
+    "postgres": "postgresql", "postgresql": "postgresql", "psql": "postgresql",
+    "mysql": "mysql",
+    "mongodb": "mongodb", "mongo": "mongodb",
+    "docker": "docker",
+    "kubernetes": "kubernetes", "k8s": "kubernetes",
+    "aws": "aws", "amazon web services": "aws",
+    "git": "git",
+    "html": "html", "html5": "html",
+    "css": "css", "css3": "css",
+    "c++": "c++", "cpp": "c++",
+    "c#": "c#", "csharp": "c#",
+    ".net": ".net", "dotnet": ".net", "asp.net": ".net",
+    "php": "php",
+    "ruby": "ruby",
+    "golang": "go", "go": "go",
+    "rust": "rust",
+    "kotlin": "kotlin",
+    "swift": "swift",
+    "flutter": "flutter",
+    "vue": "vue", "vuejs": "vue", "vue.js": "vue",
+    "angular": "angular", "angularjs": "angular",
+}
+
+_SEPARATORS = re.compile(r"\s*(?:,|;|/|\||&|\band\b|\n)\s*")
+# A version is only stripped when it is set apart from the name ("node 18",
+# "java-v17"); digits glued to a name ("s3", "ec2", "web3") are part of it
+# unless what is left is a known alias ("python3.11").
+_VERSION_SUFFIX = re.compile(r"(?:\s+|\s*-\s*)v?\d+(?:\.\d+)*$")
+_GLUED_VERSION = re.compile(r"(?<=[a-z+#])v?\d+(?:\.\d+)*$")
+_VERSION = re.compile(r"^v?\d+(?:\.\d+)*\+?$")
+_WORD = re.compile(r"[^\s()]+")
+
+# Words around technology names in free text ("I know python, mostly django")
+# that are not technologies themselves.
+_FILLER_WORDS = {
+    "i", "i'm", "im", "me", "my", "we", "am", "is", "are", "have", "has", "know", "use", "used", "using",
+    "work", "worked", "working", "with", "in", "on", "at", "of", "for", "the", "a", "an", "also", "plus",
+    "mostly", "mainly", "some", "basic", "basics", "good", "strong", "experience", "experienced",
+    "proficient", "familiar", "skilled", "comfortable", "tech", "stack", "tools", "frameworks",
+    "languages", "years", "year", "etc", "etc.", "like", "as", "well", "or", "few", "bit",
+}
+
+
+def canonical_technology(name):
+    """
+        Map a single technology name to its canonical form
+    """
+    name = name.strip().lower()
+    if name in TECH_ALIASES:
+        return TECH_ALIASES[name]
+
+    unversioned = _VERSION_SUFFIX.sub("", name) or name
+    if unversioned in TECH_ALIASES:
+        return TECH_ALIASES[unversioned]
+    return TECH_ALIASES.get(_GLUED_VERSION.sub("", unversioned), unversioned)
+
+
+def _unknown_technology(text):
+    words = [
+        word for word in _WORD.findall(text.strip(" -.:"))
+        if word not in _FILLER_WORDS and not _VERSION.match(word)
+    ]
+    return canonical_technology(" ".join(words)) if words else None
+
+
+def normalize_tech_stack(tech_stack):
+    """
+        Turn a free-text tech stack into a sorted tuple of canonical technology names.
+
+        Known aliases are picked out of each comma/"and"-separated part, so
+        "Python Django PostgreSQL" is three technologies; the words left over
+        between them, minus filler such as "I know", are kept as unknown ones.
+    """
+    if not tech_stack:
+        return ()
+
+    technologies = set()
+    for part in _SEPARATORS.split(str(tech_stack).lower()):
+        part = part.strip(" -")
+        if not part:
+            continue
+        if canonical_technology(part) in TECH_ALIASES.values():
+            technologies.add(canonical_technology(part))
+            continue
+
+        position = 0
+        for start, end, canonical in TECH_INDEX.spans(part):
+            technologies.add(canonical)
+            unknown = _unknown_technology(part[position:start])
+            if unknown:
+                technologies.add(unknown)
+            position = end
+        unknown = _unknown_technology(part[position:])
+        if unknown:
+            technologies.add(unknown)
+    return tuple(sorted(technologies))
+
+
+class TechKeywordIndex:
+    """
+        Aho-Corasick automaton over technology aliases.
+
+        A single pass over the text finds every alias that appears as a whole
+        word, however many aliases are indexed.
+    """
+
+    def __init__(self, aliases):
+        self._goto = [{}]
+        self._fail = [0]
+        self._output = [[]]
+
+        for alias, canonical in aliases.items():
+            state = 0
+            for char in alias:
+                next_state = self._goto[state].get(char)
+                if next_state is None:
+                    next_state = len(self._goto)
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._output.append([])
+                    self._goto[state][char] = next_state
+                state = next_state
+            self._output[state].append((len(alias), canonical))
+
+        queue = list(self._goto[0].values())
+        while queue:
+            state = queue.pop(0)
+            for char, next_state in self._goto[state].items():
+                queue.append(next_state)
+                fail = self._fail[state]
+                while fail and char not in self._goto[fail]:
+                    fail = self._fail[fail]
+                self._fail[next_state] = self._goto[fail].get(char, 0)
+                self._output[next_state] = self._output[next_state] + self._output[self._fail[next_state]]
+
+    def spans(self, text):
+        """
+            Return (start, end, canonical) for the whole-word aliases in text, in order,
+            keeping the longest alias where several overlap
+        """
+        text = text.lower()
+        matches = []
+        state = 0
+        for end, char in enumerate(text):
+            while state and char not in self._goto[state]:
+                state = self._fail[state]
+            state = self._goto[state].get(char, 0)
+            for length, canonical in self._output[state]:
+                start = end - length + 1
+                if start > 0 and text[start - 1].isalnum():
+                    continue
+                if end + 1 < len(text) and text[end + 1].isalnum():
+                    continue
+                matches.append((start, -length, canonical))
+
+        # Keep the longest alias at each position so "react.js" is not also "js".
+        spans = []
+        covered_until = -1
+        for start, negative_length, canonical in sorted(matches):
+            if start <= covered_until:
+                continue
+            covered_until = start - negative_length - 1
+            spans.append((start, covered_until + 1, canonical))
+        return spans
+
+    def find(self, text):
+        """
+            Return the canonical names of all whole-word aliases in text, in order of appearance
+        """
+        found = []
+        for _, _, canonical in self.spans(text):
+            if canonical not in found:
+                found.append(canonical)
+        return found
+
+
+TECH_INDEX = TechKeywordIndex(TECH_ALIASES)
+
+
+def find_technologies(text):
+    """
+        Return the canonical technology names mentioned in free text
+    """
+    return TECH_INDEX.find(text)
@@ -0,0 +1,217 @@
+import contextvars
+import json
+import os
+import threading
+import time
+import uuid
+
+# TRACE_EXPORTER selects where finished spans go:
+#   none   - tracing disabled; span() returns a shared no-op (the default)
+#   memory - live aggregates only (for the admin sidebar panel)
+#   jsonl  - aggregates plus one JSON line per span in TRACE_JSONL_PATH
+#   otel   - aggregates plus spans exported through the OpenTelemetry API
+_current_turn = contextvars.ContextVar("trace_turn", default=None)
+
+_AGGREGATES = {}
+_AGGREGATES_LOCK = threading.Lock()
+_SINK = None
+_ENABLED = False
+
+
+class _NoopSpan:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+    def set(self, **attributes):
+        pass
+
+
+_NOOP_SPAN = _NoopSpan()
+
+
+class Span:
+    """
+        A timed stage of a turn; attributes can be added with set() while it is open
+    """
+
+    __slots__ = ("name", "attributes", "turn_id", "start", "end", "error")
+
+    def __init__(self, name, attributes):
+        self.name = name
+        self.attributes = attributes
+        self.turn_id = _current_turn.get()
+        self.start = None
+        self.end = None
+        self.error = None
+
+    def __enter__(self):
+        self.start = time.time()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.end = time.time()
+        if exc is not None:
+            self.error = f"{exc_type.__name__}: {exc}"
+        _finish(self)
+        return False
+
+    def set(self, **attributes):
+        self.attributes.update(attributes)
+
+    @property
+    def duration_ms(self):
+        return (self.end - self.start) * 1000
+
+    def to_dict(self):
+        return {
+            "name": self.name,
+            "turn_id": self.turn_id,
+            "start": self.start,
+            "duration_ms": round(self.duration_ms, 3),
+            "error": self.error,
+            **self.attributes
+        }
+
+
+class JsonlSink:
+    def __init__(self, path):
+        self._file = open(path, "a", encoding="utf-8")
+        self._lock = threading.Lock()
+
+    def export(self, span):
+        line = json.dumps(span.to_dict(), default=str)
+        with self._lock:
+            self._file.write(line + "\n")
+            self._file.flush()
+
+
+class OpenTelemetrySink:
+    def __init__(self):
+        from opentelemetry import trace
+        self._tracer = trace.get_tracer("talentscout")
+
+    def export(self, span):
+        otel_span = self._tracer.start_span(span.name, start_time=int(span.start * 1e9))
+        otel_span.set_attribute("turn_id", span.turn_id or "")
+        for key, value in span.attributes.items():
+            if value is not None:
+                otel_span.set_attribute(key, value if isinstance(value, (bool, int, float, str)) else str(value))
+        if span.error:
+            otel_span.set_attribute("error", span.error)
+        otel_span.end(end_time=int(span.end * 1e9))
+
+
+def configure_tracing(exporter=None, jsonl_path=None):
+    """
+        (Re)configure tracing; defaults come from TRACE_EXPORTER and TRACE_JSONL_PATH
+    """
+    global _ENABLED, _SINK
+    exporter = (exporter or os.getenv("TRACE_EXPORTER", "none")).lower()
+
+    _SINK = None
+    if exporter == "jsonl":
+        _SINK = JsonlSink(jsonl_path or os.getenv("TRACE_JSONL_PATH", "traces.jsonl"))
+    elif exporter == "otel":
+        _SINK = OpenTelemetrySink()
+    _ENABLED = exporter != "none"
+
+
+def tracing_enabled():
+    return _ENABLED
+
+
+def span(name, **attributes):
+    """
+        Start a span for a stage of the current turn; a shared no-op when tracing is off
+    """
+    if not _ENABLED:
+        return _NOOP_SPAN
+    return Span(name, attributes)
+
+
+class _Turn:
+    __slots__ = ("span", "token")
+
+    def __init__(self, attributes):
+        self.token = _current_turn.set(uuid.uuid4().hex)
+        self.span = Span("turn", attributes)
+
+    def __enter__(self):
+        return self.span.__enter__()
+
+    def __exit__(self, exc_type, exc, tb):
+        try:
+            return self.span.__exit__(exc_type, exc, tb)
+        finally:
+            _current_turn.reset(self.token)
+
+
+def turn(**attributes):
+    """
+        Group the spans of one user turn under a fresh turn id
+    """
+    if not _ENABLED:
+        return _NOOP_SPAN
+    return _Turn(attributes)
+
+
+def record_usage(active_span, response):
+    """
+        Copy prompt/response token counts from a LangChain response onto a span
+    """
+    if active_span is _NOOP_SPAN:
+        return
+    usage = getattr(response, "usage_metadata", None) or {}
+    active_span.set(
+        prompt_tokens=usage.get("input_tokens"),
+        response_tokens=usage.get("output_tokens")
+    )
+
+
+def submit_with_context(executor, fn, *args):
+    """
+        Submit fn to an executor so it runs inside the caller's turn context
+    """
+    return executor.submit(contextvars.copy_context().run, fn, *args)
+
+
+def _finish(finished):
+    with _AGGREGATES_LOCK:
+        aggregate = _AGGREGATES.setdefault(finished.name, {
+            "count": 0, "errors": 0, "total_ms": 0.0, "max_ms": 0.0, "cache_hits": 0, "cache_misses": 0
+        })
+        aggregate["count"] += 1
+        aggregate["total_ms"] += finished.duration_ms
+        aggregate["max_ms"] = max(aggregate["max_ms"], finished.duration_ms)
+        if finished.error:
+            aggregate["errors"] += 1
+        cache = finished.attributes.get("cache")
+        if cache == "hit":
+            aggregate["cache_hits"] += 1
+        elif cache == "miss":
+            aggregate["cache_misses"] += 1
+
+    if _SINK is not None:
+        try:
+            _SINK.export(finished)
+        except Exception as e:
+            print(f"Error exporting trace span {finished.name}: {e}")
+
+
+def get_trace_aggregates():
+    """
+        Return per-span-name counts, error counts, mean/max duration and cache hits
+    """
+    with _AGGREGATES_LOCK:
+        return {
+            name: dict(aggregate, mean_ms=aggregate["total_ms"] / aggregate["count"])
+            for name, aggregate in _AGGREGATES.items()
+        }
+
+
+configure_tracing()
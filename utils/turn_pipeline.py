@@ -0,0 +1,123 @@
+from concurrent.futures import ThreadPoolExecutor
+import os
+import re
+
+from utils.tracing import span, submit_with_context
+from utils.relevance import IRRELEVANT, RELEVANT, classify_message_locally, is_acknowledgement
+from utils.validation import (
+    check_message_relevance,
+    clean_field_value,
+    detect_update_request,
+    detect_update_request_locally,
+    extract_field_value_locally,
+    request_field_value,
+    request_message_relevance,
+    understand_turn
+)
+
+_EXECUTOR = ThreadPoolExecutor(
+    max_workers=int(os.getenv("TURN_PIPELINE_WORKERS", "16")),
+    thread_name_prefix="turn-pipeline"
+)
+
+# Fields whose deterministic extraction is strict enough to stand in for the
+# relevance check; a short reply is required for years_experience since any
+# digit in a longer message would otherwise be accepted.
+_SHORT_YEARS_REPLY = re.compile(r"^\s*\d{1,2}\s*(?:\+\s*)?(?:years?|yrs?)?\s*\.?\s*$", re.IGNORECASE)
+
+
+def _is_confident_local_value(field_name, user_message):
+    if field_name in ("email", "phone"):
+        return True
+    if field_name == "years_experience":
+        return bool(_SHORT_YEARS_REPLY.match(user_message))
+    return False
+
+
+def _single_call_enabled():
+    return os.getenv("TURN_UNDERSTANDING", "single").lower() == "single"
+
+
+def understand_field_answer(user_message, field_name, context):
+    """
+        Run the relevance check and field extraction for an info-gathering turn.
+
+        The LLM is skipped when the deterministic extractor already finds a
+        valid value for a strictly validated field, or when the local
+        classifier is confident. Otherwise, with TURN_UNDERSTANDING=single
+        (the default) one structured call returns relevance and value
+        together; with TURN_UNDERSTANDING=separate the relevance check and
+        LLM extraction run concurrently, and the extraction is discarded if
+        the message turns out to be irrelevant.
+        Returns (is_relevant, field_value).
+    """
+    with span("extraction.local", field=field_name) as active:
+        local_value = extract_field_value_locally(user_message, field_name)
+        active.set(found=local_value is not None)
+
+    if local_value is not None:
+        is_valid, _ = clean_field_value(field_name, local_value)
+        if is_valid and _is_confident_local_value(field_name, user_message):
+            return True, local_value
+
+    label = classify_message_locally(user_message)
+    if label == IRRELEVANT:
+        return False, None
+    if label == RELEVANT:
+        if local_value is not None:
+            return True, local_value
+        return True, request_field_value(user_message, field_name)
+
+    if _single_call_enabled():
+        understanding = understand_turn(user_message, context, current_field=field_name)
+        if not understanding["relevant"]:
+            return False, None
+        if local_value is not None:
+            return True, local_value
+        return True, understanding["value"] if understanding["field"] == field_name else None
+
+    if local_value is not None:
+        return request_message_relevance(user_message, context), local_value
+
+    relevance = submit_with_context(_EXECUTOR, request_message_relevance, user_message, context)
+    extraction = submit_with_context(_EXECUTOR, request_field_value, user_message, field_name)
+
+    if not relevance.result():
+        extraction.cancel()
+        return False, None
+
+    return True, extraction.result()
+
+
+def understand_confirmation_reply(user_message, context):
+    """
+        Decide whether a reply to the confirmation summary is relevant and whether it asks for an update.
+
+        Returns (is_relevant, update_request) in the shape of detect_update_request.
+    """
+    no_update = {"wants_update": False, "field": None, "new_value": None}
+
+    if not _single_call_enabled():
+        if not check_message_relevance(user_message, context):
+            return False, no_update
+        return True, detect_update_request(user_message)
+
+    if is_acknowledgement(user_message):
+        return True, no_update
+
+    label = classify_message_locally(user_message)
+    if label == IRRELEVANT:
+        return False, no_update
+
+    update_request = detect_update_request_locally(user_message)
+    if update_request is not None:
+        return True, update_request
+
+    understanding = understand_turn(user_message, context, confirmation_pending=True)
+    if not understanding["relevant"]:
+        return False, no_update
+    # A reply that carries a validated field value is a correction whatever
+    # intent the model gave it ("my email is x@y.com" may come back as an answer)
+    if understanding["field"] and (understanding["intent"] == "update" or understanding["value"] is not None):
+        return True, {"wants_update": True, "field": understanding["field"], "new_value": understanding["value"]}
+    return True, no_update
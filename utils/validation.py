@@ -1,30 +1,38 @@
-import streamlit as st
 import re
-from langchain_core.messages import SystemMessage
 import json
 
+from utils.extraction import extract_field_value_locally
+from utils.interview_session import CANDIDATE_FIELDS
 from utils.llm import get_llm
+from utils.llm_cache import invoke_prompt
+from utils.prompt_registry import PROMPTS
+from utils.relevance import RELEVANT, classify_message_locally
+from utils.session_state import get_session
 
-def validate_and_save_field(field_name, value):
+TURN_INTENTS = ("answer", "update", "confirm")
+
+_EMAIL_PATTERN = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+_NON_DIGIT_PATTERN = re.compile(r'\D')
+
+def clean_field_value(field_name, value):
     """
-        Validate and save field value
+        Validate and normalize a field value without saving it; returns (is_valid, value)
     """
     if value is None:
-        return False
+        return False, None
     
     # Email validation
     if field_name == "email":
         email_str = str(value).strip().lower()
-        email_pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-        if not re.match(email_pattern, email_str):
-            return False
+        if not _EMAIL_PATTERN.match(email_str):
+            return False, None
         value = email_str
     
     # Phone validation
     if field_name == "phone":
-        phone_digits = re.sub(r'\D', '', str(value))
+        phone_digits = _NON_DIGIT_PATTERN.sub('', str(value))
         if len(phone_digits) != 10:
-            return False
+            return False, None
         value = phone_digits
     
     #YOE validation
@@ -32,53 +40,82 @@ def validate_and_save_field(field_name, value):
         try:
             value = int(value) if isinstance(value, (int, float)) else int(value)
             if value < 0:
-                return False
+                return False, None
         except:
-            return False
+            return False, None
     
-    st.session_state.candidate_data[field_name] = value
-    return True
+    return True, value
 
 
-def check_message_relevance(user_message, current_context):
+def validate_and_save_field(field_name, value):
     """
-        Check if the user message is relevant to the recruitment process
+        Validate and save field value
     """
-    llm = get_llm()
+    if field_name not in CANDIDATE_FIELDS:
+        return False
+
+    is_valid, value = clean_field_value(field_name, value)
+    if not is_valid:
+        return False
     
-    relevance_prompt = f"""
-        You are a recruitment chatbot filter. Determine if the user's message is relevant to a job recruitment screening process.
-
-        User message: "{user_message}"
-        Context: {current_context}
-
-        A message is RELEVANT if it:
-        - Provides personal information (name, email, phone, experience, position, location, skills)
-        - Answers the current question being asked
-        - Asks clarifying questions about the job or interview process
-        - Expresses willingness to continue or provides acknowledgments
-        - Requests to update previously provided information
-
-        A message is IRRELEVANT if it:
-        - Asks general knowledge questions (capitals, math problems, trivia, science facts)
-        - Requests unrelated tasks (writing stories, translating text, jokes)
-        - Contains off-topic conversation
-        - Asks about unrelated topics (weather, sports, entertainment)
-
-        Respond with ONLY one word: RELEVANT or IRRELEVANT
+    get_session().candidate.set(field_name, value)
+    return True
+
+
+def check_message_relevance(user_message, current_context, local_irrelevant=True):
+    """
+        Check if the user message is relevant to the recruitment process.
+
+        With local_irrelevant=False only the LLM may reject a message, which is
+        what free-form technical answers need.
     """
+    label = classify_message_locally(user_message, allow_irrelevant=local_irrelevant)
+    if label is not None:
+        return label == RELEVANT
+    return request_message_relevance(user_message, current_context)
+
+
+def request_message_relevance(user_message, current_context):
+    """
+        Ask the LLM whether the user message is relevant to the recruitment process
+    """
+    llm = get_llm()
     
     try:
-        response = llm.invoke([SystemMessage(content=relevance_prompt)])
-        result = response.content.strip().upper()
+        result = invoke_prompt(
+            llm, PROMPTS["relevance"], user_message=user_message, context=current_context
+        ).strip().upper()
         return "RELEVANT" in result
     except Exception as e:
+        # Fail open: an unavailable classifier must not block the candidate
+        print(f"Error checking message relevance: {e}")
         return True
 
 
-def detect_update_request(user_message):
+def parse_json_object(content):
     """
-        Detect if user wants to update information
+        Return the first complete JSON object in an LLM response, or None.
+
+        Unlike a non-greedy regex this copes with nested objects, braces inside
+        strings and code fences around the JSON.
+    """
+    decoder = json.JSONDecoder()
+    start = content.find("{")
+    while start != -1:
+        try:
+            value, _ = decoder.raw_decode(content, start)
+        except ValueError:
+            start = content.find("{", start + 1)
+            continue
+        if isinstance(value, dict):
+            return value
+        start = content.find("{", start + 1)
+    return None
+
+
+def detect_update_request_locally(user_message):
+    """
+        Detect an update request from keywords only; returns None if nothing matched
     """
 
     update_keywords = ["change", "update", "correct", "fix", "modify", "replace", "wrong", "mistake"]
@@ -118,35 +155,25 @@ def detect_update_request(user_message):
             else:
                 return {"wants_update": True, "field": detected_field, "new_value": None}
     
-    llm = get_llm()
-    
-    update_prompt = f"""
-        Analyze if the user wants to UPDATE previously provided information.
-
-       User message: "{user_message}"
-        Available fields: name, email, phone, years_experience, desired_position, location, tech_stack
-
-        Determine:
-        1. Does the user want to update something? (yes/no)
-        2. If yes, which field? (use exact field names above)
-        3. If yes, what's the new value?
+    return None
 
-        Return ONLY a JSON object:
-        {{"wants_update": true/false, "field": "field_name or null", "new_value": "value or null"}}
 
-        Examples:
-        - "update email to john@example.com" -> {{"wants_update": true, "field": "email", "new_value": "john@example.com"}}
-        - "change my phone number to 1234567890" -> {{"wants_update": true, "field": "phone", "new_value": "1234567890"}}
-        - "no" or "looks good" -> {{"wants_update": false, "field": null, "new_value": null}}
-        """
+def detect_update_request(user_message):
+    """
+        Detect if user wants to update information
+    """
+    update_request = detect_update_request_locally(user_message)
+    if update_request is not None:
+        return update_request
+    
+    llm = get_llm()
     
     try:
-        response = llm.invoke([SystemMessage(content=update_prompt)])
-        content = response.content.strip()
+        content = invoke_prompt(llm, PROMPTS["update_detection"], user_message=user_message).strip()
         
-        json_match = re.search(r'\{.*?\}', content, re.DOTALL)
-        if json_match:
-            return json.loads(json_match.group())
+        update_request = parse_json_object(content)
+        if update_request is not None:
+            return update_request
     except Exception as e:
         print(f"Error detecting update request: {e}")
         pass
@@ -154,71 +181,10 @@ def detect_update_request(user_message):
     return {"wants_update": False, "field": None, "new_value": None}
 
 
-def extract_field_value(user_message, field_name):
+def request_field_value(user_message, field_name):
     """
-        Extract specific field value from user message
+        Ask the LLM to extract a field value from the user message
     """
-    if field_name == "name":
-        words = user_message.strip().split()
-        if len(words) <= 4 and len(user_message) < 50:
-            irrelevant = ["the", "is", "i'm", "my", "name", "is", "called", "i", "am"]
-            relevant_words = [w for w in words if w.lower() not in irrelevant]
-            if relevant_words:
-                return " ".join(relevant_words)
-    
-    if field_name == "email":
-        email_pattern = r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}'
-        match = re.search(email_pattern, user_message)
-        if match:
-            return match.group(0)
-    
-    if field_name == "phone":
-        phone_pattern = r'\d{10}'
-        match = re.search(phone_pattern, user_message)
-        if match:
-            return match.group(0)
-        phone_with_separators = re.sub(r'[^\d]', '', user_message)
-        if len(phone_with_separators) >= 10:
-            return phone_with_separators[:10]
-    
-    if field_name == "years_experience":
-        if any(keyword in user_message.lower() for keyword in ["fresher", "fresh graduate", "no experience", "0 years", "just graduated", "beginner"]):
-            return 0
-        numbers = re.findall(r'\d+', user_message)
-        if numbers:
-            return int(numbers[0])
-    
-    if field_name == "desired_position":
-        if len(user_message) < 100:
-            filler_words = ["i'm", "i am", "applying for", "looking for", "want", "interested in", "position", "role", "job", "as", "a", "an"]
-            cleaned = user_message.lower()
-            for word in filler_words:
-                cleaned = re.sub(r'\b' + re.escape(word) + r'\b', '', cleaned).strip()
-            if cleaned and len(cleaned) > 2:
-                return cleaned.title()
-    
-    if field_name == "location":
-        if len(user_message) < 50:
-            filler_words = ["i'm", "i am", "located in", "from", "based in", "live in", "city", "state", "country"]
-            cleaned = user_message.lower()
-            for word in filler_words:
-                cleaned = re.sub(r'\b' + re.escape(word) + r'\b', '', cleaned).strip()
-            if cleaned and len(cleaned) > 1:
-                return cleaned.title()
-    
-    if field_name == "tech_stack":
-        if "," in user_message:
-            return user_message.strip()
-        tech_keywords = ["python", "java", "javascript", "typescript", "react", "django", "node", "sql", "postgres", "mongodb", "docker", "kubernetes", "aws", "git", "html", "css", "c++", "c#", ".net", "php", "ruby", "golang", "rust", "kotlin", "swift", "flutter", "vue", "angular", "spring", "fastapi", "express", "flask"]
-        if any(keyword in user_message.lower() for keyword in tech_keywords):
-            filler_words = ["i know", "i'm proficient in", "i have", "experience with", "skilled in", "expertise in", "familiar with", "and", ","]
-            cleaned = user_message.lower()
-            for word in filler_words:
-                cleaned = cleaned.replace(word, "").strip()
-            if cleaned and len(cleaned) > 2:
-                return cleaned.strip()
-            return user_message.strip()
-    
     llm = get_llm()
     
     field_descriptions = {
@@ -231,36 +197,88 @@ def extract_field_value(user_message, field_name):
         "tech_stack": "programming languages, frameworks, and tools they know (as a comma-separated string)"
     }
     
-    extraction_prompt = f"""
-        Extract {field_descriptions[field_name]} from the user's message.
-
-        User message: "{user_message}"
-
-        Rules:
-            - If the information is clearly present, extract it
-            - For years_experience: if they say "fresher", "fresh graduate", "no experience", or "0", return 0
-            - For tech_stack: provide as comma-separated values
-            - If the information is NOT present or unclear, return null
-
-        Return ONLY a JSON object with this format: {{"value": <extracted_value>}}
-
-        Examples:
-            - For name: {{"value": "John Doe"}}
-            - For email: {{"value": "john@example.com"}}
-            - For years_experience: {{"value": 3}} or {{"value": 0}}
-            - For tech_stack: {{"value": "Python, Django, React, PostgreSQL"}}
-            - If not found: {{"value": null}}
-    """
-    
     try:
-        response = llm.invoke([SystemMessage(content=extraction_prompt)])
-        content = response.content.strip()
-        json_match = re.search(r'\{.*?\}', content, re.DOTALL)
-        if json_match:
-            extracted_data = json.loads(json_match.group())
+        content = invoke_prompt(
+            llm, PROMPTS["extraction"], field_description=field_descriptions[field_name], user_message=user_message
+        ).strip()
+        extracted_data = parse_json_object(content)
+        if extracted_data is not None:
             return extracted_data.get("value")
     except Exception as e:
         print(f"Error extracting {field_name}: {e}")
         pass
     
     return None
+
+
+def extract_field_value(user_message, field_name):
+    """
+        Extract specific field value from user message
+    """
+    value = extract_field_value_locally(user_message, field_name)
+    if value is not None:
+        return value
+    return request_field_value(user_message, field_name)
+
+
+def understand_turn(user_message, context, current_field=None, confirmation_pending=False):
+    """
+        Classify relevance, intent, target field and value with one LLM call.
+
+        Returns {"relevant", "intent", "field", "value"} where intent is one of
+        TURN_INTENTS. Every key is validated; a value that fails field
+        validation falls back to the deterministic extractor for that field,
+        and then to None.
+    """
+    llm = get_llm()
+
+    expected = (
+        "The candidate was shown their details and asked whether to update anything or continue."
+        if confirmation_pending else
+        f"The candidate was asked for their {current_field}."
+    )
+
+    data = None
+    try:
+        data = parse_json_object(invoke_prompt(
+            llm, PROMPTS["turn_understanding"], context=context, expected=expected, user_message=user_message
+        ))
+    except Exception as e:
+        print(f"Error understanding turn: {e}")
+
+    return _validate_turn_understanding(data, user_message, current_field, confirmation_pending)
+
+
+def _validate_turn_understanding(data, user_message, current_field, confirmation_pending):
+    default_intent = "confirm" if confirmation_pending else "answer"
+    if not isinstance(data, dict):
+        # Fail open like check_message_relevance and leave extraction to the rules
+        data = {}
+
+    relevant = data.get("relevant", True)
+    if isinstance(relevant, str):
+        relevant = relevant.strip().lower() not in ("false", "no", "irrelevant")
+    relevant = bool(relevant)
+
+    intent = str(data.get("intent") or default_intent).strip().lower()
+    if intent not in TURN_INTENTS:
+        intent = default_intent
+
+    field = data.get("field")
+    if field not in CANDIDATE_FIELDS:
+        field = current_field if intent == "answer" else None
+
+    raw_value = data.get("value")
+    if isinstance(raw_value, str) and raw_value.strip().lower() in ("", "null", "none"):
+        raw_value = None
+
+    value = None
+    if field is not None and intent != "confirm":
+        if clean_field_value(field, raw_value)[0]:
+            value = raw_value
+        else:
+            local_value = extract_field_value_locally(user_message, field)
+            if clean_field_value(field, local_value)[0]:
+                value = local_value
+
+    return {"relevant": relevant, "intent": intent, "field": field, "value": value}
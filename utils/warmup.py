@@ -0,0 +1,83 @@
+import os
+import threading
+import time
+
+_STARTED = False
+_LOCK = threading.Lock()
+_STATUS = {}
+
+
+def _warm_llm():
+    if not os.getenv("GROQ_API_KEY"):
+        return "skipped: GROQ_API_KEY is not set"
+    # Imports langchain_groq/httpx and builds the pooled client and its HTTP pool
+    from utils.llm import get_llm
+    get_llm()
+    # Message classes used by every prompt template
+    import langchain_core.messages
+    return "ok"
+
+
+def _warm_mongo():
+    if not os.getenv("MONGO_URI"):
+        return "skipped: MONGO_URI is not set"
+    from utils.database import ensure_interview_indexes, get_client
+    get_client().admin.command("ping")
+    ensure_interview_indexes()
+    return "ok"
+
+
+def _warm_caches():
+    from utils.checkpoint import get_checkpoint_store
+    from utils.llm_cache import get_response_cache
+    from utils.question_bank import get_question_bank
+    get_response_cache()
+    get_question_bank()
+    get_checkpoint_store()
+    return "ok"
+
+
+_STEPS = (("llm", _warm_llm), ("mongo", _warm_mongo), ("caches", _warm_caches))
+
+
+def warm_up():
+    """
+        Load the heavy dependencies, build the LLM client, open the Mongo pool
+        and create the caches in the calling thread; failures are recorded,
+        not raised. Returns get_warmup_status().
+    """
+    for name, step in _STEPS:
+        started = time.perf_counter()
+        try:
+            status = step()
+        except Exception as e:
+            status = f"error: {type(e).__name__}: {e}"
+        with _LOCK:
+            _STATUS[name] = {"status": status, "ms": round((time.perf_counter() - started) * 1000, 1)}
+    return get_warmup_status()
+
+
+def start_warmup():
+    """
+        Run warm_up once per process on a daemon thread (WARMUP=false disables it).
+
+        Streamlit executes app.py when the first browser session connects, so
+        this starts with the first page view and finishes while the candidate
+        reads the greeting, instead of delaying their first answer.
+    """
+    global _STARTED
+    if os.getenv("WARMUP", "true").lower() != "true":
+        return
+    with _LOCK:
+        if _STARTED:
+            return
+        _STARTED = True
+    threading.Thread(target=warm_up, name="warmup", daemon=True).start()
+
+
+def get_warmup_status():
+    """
+        Return {step: {"status", "ms"}} for the warm-up steps that have finished
+    """
+    with _LOCK:
+        return {name: dict(status) for name, status in _STATUS.items()}